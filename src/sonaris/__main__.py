@@ -43,10 +43,13 @@ def cli():
     pass
 
 
-def run_application(hardware_mock,grafana):
+def run_application(hardware_mock,grafana,shadow_state=False,precise_timing=False,shared_state=False):
     """Function to initialize and run the Sonaris application."""
     args_dict = {"hardware_mock": hardware_mock,
-                 "grafana": grafana}
+                 "grafana": grafana,
+                 "shadow_state": shadow_state,
+                 "precise_timing": precise_timing,
+                 "shared_state": shared_state}
     logger.info(args_dict)
     app, window = create_app(args_dict)
     window.show()
@@ -57,13 +60,16 @@ def run_application(hardware_mock,grafana):
 @cli.command()
 @click.option("--hardware-mock", "-hm", is_flag=True, help="Run the app in hardware mock mode.")
 @click.option("--grafana", is_flag=True, help="Start Grafana container alongside the application. Requires Docker.")
-def run(hardware_mock, grafana):
+@click.option("--shadow-state", is_flag=True, help="Cache DG4202 settings and only send changed values.")
+@click.option("--precise-timing", is_flag=True, help="Schedule jobs on a monotonic high-precision timer.")
+@click.option("--shared-state", is_flag=True, help="Persist state on every change for use by several processes.")
+def run(hardware_mock, grafana, shadow_state, precise_timing, shared_state):
     """Run the Sonaris application."""
     signal.signal(signal.SIGINT, signal_handler)
     try:
         ensure_env_variables()
         logger.info("Running application...")
-        run_application(hardware_mock, grafana)
+        run_application(hardware_mock, grafana, shadow_state, precise_timing, shared_state)
     except KeyboardInterrupt:
         logger.info("Exit signal detected.")
 
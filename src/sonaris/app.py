@@ -21,10 +21,15 @@ from sonaris.defaults import (
     GF_PROVISIONING_DIR,
     MONITOR_FILE,
     OSCILLOSCOPE_BUFFER_SIZE,
+    TIMEKEEPER_ARCHIVE_FILE,
+    TIMEKEEPER_DB_FILE,
     TIMEKEEPER_JOBS_FILE,
     VERSION_STRING,
     DeviceName,
 )
+from sonaris.device.device import DeviceDiscovery
+from sonaris.device.dg4202 import DG4202
+from sonaris.device.edux1002a import EDUX1002A
 from sonaris.frontend.managers.dg4202 import DG4202Manager
 from sonaris.frontend.managers.edux1002a import EDUX1002AManager
 from sonaris.frontend.managers.state_manager import StateManager
@@ -36,6 +41,7 @@ from sonaris.frontend.widgets.menu import MainMenuBar
 from sonaris.frontend.widgets.sidebar import Sidebar
 from sonaris.frontend.widgets.templates import ModularMainWindow
 from sonaris.scheduler import registry
+from sonaris.scheduler.store import SQLiteJobStore
 from sonaris.scheduler.timekeeper import Timekeeper
 from sonaris.scheduler.worker import Worker
 from sonaris.services.datasource import DataSourceService
@@ -51,7 +57,7 @@ QLocale.setDefault(QLocale(QLocale.Language.English, QLocale.Country.UnitedState
 
 logger.info(f"{APP_NAME} {VERSION_STRING}")
 logger.info(f"Using {DEFAULT_DATADIR} as working directory.")
-logger.info(f"Using {TIMEKEEPER_JOBS_FILE} as persistence file.")
+logger.info(f"Using {TIMEKEEPER_DB_FILE} as persistence file.")
 logger.info(f"Using {OSCILLOSCOPE_BUFFER_SIZE} oscilloscope buffer size.")
 logger.info(f"Device events under {MONITOR_FILE}.")
 
@@ -69,35 +75,53 @@ def shutdown():
     if factory.datasource_service:
         factory.datasource_service.stop()
     factory.worker.stop_worker()
+    if factory.state_manager:
+        factory.state_manager.close()
 
 def init_objects(args_dict: dict):
     # ================= Hardware Managers===================#
     factory.resource_manager = pyvisa.ResourceManager()
-    factory.state_manager = StateManager()
+    factory.device_discovery = DeviceDiscovery(factory.resource_manager)
+    factory.state_manager = StateManager(shared=args_dict.get("shared_state", False))
+    devices = {}
+    if not args_dict.get("hardware_mock", False):
+        # One scan resolves every instrument, the managers only detect on reconnect
+        devices = factory.device_discovery.detect_all([EDUX1002A, DG4202])
     factory.edux1002a_manager = EDUX1002AManager(
         state_manager=factory.state_manager,
         args_dict=args_dict,
         resource_manager=factory.resource_manager,
         buffer_size=OSCILLOSCOPE_BUFFER_SIZE,
+        discovery=factory.device_discovery,
+        device=devices.get(EDUX1002A),
     )
     factory.dg4202_manager = DG4202Manager(
         factory.state_manager,
         args_dict=args_dict,
         resource_manager=factory.resource_manager,
+        discovery=factory.device_discovery,
+        device=devices.get(DG4202),
     )
     factory.worker = Worker(
         function_map=registry.function_map,
         logger=logger,
+        precise=args_dict.get("precise_timing", False),
     )
     factory.timekeeper = Timekeeper(
         persistence_file=TIMEKEEPER_JOBS_FILE,
         worker_instance=factory.worker,
         logger=logger,
+        archive=TIMEKEEPER_ARCHIVE_FILE,
+        store=SQLiteJobStore(
+            TIMEKEEPER_DB_FILE,
+            legacy_jobs=TIMEKEEPER_JOBS_FILE,
+            legacy_archive=TIMEKEEPER_ARCHIVE_FILE,
+        ),
     )
 
     # ================= Register Tasks ===================#
-    for task_name, func_pointer in get_tasks(flatten=True).items():
-        factory.worker.register_task(func_pointer, task_name)
+    # Grouped by device so jobs on one instrument are serialized
+    factory.worker.register_tasks(get_tasks())
     # ==================== Services ======================#
     if args_dict["grafana"]:
         factory.grafana_service = GrafanaService(
@@ -108,6 +132,7 @@ def init_objects(args_dict: dict):
             port=None,  # Use default port
             logger=logger,
             name=f"{APP_NAME}DataSource",  # Customize as needed
+            oscilloscope=factory.edux1002a_manager,
         )
         factory.datasource_service.write_provisioning_files(
             provisioning_dir=GF_PROVISIONING_DIR,
@@ -7,6 +7,21 @@ VERSION_STRING = "v0.1.5"
 
 GRAPH_RGB = (255, 255, 255)
 OSCILLOSCOPE_BUFFER_SIZE = 512
+ACQUISITION_QUEUE_SIZE = 2  # frames held between the acquisition thread and the plot
+STREAM_QUEUE_SIZE = 4  # frames held per remote waveform subscriber
+STREAM_KEEPALIVE = 15.0  # in s, idle time before an SSE keepalive comment
+HEALTH_POLL_PERIOD = 1.0  # in s, between health polls of a connected device
+HEALTH_MAX_BACKOFF = 30.0  # in s, longest delay between polls of a missing device
+STATE_FLUSH_INTERVAL = 2.0  # in s, longest delay before state changes are written
+MONITOR_PAGE_SIZE = 200  # monitor events loaded per page
+MONITOR_EVENTS_IN_VIEW = 1000  # newest monitor events kept in the list
+SHADOW_STATE_TTL = 5.0  # in s, validity of DG4202 shadowed settings
+SPIN_THRESHOLD = 0.002  # in s, busy-wait window before a timed task fires
+RECURRING_HISTORY = 10  # results kept per recurring job
+ARCHIVE_PAGE_SIZE = 200  # finished jobs listed per page in the scheduler
+METRICS_HISTORY = 1000  # samples kept per metric for the JSON time series
+# in s, upper bounds of the latency histogram buckets
+METRICS_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
 
 
 class ErrorLevel(Enum):
@@ -38,6 +53,9 @@ TIMEKEEPER_JOBS_FILE = (
     and Path(DEFAULT_DATADIR / "jobs.json")
     or (DEFAULT_DATADIR / "jobs.json")
 )
+TIMEKEEPER_ARCHIVE_FILE = DEFAULT_DATADIR / "archive.json"
+# Jobs and archive live here, the JSON files above are only read once for migration
+TIMEKEEPER_DB_FILE = DEFAULT_DATADIR / "jobs.db"
 MONITOR_FILE = (
     Path(DEFAULT_DATADIR / "monitor.json").exists()
     and Path(DEFAULT_DATADIR / "monitor.json")
@@ -67,7 +85,7 @@ DELAY_KEYWORD = "delay"
 # GRAFANA DEFAULTS
 DEFAULT_TAB_STYLE = {"height": "30px", "padding": "2px"}
 GF_SECURITY_ADMIN_PASSWORD = os.getenv("GF_SECURITY_ADMIN_PASSWORD", "admin")
-GF_SECURITY_ADMIN_USER = os.getenv("GF_SECURITY_ADMIN_USER","admin")
+GF_SECURITY_ADMIN_USER = os.getenv("GF_SECURITY_ADMIN_USER", "admin")
 GF_PORT = int(os.getenv("GF_PORT", "3000"))
 # sonaris.defaults.py
 GF_INSTALL_PLUGINS = "grafana-simple-json-datasource,yesoreyeram-infinity-datasource"
@@ -75,6 +93,7 @@ GF_INSTALL_PLUGINS = "grafana-simple-json-datasource,yesoreyeram-infinity-dataso
 
 DATA_SOURCE_PORT = int(os.getenv("DATA_SOURCE_PORT", "5000"))
 DATA_SOURCE_NAME = str(os.getenv("DATA_SOURCE_NAME", f"{APP_NAME}DataSource"))
+DATA_SOURCE_CACHE_SIZE = 64  # responses cached by the data source, least recent dropped
 
 GF_PROVISIONING_DIR = DEFAULT_DATADIR / "provisioning"
 
@@ -1,5 +1,4 @@
 import abc
-from collections import deque
 
 import numpy as np
 
@@ -15,17 +14,90 @@ class DataSource(abc.ABC):
 
 
 class DataBuffer:
-    def __init__(self, data_source: DataSource, buffer_size: int = 128):
-        self.buffer = deque(maxlen=buffer_size)
+    """
+    Fixed-capacity ring buffer of frames backed by a preallocated 2-D array.
+
+    Appending a frame is O(1) and never reallocates, the latest frame is available as a
+    zero-copy view and the chronological history is only linearised when requested.
+    """
+
+    def __init__(
+        self,
+        data_source: DataSource,
+        buffer_size: int = 128,
+        dtype: np.dtype = np.float32,
+    ):
         self.data_source = data_source
         self.buffer_size = buffer_size
+        self.dtype = np.dtype(dtype)
+        # Allocated on the first frame, once the frame length is known
+        self.buffer: np.ndarray = None
+        self.linear: np.ndarray = None
+        self.head = 0  # Row the next frame is written to
+        self.count = 0
+        self.linear_valid = False
+
+    def __len__(self) -> int:
+        return self.count
+
+    def allocate(self, frame_length: int) -> None:
+        self.buffer = np.empty((self.buffer_size, frame_length), dtype=self.dtype)
+        self.linear = np.empty(self.buffer_size * frame_length, dtype=self.dtype)
+        self.head = 0
+        self.count = 0
+        self.linear_valid = False
+
+    def clear(self) -> None:
+        self.head = 0
+        self.count = 0
+        self.linear_valid = False
 
     def update(self):
         try:
             new_data = self.data_source.query_data()
-            self.buffer.append(new_data)
+            self.append(new_data)
         except Exception as e:
             raise RuntimeError(f"Error querying data source: {e}")
 
-    def get_data(self):
-        return np.concatenate(list(self.buffer))
+    def append(self, new_data):
+        """Adds a frame acquired outside of the data source, e.g. by a multi-channel capture."""
+        frame = np.asarray(new_data).ravel()
+        if self.buffer is None or frame.shape[0] != self.buffer.shape[1]:
+            # First frame or the record length changed, older frames are incompatible
+            self.allocate(frame.shape[0])
+        self.buffer[self.head] = frame
+        self.head = (self.head + 1) % self.buffer_size
+        self.count = min(self.count + 1, self.buffer_size)
+        self.linear_valid = False
+
+    def latest(self) -> np.ndarray:
+        """Returns a view of the most recent frame, None if the buffer is empty."""
+        if self.count == 0:
+            return None
+        return self.buffer[(self.head - 1) % self.buffer_size]
+
+    def frames(self) -> np.ndarray:
+        """Returns the buffered frames oldest first as a (count, frame_length) array."""
+        if self.count == 0:
+            return np.empty((0, 0), dtype=self.dtype)
+        if self.count < self.buffer_size:
+            return self.buffer[: self.count]
+        return np.concatenate((self.buffer[self.head :], self.buffer[: self.head]))
+
+    def get_data(self) -> np.ndarray:
+        """
+        Returns the buffered history oldest first as one flat array. The result is a view
+        of a preallocated array that is reused until the next append.
+        """
+        if self.count == 0:
+            return np.empty(0, dtype=self.dtype)
+        size = self.count * self.buffer.shape[1]
+        if not self.linear_valid:
+            if self.count < self.buffer_size:
+                self.linear[:size] = self.buffer[: self.count].ravel()
+            else:
+                split = (self.buffer_size - self.head) * self.buffer.shape[1]
+                self.linear[:split] = self.buffer[self.head :].ravel()
+                self.linear[split:size] = self.buffer[: self.head].ravel()
+            self.linear_valid = True
+        return self.linear[:size]
@@ -1,9 +1,15 @@
 import re
-from typing import Optional, Type
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Type
 
 import pyvisa
 
 from sonaris.device.interface import EthernetInterface, Interface, USBInterface
+from sonaris.utils.log import get_logger
+
+logger = get_logger()
 
 
 class Device:
@@ -41,42 +47,199 @@ class MockDevice(Device):
             return object.__getattribute__(self, name)
 
 
+class DeviceDiscovery:
+    """
+    Shared instrument discovery service. Probes all TCP/IP and USB resources concurrently
+    with a short per-probe timeout and caches the IDN response of each resource for `ttl`
+    seconds, so several device managers can resolve their instruments from one scan.
+    Probed resources are closed right after the *IDN? query, only a resource claimed by
+    `detect` is opened again and kept open until `release`.
+    """
+
+    RESOURCE_PATTERN = re.compile("^(TCPIP|USB)")
+
+    def __init__(
+        self,
+        resource_manager: pyvisa.ResourceManager,
+        probe_timeout: int = 1000,
+        ttl: float = 30.0,
+        max_workers: int = 8,
+        negative_ttl: float = 2.0,
+    ):
+        """
+        Args:
+            resource_manager (pyvisa.ResourceManager): The VISA resource manager.
+            probe_timeout (int): Open and *IDN? timeout per resource in ms.
+            ttl (float): Seconds an IDN response stays valid before the resource is probed again.
+            max_workers (int): Maximum number of concurrent probes.
+            negative_ttl (float): Seconds a resource that did not respond is skipped, kept
+                short so an instrument powered on after a failed probe is found quickly.
+        """
+        self.rm = resource_manager
+        self.probe_timeout = probe_timeout
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_workers = max_workers
+        self.last_scan_duration = 0.0
+        # resource name -> {"timestamp", "idn", "resource", "claimed"}
+        self.cache: Dict[str, dict] = {}
+        self.lock = threading.RLock()
+
+    def probe(self, resource_name: str) -> Optional[str]:
+        """
+        Opens a resource, queries its identity using the probe timeout and closes it again.
+
+        Returns:
+            The IDN string, or None if the resource did not respond.
+        """
+        resource = None
+        try:
+            resource = self.rm.open_resource(
+                resource_name, open_timeout=self.probe_timeout
+            )
+            resource.timeout = self.probe_timeout
+            return resource.query("*IDN?")
+        except Exception as e:
+            logger.debug(f"Probe of {resource_name} failed: {e}")
+            return None
+        finally:
+            if resource is not None:
+                try:
+                    resource.close()
+                except Exception:
+                    pass
+
+    def is_stale(self, entry: dict, now: float, refresh: bool) -> bool:
+        if entry["claimed"]:
+            return False
+        ttl = self.ttl if entry["idn"] is not None else self.negative_ttl
+        return refresh or now - entry["timestamp"] > ttl
+
+    def scan(self, refresh: bool = False) -> Dict[str, str]:
+        """
+        Lists the available resources and probes every unclaimed resource whose cache entry
+        is missing or older than the TTL.
+
+        Args:
+            refresh (bool): Probe all unclaimed resources regardless of the TTL.
+
+        Returns:
+            Dict[str, str]: Mapping of resource name to IDN string for responding resources.
+        """
+        with self.lock:
+            start = time.perf_counter()
+            now = time.monotonic()
+            resources = [
+                name
+                for name in self.rm.list_resources()
+                if self.RESOURCE_PATTERN.match(name)
+            ]
+            stale = [
+                name
+                for name in resources
+                if name not in self.cache
+                or self.is_stale(self.cache[name], now, refresh)
+            ]
+            if stale:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.max_workers, len(stale))
+                ) as pool:
+                    idns = list(pool.map(self.probe, stale))
+                for name, idn in zip(stale, idns):
+                    self.cache[name] = {
+                        "timestamp": now,
+                        "idn": idn,
+                        "resource": None,
+                        "claimed": False,
+                    }
+            self.last_scan_duration = time.perf_counter() - start
+            logger.debug(
+                f"Probed {len(stale)}/{len(resources)} resources in {self.last_scan_duration:.3f}s."
+            )
+            return {
+                name: self.cache[name]["idn"]
+                for name in resources
+                if self.cache[name]["idn"] is not None
+            }
+
+    def detect(
+        self, device_type: Type[Device], refresh: bool = False
+    ) -> Optional[Device]:
+        """
+        Returns a driver for the first unclaimed resource matching the device type.
+        The resource is claimed until `release` is called for it.
+        """
+        return self.detect_all([device_type], refresh=refresh)[device_type]
+
+    def detect_all(
+        self, device_types: List[Type[Device]], refresh: bool = False
+    ) -> Dict[Type[Device], Optional[Device]]:
+        """
+        Resolves several device types from a single scan.
+
+        Returns:
+            Dict[Type[Device], Optional[Device]]: A driver per device type, None if not found.
+        """
+        with self.lock:
+            self.scan(refresh=refresh)
+            devices = {}
+            for device_type in device_types:
+                devices[device_type] = None
+                for name, entry in self.cache.items():
+                    if (
+                        not entry["claimed"]
+                        and entry["idn"] is not None
+                        and device_type.IDN_STRING in entry["idn"]
+                    ):
+                        try:
+                            resource = self.rm.open_resource(name)
+                        except Exception as e:
+                            logger.debug(f"Opening {name} failed: {e}")
+                            entry.update(idn=None, timestamp=time.monotonic())
+                            continue
+                        entry.update(claimed=True, resource=resource)
+                        devices[device_type] = device_type(
+                            self.create_interface(name, resource)
+                        )
+                        break
+            return devices
+
+    @staticmethod
+    def create_interface(resource_name: str, resource: pyvisa.Resource) -> Interface:
+        if resource_name.startswith("TCPIP"):
+            return EthernetInterface(resource)
+        return USBInterface(resource)
+
+    def release(self, resource: pyvisa.Resource) -> None:
+        """Closes a claimed resource and drops it from the cache so it is probed again."""
+        with self.lock:
+            for name, entry in list(self.cache.items()):
+                if entry["resource"] is resource:
+                    del self.cache[name]
+        try:
+            resource.close()
+        except Exception as e:
+            logger.debug(f"Error closing resource: {e}")
+
+
 class DeviceDetector:
     def __init__(
         self,
         resource_manager: pyvisa.ResourceManager,
         device_type: Type[Device],
+        discovery: Optional[DeviceDiscovery] = None,
     ):
         self.rm = resource_manager
         self.device_type = device_type
+        self.discovery = discovery or DeviceDiscovery(resource_manager)
 
     def detect_device(self) -> Optional[Device]:
         """
         Method that attempts to detect a device connected via TCP/IP or USB.
-        Loops through all available resources, attempting to open each one and query its identity.
-        If the device is found, it creates and returns a DG4202 instance.
+        All available resources are probed concurrently through the discovery service.
+        If the device is found, it creates and returns an instance of the device type.
 
         Returns:
             A device object with the interface attached to it.
         """
-        resources = self.rm.list_resources()
-
-        for resource in resources:
-            if re.match("^TCPIP", resource):
-                try:
-                    device = self.rm.open_resource(resource)
-                    idn = device.query("*IDN?")
-                    if self.device_type.IDN_STRING in idn:
-                        return self.device_type(EthernetInterface(device))
-                except pyvisa.errors.VisaIOError:
-                    pass
-            elif re.match("^USB", resource):
-                try:
-                    device = self.rm.open_resource(resource)
-                    idn = device.query("*IDN?")
-                    if self.device_type.IDN_STRING in idn:
-                        return self.device_type(USBInterface(device))
-                except pyvisa.errors.VisaIOError:
-                    pass
-
-        return None
+        return self.discovery.detect(self.device_type)
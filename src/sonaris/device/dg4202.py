@@ -1,4 +1,7 @@
-from typing import List
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List
 from unittest.mock import MagicMock
 
 from sonaris.device.data import DataSource
@@ -30,8 +33,159 @@ class DG4202(Device):
         """
         return ["off", "sweep", "burst", "mod"]
 
-    def __init__(self, interface: Interface):
+    def __init__(
+        self, interface: Interface, shadow: bool = False, shadow_ttl: float = None
+    ):
+        """
+        Args:
+            interface (Interface): The interface used to communicate with the device.
+            shadow (bool): Keep a shadow copy of the device settings, see `enable_shadow`.
+            shadow_ttl (float, optional): Seconds a shadowed value stays valid. None never expires.
+        """
         super().__init__(interface)
+        self.shadow_enabled = shadow
+        self.shadow_ttl = shadow_ttl
+        # SCPI header -> (last known value, time it was written or read)
+        self.shadow = {}
+        # Settings written inside `batch`, recorded once the batch was sent
+        self._local = threading.local()
+
+    def enable_shadow(self, ttl: float = None) -> None:
+        """
+        Enables the shadow register model. Setters only send settings whose value differs
+        from the last known one, getters are served from the shadow copy until the value
+        is written, its TTL expires or `sync` is called.
+
+        Args:
+            ttl (float, optional): Seconds a shadowed value stays valid. None never expires.
+        """
+        self.shadow_enabled = True
+        self.shadow_ttl = ttl
+        self.shadow.clear()
+
+    def disable_shadow(self) -> None:
+        """Disables the shadow register model, every call goes to the device again."""
+        self.shadow_enabled = False
+        self.shadow.clear()
+
+    def sync(self, channel: int = None) -> None:
+        """
+        Discards the shadow copy and reloads it from the device.
+
+        Args:
+            channel (int, optional): Only resynchronise this channel. Defaults to both.
+        """
+        channels = [channel] if channel else [1, 2]
+        for header in list(self.shadow):
+            if self.channel_of(header) in channels:
+                del self.shadow[header]
+        if self.shadow_enabled:
+            for ch in channels:
+                self.get_waveform_parameters(ch)
+                self.get_mode(ch)
+                self.get_output_status(ch)
+
+    @staticmethod
+    def channel_of(header: str) -> int:
+        """Returns the channel number a SCPI header addresses, e.g. 'SOURce2:FUNCtion' -> 2."""
+        root = header.lstrip(":").split(":")[0]
+        digits = "".join(char for char in root if char.isdigit())
+        return int(digits) if digits else 0
+
+    @staticmethod
+    def normalize(value) -> str:
+        value = str(value).strip()
+        return {"ON": "1", "OFF": "0"}.get(value.upper(), value)
+
+    @staticmethod
+    def same_value(a: str, b: str) -> bool:
+        try:
+            return float(a) == float(b)
+        except ValueError:
+            return a.upper() == b.upper()
+
+    def shadowed(self, header: str):
+        """Returns the shadowed value of a header, or None if unknown or expired."""
+        entry = self.shadow.get(header)
+        if entry is None:
+            return None
+        value, timestamp = entry
+        age = time.monotonic() - timestamp
+        if self.shadow_ttl is not None and age > self.shadow_ttl:
+            del self.shadow[header]
+            return None
+        return value
+
+    @contextmanager
+    def batch(self) -> Iterator["DG4202"]:
+        """
+        Batches the writes like `Interface.batch`. Settings written inside the batch enter
+        the shadow copy only after the batch was sent. If sending fails, their shadowed
+        values are dropped, as the device may hold either the old or the new value.
+        """
+        if getattr(self._local, "staged", None) is not None:
+            with self.interface.batch():
+                yield self
+            return
+        staged = self._local.staged = []
+        try:
+            with self.interface.batch():
+                yield self
+        except BaseException:
+            for header, _ in staged:
+                self.shadow.pop(header, None)
+            raise
+        finally:
+            self._local.staged = None
+        now = time.monotonic()
+        for header, value in staged:
+            self.shadow[header] = (value, now)
+
+    def write_setting(self, command: str) -> None:
+        """
+        Writes a 'HEADER VALUE' command. With the shadow model enabled the write is skipped
+        when the device already holds the value.
+        """
+        if not self.shadow_enabled:
+            self.interface.write(command)
+            return
+        header, _, value = command.partition(" ")
+        value = self.normalize(value)
+        current = self.shadowed(header)
+        if current is not None and self.same_value(current, value):
+            return
+        if header.endswith(":STATe") and value == "1":
+            # Enabling one mode may implicitly disable the other modes on the device
+            channel = self.channel_of(header)
+            for key in list(self.shadow):
+                if key.endswith(":STATe") and self.channel_of(key) == channel:
+                    del self.shadow[key]
+        staged = getattr(self._local, "staged", None)
+        if staged is not None:
+            # Unknown until the batch is sent
+            self.shadow.pop(header, None)
+            staged.append((header, value))
+        self.interface.write(command)
+        if staged is None:
+            self.shadow[header] = (value, time.monotonic())
+
+    def query_settings(self, queries: List[str]) -> List[str]:
+        """
+        Queries several settings in one round trip. With the shadow model enabled only the
+        settings without a valid shadowed value are queried.
+        """
+        if not self.shadow_enabled:
+            return self.interface.query_batch(queries)
+        headers = [query.rstrip("?") for query in queries]
+        values = [self.shadowed(header) for header in headers]
+        missing = [i for i, value in enumerate(values) if value is None]
+        if missing:
+            fetched = self.interface.query_batch([queries[i] for i in missing])
+            now = time.monotonic()
+            for i, value in zip(missing, fetched):
+                values[i] = self.normalize(value)
+                self.shadow[headers[i]] = (values[i], now)
+        return values
 
     def set_waveform(
         self,
@@ -64,26 +218,28 @@ class DG4202(Device):
         frequency = min(frequency, self.FREQ_LIMIT)
         amplitude = amplitude or params.get("amplitude")
         offset = offset or params.get("offset")
-        if waveform_type is not None:
-            self.interface.write(f"SOURce{channel}:FUNCtion {waveform_type}")
-        if frequency is not None:
-            self.interface.write(f"SOURce{channel}:FREQuency:FIXed {frequency}")
-        if amplitude is not None:
-            self.interface.write(
-                f"SOURce{channel}:VOLTage:LEVel:IMMediate:AMPLitude {amplitude}"
-            )
-        if offset is not None:
-            self.interface.write(
-                f"SOURce{channel}:VOLTage:LEVel:IMMediate:OFFSet {offset}"
-            )
+        with self.batch():
+            if waveform_type is not None:
+                self.write_setting(f"SOURce{channel}:FUNCtion {waveform_type}")
+            if frequency is not None:
+                self.write_setting(f"SOURce{channel}:FREQuency:FIXed {frequency}")
+            if amplitude is not None:
+                self.write_setting(
+                    f"SOURce{channel}:VOLTage:LEVel:IMMediate:AMPLitude {amplitude}"
+                )
+            if offset is not None:
+                self.write_setting(
+                    f"SOURce{channel}:VOLTage:LEVel:IMMediate:OFFSet {offset}"
+                )
 
     def turn_off_modes(self, channel: int) -> None:
         """
         Turns off all modes (sweep, burst, modulation) on the device.
         """
-        self.interface.write(f"SOURce{channel}:SWEEp:STATe OFF")
-        self.interface.write(f"SOURce{channel}:BURSt:STATe OFF")
-        self.interface.write(f"SOURce{channel}:MOD:STATe OFF")
+        with self.batch():
+            self.write_setting(f"SOURce{channel}:SWEEp:STATe OFF")
+            self.write_setting(f"SOURce{channel}:BURSt:STATe OFF")
+            self.write_setting(f"SOURce{channel}:MOD:STATe OFF")
 
     def check_status(self) -> str:
         """
@@ -102,7 +258,7 @@ class DG4202(Device):
             status (bool): True to turn on the output, False to turn it off.
         """
         command = f"OUTPut{channel} ON" if status else f"OUTPut{channel} OFF"
-        self.interface.write(command)
+        self.write_setting(command)
 
     def set_mode(self, channel: int, mode: str, mod_type: str = None) -> None:
         """
@@ -112,23 +268,24 @@ class DG4202(Device):
             mode (str): The mode to set. Supported values: 'sweep', 'burst', 'mod', 'off'.
             mod_type (str, optional): The modulation type. Required when mode is 'mod'. Defaults to None.
         """
-        if isinstance(self.interface, DG4202MockInterface):
-            self.interface.write(f"SOURce{channel}:BURSt:STATe OFF")
-            self.interface.write(f"SOURce{channel}:MOD:STATe OFF")
-
-        if mode.lower() == "sweep":
-            self.interface.write(f"SOURce{channel}:SWEEp:STATe ON")
-
-        elif mode.lower() == "burst":
-            self.interface.write(f"SOURce{channel}:BURSt:STATe ON")
-        elif mode.lower() == "mod":
-            self.interface.write(f"SOURce{channel}:MOD:STATe ON")
-            if mod_type:
-                self.interface.write(f"SOURce{channel}:MOD:TYPE {mod_type}")
-        elif mode.lower() == "off":
-            self.turn_off_modes(channel)
-        else:
-            print("Unsupported mode. Please use 'sweep', 'burst', or 'mod'")
+        with self.batch():
+            if isinstance(self.interface, DG4202MockInterface):
+                self.write_setting(f"SOURce{channel}:BURSt:STATe OFF")
+                self.write_setting(f"SOURce{channel}:MOD:STATe OFF")
+
+            if mode.lower() == "sweep":
+                self.write_setting(f"SOURce{channel}:SWEEp:STATe ON")
+
+            elif mode.lower() == "burst":
+                self.write_setting(f"SOURce{channel}:BURSt:STATe ON")
+            elif mode.lower() == "mod":
+                self.write_setting(f"SOURce{channel}:MOD:STATe ON")
+                if mod_type:
+                    self.write_setting(f"SOURce{channel}:MOD:TYPE {mod_type}")
+            elif mode.lower() == "off":
+                self.turn_off_modes(channel)
+            else:
+                print("Unsupported mode. Please use 'sweep', 'burst', or 'mod'")
 
     def set_modulation_mode(self, channel: int, mod_type: str, mod_params: dict):
         """
@@ -140,16 +297,18 @@ class DG4202(Device):
             mod_params (dict): Dictionary of parameters for modulation mode.
                 Expected keys are 'SOUR', 'DEPT', 'DEV', 'RATE' etc.
         """
-        self.interface.write(f"SOURce{channel}:MOD:STATe ON")
-        self.interface.write(f"SOURce{channel}:MOD:TYPE {mod_type}")
-        for param in ["SOUR", "DEPT", "DEV", "RATE"]:  # Add more parameters as needed
-            if param not in mod_params:
-                mod_params[param] = self.interface.read(
-                    f"SOURce{channel}:MOD:{mod_type}:{param}?"
+        with self.batch():
+            self.write_setting(f"SOURce{channel}:MOD:STATe ON")
+            self.write_setting(f"SOURce{channel}:MOD:TYPE {mod_type}")
+            # Add more parameters as needed
+            for param in ["SOUR", "DEPT", "DEV", "RATE"]:
+                if param not in mod_params:
+                    mod_params[param] = self.query_settings(
+                        [f"SOURce{channel}:MOD:{mod_type}:{param}?"]
+                    )[0]
+                self.write_setting(
+                    f"SOURce{channel}:MOD:{mod_type}:{param} {mod_params[param]}"
                 )
-            self.interface.write(
-                f"SOURce{channel}:MOD:{mod_type}:{param} {mod_params[param]}"
-            )
 
     def set_burst_mode(self, channel: int, burst_params: dict):
         """
@@ -160,13 +319,17 @@ class DG4202(Device):
             burst_params (dict): Dictionary of parameters for burst mode.
                 Expected keys are 'NCYC', 'MODE', 'TRIG', 'PHAS' etc.
         """
-        self.interface.write(f"SOURce{channel}:BURSt:STATe ON")
-        for param in ["NCYC", "MODE", "TRIG", "PHAS"]:  # Add more parameters as needed
-            if param not in burst_params:
-                burst_params[param] = self.interface.read(
-                    f"SOURce{channel}:BURSt:{param}?"
+        with self.batch():
+            self.write_setting(f"SOURce{channel}:BURSt:STATe ON")
+            # Add more parameters as needed
+            for param in ["NCYC", "MODE", "TRIG", "PHAS"]:
+                if param not in burst_params:
+                    burst_params[param] = self.query_settings(
+                        [f"SOURce{channel}:BURSt:{param}?"]
+                    )[0]
+                self.write_setting(
+                    f"SOURce{channel}:BURSt:{param} {burst_params[param]}"
                 )
-            self.interface.write(f"SOURce{channel}:BURSt:{param} {burst_params[param]}")
 
     def set_sweep_mode(self, channel: int, sweep_params: dict):
         """
@@ -177,17 +340,20 @@ class DG4202(Device):
             sweep_params (dict): Dictionary of parameters for sweep mode.
                 Expected keys are 'START', 'STOP', 'SWEEP'.
         """
-        self.interface.write(f"SOURce{channel}:SWEEp:STATe ON")
-        for param in [
-            "START",
-            "STOP",
-            "SWEEP",
-        ]:  # Add 'RETURN' if there's a corresponding command
-            if param not in sweep_params:
-                sweep_params[param] = self.interface.read(
-                    f"SOURce{channel}:SWEEp:{param}?"
+        with self.batch():
+            self.write_setting(f"SOURce{channel}:SWEEp:STATe ON")
+            for param in [
+                "START",
+                "STOP",
+                "SWEEP",
+            ]:  # Add 'RETURN' if there's a corresponding command
+                if param not in sweep_params:
+                    sweep_params[param] = self.query_settings(
+                        [f"SOURce{channel}:SWEEp:{param}?"]
+                    )[0]
+                self.write_setting(
+                    f"SOURce{channel}:SWEEp:{param} {sweep_params[param]}"
                 )
-            self.interface.write(f"SOURce{channel}:SWEEp:{param} {sweep_params[param]}")
 
     def get_mode(self, channel: int):
         """
@@ -199,11 +365,15 @@ class DG4202(Device):
         Returns:
             dict: A dictionary containing the current mode and its parameters.
         """
-        sweep_state = self.interface.read(f"SOURce{channel}:SWEEp:STATe?")
-        burst_state = self.interface.read(f"SOURce{channel}:BURSt:STATe?")
-        mod_state = self.interface.read(f"SOURce{channel}:MOD:STATe?")
+        sweep_state, burst_state, mod_state = self.query_settings(
+            [
+                f"SOURce{channel}:SWEEp:STATe?",
+                f"SOURce{channel}:BURSt:STATe?",
+                f"SOURce{channel}:MOD:STATe?",
+            ]
+        )
         mod_type = (
-            self.interface.read(f"SOURce{channel}:MOD:TYPE?")
+            self.query_settings([f"SOURce{channel}:MOD:TYPE?"])[0]
             if mod_state == "1"
             else None
         )
@@ -233,25 +403,18 @@ class DG4202(Device):
         Returns:
             dict: A dictionary containing the sweep parameters.
         """
-        sweep_params = {}
-        sweep_params["FSTART"] = float(
-            self.interface.read(f"SOURce{channel}:FREQuency:STaRt?")
-        )
-        sweep_params["FSTOP"] = float(
-            self.interface.read(f"SOURce{channel}:FREQuency:STOP?")
-        )
-        sweep_params["TIME"] = float(
-            self.interface.read(f"SOURce{channel}:SWEEp:TIME?")
-        )
-        sweep_params["RTIME"] = float(
-            self.interface.read(f"SOURce{channel}:SWEEp:RTIMe?")
-        )
-        sweep_params["HTIME_START"] = float(
-            self.interface.read(f"SOURce{channel}:SWEEp:HTIMe:STaRt?")
-        )
-        sweep_params["HTIME_STOP"] = float(
-            self.interface.read(f"SOURce{channel}:SWEEp:HTIMe:STOP?")
+        keys = ["FSTART", "FSTOP", "TIME", "RTIME", "HTIME_START", "HTIME_STOP"]
+        values = self.query_settings(
+            [
+                f"SOURce{channel}:FREQuency:STaRt?",
+                f"SOURce{channel}:FREQuency:STOP?",
+                f"SOURce{channel}:SWEEp:TIME?",
+                f"SOURce{channel}:SWEEp:RTIMe?",
+                f"SOURce{channel}:SWEEp:HTIMe:STaRt?",
+                f"SOURce{channel}:SWEEp:HTIMe:STOP?",
+            ]
         )
+        sweep_params = {key: float(value) for key, value in zip(keys, values)}
         # Add here the command for 'RETURN' when it is known
         # sweep_params['RETURN'] = self.interface.read(f"SOURce{channel}:???")
 
@@ -265,27 +428,30 @@ class DG4202(Device):
             channel (int): The output channel to set.
             sweep_params (dict): Dictionary of parameters for sweep mode.
         """
-        self.set_mode(channel, "sweep")
-        if sweep_params.get("FSTART") is not None:
-            self.interface.write(
-                f"SOURce{channel}:FREQuency:STaRt {sweep_params['FSTART']}"
-            )
-        if sweep_params.get("FSTOP") is not None:
-            self.interface.write(
-                f"SOURce{channel}:FREQuency:STOP {sweep_params['FSTOP']}"
-            )
-        if sweep_params.get("TIME") is not None:
-            self.interface.write(f"SOURce{channel}:SWEEp:TIME {sweep_params['TIME']}")
-        if sweep_params.get("RTIME") is not None:
-            self.interface.write(f"SOURce{channel}:SWEEp:RTIMe {sweep_params['RTIME']}")
-        if sweep_params.get("HTIME_START") is not None:
-            self.interface.write(
-                f"SOURce{channel}:SWEEp:HTIMe:STaRt {sweep_params['HTIME_START']}"
-            )
-        if sweep_params.get("HTIME_STOP") is not None:
-            self.interface.write(
-                f"SOURce{channel}:SWEEp:HTIMe:STOP {sweep_params['HTIME_STOP']}"
-            )
+        with self.batch():
+            self.set_mode(channel, "sweep")
+            if sweep_params.get("FSTART") is not None:
+                self.write_setting(
+                    f"SOURce{channel}:FREQuency:STaRt {sweep_params['FSTART']}"
+                )
+            if sweep_params.get("FSTOP") is not None:
+                self.write_setting(
+                    f"SOURce{channel}:FREQuency:STOP {sweep_params['FSTOP']}"
+                )
+            if sweep_params.get("TIME") is not None:
+                self.write_setting(f"SOURce{channel}:SWEEp:TIME {sweep_params['TIME']}")
+            if sweep_params.get("RTIME") is not None:
+                self.write_setting(
+                    f"SOURce{channel}:SWEEp:RTIMe {sweep_params['RTIME']}"
+                )
+            if sweep_params.get("HTIME_START") is not None:
+                self.write_setting(
+                    f"SOURce{channel}:SWEEp:HTIMe:STaRt {sweep_params['HTIME_START']}"
+                )
+            if sweep_params.get("HTIME_STOP") is not None:
+                self.write_setting(
+                    f"SOURce{channel}:SWEEp:HTIMe:STOP {sweep_params['HTIME_STOP']}"
+                )
 
     def get_status(self, channel: int) -> str:
         status = []
@@ -301,7 +467,7 @@ class DG4202(Device):
     def get_output_status(self, channel: int) -> str:
         return (
             "ON"
-            if self.interface.read(f"OUTPut{channel}?").strip() in ["1", "ON"]
+            if self.query_settings([f"OUTPut{channel}?"])[0].strip() in ["1", "ON"]
             else "OFF"
         )
 
@@ -318,12 +484,14 @@ class DG4202(Device):
             'amplitude': amplitude,
             'offset': offset,
         """
-        waveform_type = self.interface.read(f"SOURce{channel}:FUNCtion?")
-        frequency = self.interface.read(f"SOURce{channel}:FREQuency:FIXed?")
-        amplitude = self.interface.read(
-            f"SOURce{channel}:VOLTage:LEVel:IMMediate:AMPLitude?"
+        waveform_type, frequency, amplitude, offset = self.query_settings(
+            [
+                f"SOURce{channel}:FUNCtion?",
+                f"SOURce{channel}:FREQuency:FIXed?",
+                f"SOURce{channel}:VOLTage:LEVel:IMMediate:AMPLitude?",
+                f"SOURce{channel}:VOLTage:LEVel:IMMediate:OFFSet?",
+            ]
         )
-        offset = self.interface.read(f"SOURce{channel}:VOLTage:LEVel:IMMediate:OFFSet?")
 
         return {
             "waveform_type": str(waveform_type),
@@ -463,6 +631,9 @@ class DG4202MockInterface(Interface):
             command = command[:-1]
         return self.state.get(command, "").split(" ")[-1]
 
+    def query_batch(self, commands: List[str]) -> List[str]:
+        return [self.read(command) for command in commands]
+
 
 class DG4202DataSource(DataSource):
     def __init__(self, source: DG4202):
@@ -12,18 +12,44 @@ class EDUX1002A(Device):
 
     """Keysight EDUX1002A hardware driver/wrapper."""
 
+    # :WAVeform:FORMat as reported in the preamble
+    FORMAT_BYTE = 0
+    FORMAT_WORD = 1
+    FORMAT_ASCII = 4
+
     def __init__(self, interface: Interface, timeout=20000):
         super().__init__(interface)
         self.interface.inst.timeout = timeout
+        # Instrument defaults (:WAVeform:UNSigned ON, :WAVeform:BYTeorder MSBFirst)
+        self.unsigned = True
+        self.big_endian = True
+        # Preamble per channel, valid until a setting changing the scaling is written
+        self.preambles = {}
+        self.waveform_source = None
+
+    def invalidate_preamble(self, channel: int = None):
+        """
+        Drop cached preambles so the next capture queries them again.
+
+        Parameters:
+        - channel (int, optional): Only drop the preamble of this channel. Defaults to all.
+        """
+        if channel is None:
+            self.preambles.clear()
+        else:
+            self.preambles.pop(channel, None)
 
     def initialize(self):
         """Reset and clear the oscilloscope to default settings."""
         self.interface.write("*RST")
         self.interface.write("*CLS")
+        self.invalidate_preamble()
+        self.waveform_source = None
 
     def autoscale(self):
         """Use Autoscale for automatic oscilloscope setup."""
         self.interface.write(":AUToscale")
+        self.invalidate_preamble()
 
     def set_acquisition_complete(self, percentage: int):
         """
@@ -45,6 +71,7 @@ class EDUX1002A(Device):
         - channel (int): The channel to set as the waveform source.
         """
         self.interface.write(f":WAVeform:SOURce CHANnel{channel}")
+        self.waveform_source = channel
 
     def set_waveform_format(self, format: str):
         """
@@ -58,6 +85,31 @@ class EDUX1002A(Device):
             raise ValueError(f"Invalid format. Choose one of {valid_formats}.")
 
         self.interface.write(f":WAVeform:FORMat {format}")
+        self.invalidate_preamble()
+
+    def set_waveform_unsigned(self, unsigned: bool = True):
+        """
+        Set whether BYTE and WORD data is transferred as unsigned integers.
+
+        Parameters:
+        - unsigned (bool): True for unsigned, False for signed data.
+        """
+        self.interface.write(f":WAVeform:UNSigned {'ON' if unsigned else 'OFF'}")
+        self.unsigned = unsigned
+        self.invalidate_preamble()
+
+    def set_waveform_byte_order(self, big_endian: bool = True):
+        """
+        Set the byte order of WORD data.
+
+        Parameters:
+        - big_endian (bool): True for MSBFirst, False for LSBFirst.
+        """
+        self.interface.write(
+            f":WAVeform:BYTeorder {'MSBFirst' if big_endian else 'LSBFirst'}"
+        )
+        self.big_endian = big_endian
+        self.invalidate_preamble()
 
     def set_waveform_points(self, points: int):
         """
@@ -67,6 +119,7 @@ class EDUX1002A(Device):
         - points (int): The number of points to retrieve.
         """
         self.interface.write(f":WAVeform:POINts {points}")
+        self.invalidate_preamble()
 
     def get_waveform_data_raw(self):
         """
@@ -82,8 +135,16 @@ class EDUX1002A(Device):
         self.interface.write(f":TRIGger:MODE {mode}")
 
     def digitize(self, channel=0):
-        """Capture data using the :DIGitize command."""
-        if channel == 0:
+        """
+        Capture data using the :DIGitize command.
+
+        Parameters:
+        - channel (int or list): Channel or channels acquired in one trigger, 0 for all.
+        """
+        if isinstance(channel, (list, tuple)):
+            sources = ",".join(f"CHANnel{ch}" for ch in channel)
+            self.interface.write(f":DIGitize {sources}")
+        elif channel == 0:
             self.interface.write(":DIGitize")
         else:
             self.interface.write(f":DIGitize CHANnel{channel}")
@@ -110,6 +171,7 @@ class EDUX1002A(Device):
             raise ValueError("Invalid acquisition mode. Choose 'RTIMe' or 'SEGMented'.")
 
         self.interface.write(f":ACQuire:MODE {mode}")
+        self.invalidate_preamble()
 
     def is_real_time_mode(self):
         """Check if the oscilloscope is in real-time mode."""
@@ -196,51 +258,160 @@ class EDUX1002A(Device):
         print(result_str)
 
     def get_waveform_data(self, channel: int = 1):
-        """Get the waveform data from the oscilloscope."""
-        self.setup_waveform_readout(channel)
-        waveform_data = self.get_waveform_data_raw()
-        preamble = self.get_waveform_preamble()
+        """
+        Get the waveform data from the oscilloscope, querying a fresh preamble.
 
-        # Check for header
-        if waveform_data[0] == "#":
-            num_digits = int(waveform_data[1])
-            num_data_points = int(waveform_data[2 : 2 + num_digits])
+        BYTE and WORD data is read as an IEEE 488.2 binary block and returned as raw
+        sample codes, ASCII data is returned as voltages.
 
-            # Extract the actual data without the header
-            waveform_data = waveform_data[2 + num_digits :]
+        Returns:
+        - tuple: The preamble and the waveform data as a NumPy array.
+        """
+        self.setup_waveform_readout(channel)
+        preamble = self.get_waveform_preamble()
+        self.preambles[channel] = preamble
+        return preamble, self.read_waveform_data(preamble)
 
+    def read_waveform_data(self, preamble):
+        """Read :WAVeform:DATA? in the format given by the preamble."""
         format_type = preamble[0]
-        print(self.display_preamble_details(preamble))
-        if format_type == 4:  # ASCII
-            return preamble, np.array([float(val) for val in waveform_data.split(",")])
-        elif format_type == 0:  # BYTE
-            return preamble, np.frombuffer(
-                waveform_data.encode("latin-1"), dtype=np.int8
+        if format_type == self.FORMAT_BYTE:
+            datatype = "B" if self.unsigned else "b"
+            return self.interface.query_binary(
+                ":WAVeform:DATA?", datatype, self.big_endian
             )
-        elif format_type == 1:  # WORD
-            return preamble, np.frombuffer(
-                waveform_data.encode("latin-1"), dtype=np.int16
+        elif format_type == self.FORMAT_WORD:
+            datatype = "H" if self.unsigned else "h"
+            return self.interface.query_binary(
+                ":WAVeform:DATA?", datatype, self.big_endian
             )
+        elif format_type == self.FORMAT_ASCII:
+            waveform_data = self.get_waveform_data_raw()
+            # Check for header
+            if waveform_data[0] == "#":
+                num_digits = int(waveform_data[1])
+                # Extract the actual data without the header
+                waveform_data = waveform_data[2 + num_digits :]
+            return np.array(waveform_data.split(","), dtype=np.float64)
         else:
             raise ValueError("Unknown waveform format.")
 
-    def get_waveform(self, channel: int = 1):
-        """Public method to setup, retrieve, and process waveform data."""
-        self.digitize(channel)
-        preamble, waveform_data = self.get_waveform_data(channel)
+    def scale_waveform(self, preamble, waveform_data):
+        """
+        Convert waveform data to time and voltage arrays using the preamble.
 
+        Returns:
+        - tuple: Time and voltage as NumPy arrays.
+        """
         # Extract information from preamble
         x_increment = preamble[4]
         x_origin = preamble[5]
+        x_reference = preamble[6]
         y_increment = preamble[7]
         y_origin = preamble[8]
+        y_reference = preamble[9]
 
         # Convert data to actual voltage and time values
-        time = np.arange(len(waveform_data)) * x_increment + x_origin
-        voltage = waveform_data * y_increment + y_origin
+        time = (np.arange(len(waveform_data)) - x_reference) * x_increment + x_origin
+        if preamble[0] == self.FORMAT_ASCII:
+            # ASCII data is already transferred in volts
+            voltage = waveform_data
+        else:
+            # Cast first, unsigned sample codes would wrap around when subtracting
+            codes = waveform_data.astype(np.float64)
+            voltage = (codes - y_reference) * y_increment + y_origin
 
         return time, voltage
 
+    def read_waveform(self, channel: int = 1):
+        """
+        Read the last acquisition of a channel. The preamble is only queried when it is
+        not cached, so a repeated read costs a single data query.
+
+        Returns:
+        - tuple: Time and voltage as NumPy arrays.
+        """
+        if self.waveform_source != channel:
+            self.set_waveform_source(channel)
+        preamble = self.preambles.get(channel)
+        if preamble is None:
+            preamble = self.get_waveform_preamble()
+            self.preambles[channel] = preamble
+        return self.scale_waveform(preamble, self.read_waveform_data(preamble))
+
+    def capture(self, channel: int = 1):
+        """
+        Digitize a channel and return its time and voltage arrays.
+
+        Returns:
+        - tuple: Time and voltage as NumPy arrays.
+        """
+        self.digitize(channel)
+        return self.read_waveform(channel)
+
+    def capture_channels(self, channels=(1, 2)):
+        """
+        Digitize several channels in a single acquisition and read all of them.
+
+        Parameters:
+        - channels (tuple): The channels to acquire.
+
+        Returns:
+        - tuple: The shared time array and a (len(channels), N) voltage array.
+        """
+        self.digitize(list(channels))
+        waveforms = [self.read_waveform(channel) for channel in channels]
+        points = min(len(voltage) for _, voltage in waveforms)
+        time = waveforms[0][0][:points]
+        voltages = np.vstack([voltage[:points] for _, voltage in waveforms])
+        return time, voltages
+
+    def get_waveform(self, channel: int = 1):
+        """Public method to setup, retrieve, and process waveform data."""
+        return self.capture(channel)
+
+    def set_timebase_scale(self, scale: float):
+        """
+        Set the horizontal scale.
+
+        Parameters:
+        - scale (float): Time per division in seconds.
+        """
+        self.interface.write(f":TIMebase:SCALe {scale}")
+        self.invalidate_preamble()
+
+    def set_timebase_position(self, position: float):
+        """
+        Set the time from the trigger event to the reference point.
+
+        Parameters:
+        - position (float): Position in seconds.
+        """
+        self.interface.write(f":TIMebase:POSition {position}")
+        self.invalidate_preamble()
+
+    def set_channel_scale(self, channel: int, scale: float):
+        """
+        Set the vertical scale of a channel.
+
+        Parameters:
+        - channel (int): The channel to set.
+        - scale (float): Volts per division.
+        """
+        self.interface.write(f":CHANnel{channel}:SCALe {scale}")
+        self.invalidate_preamble(channel)
+
+    def set_channel_offset(self, channel: int, offset: float):
+        """
+        Set the vertical offset of a channel.
+
+        Parameters:
+        - channel (int): The channel to set.
+        - offset (float): Offset in volts.
+        """
+        self.interface.write(f":CHANnel{channel}:OFFSet {offset}")
+        self.invalidate_preamble(channel)
+
     def set_timeout(self, timeout):
         self.interface.inst.timeout = timeout
 
@@ -257,6 +428,7 @@ class EDUX1002A(Device):
             raise ValueError(f"Invalid acquisition type. Choose one of {valid_types}.")
 
         self.interface.write(f":ACQuire:TYPE {acq_type}")
+        self.invalidate_preamble()
 
     def set_waveform_return_type(self, ret_type="NORMal"):
         """
@@ -271,6 +443,7 @@ class EDUX1002A(Device):
             raise ValueError(f"Invalid acquisition type. Choose one of {valid_types}.")
 
         self.interface.write(f":WAVeform:TYPE {ret_type}")
+        self.invalidate_preamble()
 
     def get_acquisition_type(self):
         """
@@ -294,6 +467,7 @@ class EDUX1002A(Device):
             )
 
         self.interface.write(f":ACQuire:COUNt {count}")
+        self.invalidate_preamble()
 
 
 class EDUX1002ADataSource(DataSource):
@@ -340,6 +514,8 @@ class EDUX1002AMock(MockDevice, EDUX1002A):
             "autoscale",
             "set_waveform_source",
             "set_waveform_format",
+            "set_waveform_unsigned",
+            "set_waveform_byte_order",
             "get_waveform_data_raw",
             "set_trigger_mode",
             "digitize",
@@ -349,7 +525,15 @@ class EDUX1002AMock(MockDevice, EDUX1002A):
             "is_real_time_mode",
             "get_waveform_preamble",
             "get_waveform_data",
+            "read_waveform_data",
+            "read_waveform",
+            "capture",
+            "capture_channels",
             "get_waveform",
+            "set_timebase_scale",
+            "set_timebase_position",
+            "set_channel_scale",
+            "set_channel_offset",
             "set_timeout",
             "set_acquisition_type",
             "set_waveform_return_type",
@@ -377,7 +561,15 @@ class EDUX1002AMock(MockDevice, EDUX1002A):
         # Return simulated waveform data
         return np.random.rand(100)  # Simulating 100 data points
 
-    def get_waveform(self, channel: int = 1):
+    def capture(self, channel: int = 1):
         time = np.arange(100)  # Simulating time data
         voltage = self.get_waveform_data(channel)
         return time, voltage
+
+    def capture_channels(self, channels=(1, 2)):
+        time = np.arange(100)  # Simulating time data
+        voltages = np.vstack([self.get_waveform_data(channel) for channel in channels])
+        return time, voltages
+
+    def get_waveform(self, channel: int = 1):
+        return self.capture(channel)
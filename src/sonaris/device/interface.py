@@ -1,26 +1,191 @@
 import abc
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, List, Optional, Tuple
 
+import numpy as np
 import pyvisa
 
+from sonaris.utils.metrics import get_metrics
+
+SCPI_LATENCY = get_metrics().histogram(
+    "sonaris_scpi_latency_seconds", "Round trip time of SCPI messages in seconds."
+)
+SCPI_ERRORS = get_metrics().counter(
+    "sonaris_scpi_errors_total", "SCPI messages that raised an error."
+)
+
 
 class Interface(abc.ABC):
+    # Maximum length in bytes of a single program message sent to the instrument.
+    MAX_MESSAGE_LENGTH = 1024
 
     def __init__(self, resource: pyvisa.Resource, address: Optional[str] = None):
         self.inst = resource
         self.address = address
         self.debug = False
+        self.max_message_length = self.MAX_MESSAGE_LENGTH
+        # Pending batched writes, kept per thread so concurrent callers do not mix commands
+        self._local = threading.local()
+
+    @contextmanager
+    def measure(self, operation: str) -> Iterator[None]:
+        """Records the latency, and failures, of one exchange with the instrument."""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            SCPI_ERRORS.inc(operation=operation)
+            raise
+        finally:
+            SCPI_LATENCY.observe(time.perf_counter() - start, operation=operation)
+
+    @property
+    def pending(self) -> Optional[List[str]]:
+        return getattr(self._local, "pending", None)
 
     def write(self, command: str) -> None:
-        self.inst.write(command)
+        if self.pending is not None:
+            self.pending.append(command)
+            return
+        with self.measure("write"):
+            self.inst.write(command)
         if self.debug:
             print(f"[{datetime.now()}]{command}")
 
     def read(self, command: str) -> str:
+        # Keep command order: anything batched so far goes out before the query
+        self.flush()
+        if self.debug:
+            print(f"[{datetime.now()}]{command}")
+        with self.measure("query"):
+            return self.inst.query(command)
+
+    def query_binary(
+        self, command: str, datatype: str = "B", is_big_endian: bool = True
+    ) -> np.ndarray:
+        """
+        Sends a query answered with an IEEE 488.2 definite-length binary block and decodes
+        the block straight into a NumPy array.
+
+        Args:
+            command (str): The SCPI query.
+            datatype (str): struct format character of one value, e.g. 'B' or 'H'.
+            is_big_endian (bool): Byte order of multi-byte values.
+
+        Returns:
+            np.ndarray: The decoded values.
+        """
+        self.flush()
         if self.debug:
             print(f"[{datetime.now()}]{command}")
-        return self.inst.query(command)
+        with self.measure("binary"):
+            return self.inst.query_binary_values(
+                command,
+                datatype=datatype,
+                is_big_endian=is_big_endian,
+                container=np.array,
+            )
+
+    @contextmanager
+    def batch(self) -> Iterator["Interface"]:
+        """
+        Buffers writes issued inside the context and sends them as compound SCPI messages
+        (commands joined with ';') when the outermost context exits. Reads inside the
+        context flush the buffer first. Nested contexts join the outer batch. If the body
+        raises, the buffered writes are dropped, so a half-built configuration is never
+        sent to the instrument.
+
+        Example:
+            with interface.batch():
+                interface.write("SOURce1:FUNCtion SIN")
+                interface.write("SOURce1:FREQuency:FIXed 1000")
+        """
+        if self.pending is not None:
+            yield self
+            return
+        self._local.pending = []
+        try:
+            yield self
+        except BaseException:
+            self._local.pending = None
+            raise
+        commands = self._local.pending
+        self._local.pending = None
+        self.write_batch(commands)
+
+    def flush(self) -> None:
+        """Sends any writes buffered by an open `batch` context."""
+        if self.pending:
+            commands = list(self.pending)
+            self.pending.clear()
+            self.write_batch(commands)
+
+    def write_batch(self, commands: List[str]) -> None:
+        """
+        Sends the commands in as few messages as the maximum message length allows.
+
+        Args:
+            commands (List[str]): SCPI commands in execution order.
+        """
+        for message, _ in self.pack(commands):
+            with self.measure("write"):
+                self.inst.write(message)
+            if self.debug:
+                print(f"[{datetime.now()}]{message}")
+
+    def query_batch(self, commands: List[str]) -> List[str]:
+        """
+        Sends several queries as compound messages and splits the responses back into
+        one result per query.
+
+        Args:
+            commands (List[str]): SCPI queries, each ending with '?'.
+
+        Returns:
+            List[str]: The response to each query, in order.
+        """
+        self.flush()
+        results = []
+        for message, count in self.pack(commands):
+            if self.debug:
+                print(f"[{datetime.now()}]{message}")
+            with self.measure("query"):
+                values = self.inst.query(message).strip().split(";")
+            if len(values) != count:
+                raise ValueError(
+                    f"Expected {count} responses to '{message}', got {len(values)}."
+                )
+            results.extend(values)
+        return results
+
+    def pack(self, commands: List[str]) -> List[Tuple[str, int]]:
+        """
+        Joins commands into compound messages no longer than `max_message_length`.
+        Each command is rooted with a leading ':' so headers are not resolved relative
+        to the previous command.
+
+        Returns:
+            List[Tuple[str, int]]: Messages with the number of commands they contain.
+        """
+        messages = []
+        current, length = [], 0
+        for command in commands:
+            command = command.strip()
+            if not command.startswith((":", "*")):
+                command = f":{command}"
+            size = len(command.encode()) + (1 if current else 0)
+            if current and length + size > self.max_message_length:
+                messages.append((";".join(current), len(current)))
+                current, length = [], 0
+                size -= 1
+            current.append(command)
+            length += size
+        if current:
+            messages.append((";".join(current), len(current)))
+        return messages
 
 
 class EthernetInterface(Interface):
@@ -1,5 +1,6 @@
 import pyvisa
 
+from sonaris.device.device import DeviceDiscovery
 from sonaris.frontend.managers.dg4202 import DG4202Manager
 from sonaris.frontend.managers.edux1002a import EDUX1002AManager
 from sonaris.frontend.managers.state_manager import StateManager
@@ -11,6 +12,7 @@ from sonaris.services.grafana import GrafanaService
 # Place holder globals, these are initialized in app.py
 # ======================================================== #
 resource_manager: pyvisa.ResourceManager = None
+device_discovery: DeviceDiscovery = None
 state_manager: StateManager = None
 dg4202_manager: DG4202Manager = None
 edux1002a_manager: EDUX1002AManager = None
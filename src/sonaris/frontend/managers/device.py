@@ -1,19 +1,52 @@
 import abc
-import logging
+import threading
 import time
+from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import Type, Union
+from typing import Tuple, Type, Union
 
 import pyvisa
 
 # Import classes and modules from sonaris.device module as needed.
 from sonaris.device.data import DataSource
-from sonaris.device.device import Device, DeviceDetector, MockDevice
+from sonaris.device.device import Device, DeviceDetector, DeviceDiscovery, MockDevice
 from sonaris.frontend.managers.state_manager import StateManager
 from sonaris.utils.log import get_logger
+from sonaris.utils.metrics import get_metrics
 
 logger = get_logger()
 
+DETECTION_DURATION = get_metrics().histogram(
+    "sonaris_device_detection_seconds", "Duration of device detection in seconds."
+)
+RECONNECTS = get_metrics().counter(
+    "sonaris_device_reconnects_total", "Forced reconnects per device."
+)
+IO_ERRORS = get_metrics().counter(
+    "sonaris_device_io_errors_total", "VISA I/O errors seen by the device managers."
+)
+
+
+@dataclass(frozen=True)
+class DeviceSnapshot:
+    """
+    Result of one health poll of a device, shared read-only by every widget.
+
+    Attributes:
+        alive (bool): Whether the device answered the poll.
+        timestamp (float): time.time() of the poll.
+        latency (float): Duration of the poll in seconds.
+        failures (int): Consecutive failed polls, 0 while the device is alive.
+        data (dict): Device telemetry read during the poll, e.g. DG4202 parameters.
+    """
+
+    device: str
+    alive: bool
+    timestamp: float
+    latency: float
+    failures: int = 0
+    data: dict = field(default_factory=dict)
+
 
 class DeviceManager(abc.ABC):
     device_type: Type[Device] = Device
@@ -24,25 +57,54 @@ class DeviceManager(abc.ABC):
         state_manager: StateManager,
         args_dict: dict,
         resource_manager: pyvisa.ResourceManager,
+        discovery: DeviceDiscovery = None,
+        device: Device = None,
     ):
         self.state_manager = state_manager
         self.args_dict = args_dict
         self.resource_manager = resource_manager
+        # Shared between managers so one scan resolves every instrument
+        self.discovery = discovery or DeviceDiscovery(resource_manager)
+        # May be resolved up front by one `detect_all` scan for every manager
+        self.device = device
+        # Serialises instrument I/O between background threads and the GUI thread
+        self.device_lock = threading.RLock()
+        # Background DeviceHealthPoller, created by `get_health_poller`
+        self.poller = None
+        # Connection lifecycle counters
+        self.reconnect_count = 0
+        self.detection_count = 0
+        self.last_detection_duration = 0.0
+        self.total_detection_duration = 0.0
         self.mock_device = self.mock_device_type()
         self.setup_device()
-        self.setup_data()
+        self.on_device_changed()
 
     def setup_device(self) -> None:
         if self.args_dict.get("hardware_mock", False):
             self.fetch_mock_hardware()
-        else:
+        elif self.device is None:
             self.fetch_hardware()
 
     def fetch_hardware(self) -> None:
         """Fetch and update the device driver (hardware, not simulated!)"""
+        start = time.perf_counter()
         self.device = DeviceDetector(
-            resource_manager=self.resource_manager, device_type=self.device_type
+            resource_manager=self.resource_manager,
+            device_type=self.device_type,
+            discovery=self.discovery,
         ).detect_device()
+        self.last_detection_duration = time.perf_counter() - start
+        self.total_detection_duration += self.last_detection_duration
+        self.detection_count += 1
+        DETECTION_DURATION.observe(
+            self.last_detection_duration,
+            device=self.device_type.IDN_STRING,
+            found=self.device is not None,
+        )
+        logger.debug(
+            f"Detection for {self.device_type.IDN_STRING} took {self.last_detection_duration:.3f}s."
+        )
 
     def fetch_mock_hardware(self) -> None:
         """Sets the internal pointer of device to the mock device.
@@ -70,51 +132,119 @@ class DeviceManager(abc.ABC):
             state[last_alive_key] = None
         self.state_manager.write_state(state)
 
-    def get_device(self) -> Union[Device, MockDevice, None]:
+    def on_device_changed(self) -> None:
+        """Rebuilds the data source and records the alive state after the device handle changed."""
         last_alive_key = f"{self.device_type.IDN_STRING}_last_alive"
-
-        # Decide if we should use a mock device or try to fetch a real device.
-        if self.args_dict.get("hardware_mock", False):
-            self.fetch_mock_hardware()
-        else:
-            self.fetch_hardware()  # This attempts to set `self.device` to a real device.
         # Determine if the device is considered 'alive'.
         device_alive = self.device is not None and (
             not isinstance(self.device, MockDevice) or not self.device.killed
         )
         self.update_last_alive_state(last_alive_key, device_alive)
         self.setup_data()
+
+    def get_device(self) -> Union[Device, MockDevice, None]:
+        """
+        Returns the cached device handle. Detection only runs when no handle is held,
+        i.e. at startup, after an I/O failure invalidated it or after `reconnect`.
+        """
+        previous_device = self.device
+
+        # Decide if we should use a mock device or try to fetch a real device.
+        if self.args_dict.get("hardware_mock", False):
+            self.fetch_mock_hardware()
+        elif self.device is None:
+            self.fetch_hardware()  # This attempts to set `self.device` to a real device.
+
+        if self.device is not previous_device:
+            self.on_device_changed()
         return self.device
 
+    def release_device(self) -> None:
+        """Drops the cached device handle and closes its VISA resource."""
+        if self.device is not None and not isinstance(self.device, MockDevice):
+            self.discovery.release(self.device.interface.inst)
+        self.device = None
+
+    def reconnect(self) -> Union[Device, MockDevice, None]:
+        """Forces a new detection cycle, discarding the current device handle."""
+        self.reconnect_count += 1
+        RECONNECTS.inc(device=self.device_type.IDN_STRING)
+        logger.info(
+            f"Reconnecting {self.device_type.IDN_STRING} (reconnect #{self.reconnect_count})."
+        )
+        self.release_device()
+        return self.get_device()
+
+    def get_connection_stats(self) -> dict:
+        """
+        Returns the connection lifecycle counters.
+
+        Returns:
+            dict: reconnects, detections and detection timings in seconds.
+        """
+        return {
+            "connected": self.device is not None,
+            "reconnect_count": self.reconnect_count,
+            "detection_count": self.detection_count,
+            "last_detection_duration": self.last_detection_duration,
+            "total_detection_duration": self.total_detection_duration,
+        }
+
     def set_mock_state(self, state: bool) -> None:
         self.mock_device.killed = state
 
     def call_device_method(self, method_name: str, *args, **kwargs):
         """
-        Generic method to call a method on the managed device.
+        Generic method to call a method on the managed device. On a VISA I/O error the
+        call is retried once on a re-detected device handle, but only if the connection
+        check shows the link dropped. If the device still answers, the failed command may
+        already have been applied, e.g. a write whose read timed out, so it is not sent
+        again and None is returned.
 
         :param method_name: The name of the method to be called on the device.
         :param args: Positional arguments to pass to the device method.
         :param kwargs: Keyword arguments to pass to the device method.
         :return: The result of the device method call.
         """
-        self.device = self.get_device()  # Ensure we have the current device instance
-        if self.device is not None:
+        with self.device_lock:
+            device = self.get_device()  # Ensure we have the current device instance
+            if device is None:
+                logger.error(
+                    f"No device instance available for {self.device_type.IDN_STRING}"
+                )
+                return None
             try:
-                method = getattr(self.device, method_name)
-                if callable(method):
-                    return method(*args, **kwargs)
-                else:
-                    raise AttributeError(
-                        f"{method_name} is not a method of {self.device.IDN_STRING}"
+                return self._call(device, method_name, *args, **kwargs)
+            except pyvisa.errors.VisaIOError as e:
+                IO_ERRORS.inc(device=self.device_type.IDN_STRING)
+                logger.warning(
+                    f"I/O error calling {method_name} on "
+                    f"{self.device_type.IDN_STRING}: {e}"
+                )
+                if device.is_connection_alive():
+                    logger.error(
+                        f"{method_name} on {self.device_type.IDN_STRING} failed on a "
+                        "live connection, not retried."
                     )
-            except AttributeError as e:
-                logging.error(
-                    f"Method {method_name} not found on device {self.device.IDN_STRING}: {e}"
+                    return None
+                device = self.reconnect()
+                if device is None:
+                    return None
+                return self._call(device, method_name, *args, **kwargs)
+
+    def _call(self, device: Device, method_name: str, *args, **kwargs):
+        try:
+            method = getattr(device, method_name)
+            if callable(method):
+                return method(*args, **kwargs)
+            else:
+                raise AttributeError(
+                    f"{method_name} is not a method of {device.IDN_STRING}"
                 )
-                return None
-        else:
-            logging.error(f"No device instance available for {self.device.IDN_STRING}")
+        except AttributeError as e:
+            logger.error(
+                f"Method {method_name} not found on device {device.IDN_STRING}: {e}"
+            )
             return None
 
     def is_device_alive(self) -> bool:
@@ -123,9 +253,31 @@ class DeviceManager(abc.ABC):
                 return not self.device.killed
             idn = self.device.interface.read("*IDN?")
             return self.device.IDN_STRING in idn
+        except pyvisa.errors.VisaIOError:
+            # Confirmed I/O failure, the next get_device call re-detects.
+            IO_ERRORS.inc(device=self.device_type.IDN_STRING)
+            self.release_device()
+            return False
         except Exception as e:
             return False
 
+    def poll_health(self, read_data: bool = False) -> Tuple[bool, dict]:
+        """
+        Checks the device once, re-detecting it if no handle is held. Runs on the
+        health poller thread, subclasses extend it with the telemetry their widgets show.
+
+        Args:
+            read_data (bool): Also read the telemetry, otherwise only the connection is
+                checked.
+
+        Returns:
+            Tuple[bool, dict]: Whether the device is alive and the telemetry read.
+        """
+        with self.device_lock:
+            if self.device is None:
+                self.get_device()
+            return self.is_device_alive(), {}
+
     def write_device_state(self) -> None:
         alive = self.is_device_alive()
         if alive:
@@ -1,6 +1,12 @@
+import copy
+from typing import Tuple
+
 import pyvisa
 
+from sonaris.defaults import SHADOW_STATE_TTL
+
 # Import classes and modules from sonaris.device module as needed.
+from sonaris.device.device import DeviceDiscovery
 from sonaris.device.dg4202 import DG4202, DG4202DataSource, DG4202Mock
 from sonaris.frontend.managers.device import DeviceManager
 from sonaris.frontend.managers.state_manager import StateManager
@@ -15,8 +21,15 @@ class DG4202Manager(DeviceManager):
         state_manager: StateManager,
         args_dict: dict,
         resource_manager: pyvisa.ResourceManager,
+        discovery: DeviceDiscovery = None,
+        device: DG4202 = None,
     ):
-        super().__init__(state_manager, args_dict, resource_manager)
+        super().__init__(state_manager, args_dict, resource_manager, discovery, device)
+
+    def on_device_changed(self) -> None:
+        if self.device is not None and self.args_dict.get("shadow_state", False):
+            self.device.enable_shadow(ttl=SHADOW_STATE_TTL)
+        super().on_device_changed()
 
     def setup_data(self):
         # Will still return a valid dictionary even if self.device is None
@@ -24,3 +37,25 @@ class DG4202Manager(DeviceManager):
 
     def get_data(self) -> dict:
         return self.data_source.query_data()
+
+    def poll_health(self, read_data: bool = False) -> Tuple[bool, dict]:
+        """
+        Checks the connection with a single query. Only if `read_data` is set all
+        channel parameters are read, their connection check doubles as the alive check.
+        """
+        with self.device_lock:
+            device = self.get_device()
+            if device is None:
+                default = self.data_source.default_dict if read_data else {}
+                return False, copy.deepcopy(default)
+            if not read_data:
+                alive = device.is_connection_alive()
+                if not alive:
+                    # The next poll re-detects the device
+                    self.release_device()
+                return alive, {}
+            data = self.get_data()
+            if not data.get("connected"):
+                self.release_device()
+            # A copy, the data source keeps updating its own dictionary in place
+            return bool(data.get("connected")), copy.deepcopy(data)
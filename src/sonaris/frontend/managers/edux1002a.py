@@ -1,12 +1,18 @@
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
 import pyvisa
 
 from sonaris.device.data import DataBuffer
+from sonaris.device.device import DeviceDiscovery
 
 # Import classes and modules from sonaris.device module as needed.
 from sonaris.device.edux1002a import EDUX1002A, EDUX1002ADataSource, EDUX1002AMock
-from sonaris.defaults import OSCILLOSCOPE_BUFFER_SIZE
 from sonaris.frontend.managers.device import DeviceManager
 from sonaris.frontend.managers.state_manager import StateManager
+from sonaris.utils.log import get_logger
+
+logger = get_logger()
 
 
 class EDUX1002AManager(DeviceManager):
@@ -19,9 +25,15 @@ class EDUX1002AManager(DeviceManager):
         args_dict: dict,
         resource_manager: pyvisa.ResourceManager,
         buffer_size: int,
+        discovery: DeviceDiscovery = None,
+        device: EDUX1002A = None,
     ):
         self.buffer_size = buffer_size
-        super().__init__(state_manager, args_dict, resource_manager)
+        self.time_axis = None
+        # Called with (time_axis, voltages) for every acquired frame, e.g. remote streams
+        self.frame_listeners: List[Callable[[np.ndarray, np.ndarray], None]] = []
+        self.last_frame: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        super().__init__(state_manager, args_dict, resource_manager, discovery, device)
 
     def setup_data(self):
         self.data_source = (
@@ -40,5 +52,65 @@ class EDUX1002AManager(DeviceManager):
         if self.data_source:
             self.data_source[channel].update()
 
+    def acquire(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Captures both channels from one trigger without touching the buffers, so it can
+        run on an acquisition thread while the GUI thread owns the buffers. The frame is
+        handed to the frame listeners on the calling thread.
+
+        Returns:
+            Optional[Tuple[np.ndarray, np.ndarray]]: The time axis and a 2xN voltage
+            array, None if no device is connected.
+        """
+        with self.device_lock:
+            if not self.device:
+                return None
+            frame = self.device.capture_channels((1, 2))
+        self.publish_frame(*frame)
+        return frame
+
+    def publish_frame(self, time_axis: np.ndarray, voltages: np.ndarray) -> None:
+        """Keeps the frame as `last_frame` and hands it to the frame listeners."""
+        self.last_frame = (time_axis, voltages)
+        for listener in list(self.frame_listeners):
+            try:
+                listener(time_axis, voltages)
+            except Exception as e:
+                logger.error(f"Frame listener {listener} failed: {e}")
+
+    def store_frame(self, time_axis: np.ndarray, voltages: np.ndarray) -> None:
+        """Buffers a frame returned by `acquire`, on the thread that owns the buffers."""
+        self.time_axis = time_axis
+        for channel, voltage in zip((1, 2), voltages):
+            self.data_source[channel].append(voltage)
+
+    def add_frame_listener(
+        self, listener: Callable[[np.ndarray, np.ndarray], None]
+    ) -> None:
+        """
+        Registers a listener for captured frames. Listeners are called by `acquire` on
+        the acquisition thread, e.g. the `AcquisitionWorker` of the oscilloscope widget,
+        with every frame including those the GUI skips when it falls behind. They must
+        return quickly, as the next capture waits for them.
+
+        Listeners only relay the frames an acquisition already made and never cause
+        instrument queries of their own, so they receive nothing while no acquisition
+        runs, e.g. when the oscilloscope widget is stopped or closed.
+        """
+        if listener not in self.frame_listeners:
+            self.frame_listeners.append(listener)
+
+    def remove_frame_listener(
+        self, listener: Callable[[np.ndarray, np.ndarray], None]
+    ) -> None:
+        if listener in self.frame_listeners:
+            self.frame_listeners.remove(listener)
+
+    def update_buffers(self) -> None:
+        """Acquires both channels in one trigger and buffers the time-aligned frames."""
+        frame = self.acquire()
+        if frame is not None:
+            self.store_frame(*frame)
+
     def get_data(self, channel: int) -> dict:
         return self.data_source[channel].get_data() if self.device else None
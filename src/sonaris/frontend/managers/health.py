@@ -0,0 +1,135 @@
+import threading
+import time
+
+import PyQt6.QtCore as QtCore
+from PyQt6.QtWidgets import QApplication
+
+from sonaris.defaults import HEALTH_MAX_BACKOFF, HEALTH_POLL_PERIOD
+from sonaris.frontend.managers.device import DeviceManager, DeviceSnapshot
+from sonaris.utils.log import get_logger
+
+logger = get_logger()
+
+
+class DeviceHealthPoller(QtCore.QThread):
+    """
+    Polls one device manager on its own thread and publishes the result as a cached
+    `DeviceSnapshot`. Widgets read `snapshot` or connect to `snapshotUpdated` instead of
+    querying the instrument on the GUI thread.
+
+    While the device is alive it is polled every `period` seconds. Failed polls back off
+    exponentially up to `max_backoff`, so a missing instrument is not rescanned every
+    period. Periodic polls only check the connection, the device telemetry is read on
+    the first poll, after a reconnect and when requested through `refresh`. `data`
+    keeps the telemetry read last.
+
+    Args:
+        manager (DeviceManager): The manager to poll.
+        period (float): Seconds between polls of a healthy device.
+        max_backoff (float): Upper bound of the delay after failed polls.
+    """
+
+    snapshotUpdated = QtCore.pyqtSignal(object)
+    connectionChanged = QtCore.pyqtSignal(bool)
+
+    def __init__(
+        self,
+        manager: DeviceManager,
+        period: float = HEALTH_POLL_PERIOD,
+        max_backoff: float = HEALTH_MAX_BACKOFF,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.manager = manager
+        self.period = period
+        self.max_backoff = max_backoff
+        self.snapshot: DeviceSnapshot = None
+        self.data: dict = {}
+        self.data_requested = threading.Event()
+        self.failures = 0
+        self.stop_event = threading.Event()
+        self.wake_event = threading.Event()
+
+    @property
+    def name(self) -> str:
+        return self.manager.device_type.IDN_STRING
+
+    def next_delay(self) -> float:
+        if self.failures == 0:
+            return self.period
+        return min(self.period * 2 ** (self.failures - 1), self.max_backoff)
+
+    def poll(self) -> DeviceSnapshot:
+        """Polls the device once and publishes the snapshot, callable from any thread."""
+        previous = self.snapshot
+        read_data = (
+            previous is None or not previous.alive or self.data_requested.is_set()
+        )
+        self.data_requested.clear()
+        start = time.perf_counter()
+        try:
+            alive, data = self.manager.poll_health(read_data)
+        except Exception as e:
+            logger.error(f"Health poll of {self.name} failed: {e}")
+            alive, data = False, {}
+        self.failures = 0 if alive else self.failures + 1
+        if data:
+            self.data = data
+        self.snapshot = DeviceSnapshot(
+            device=self.name,
+            alive=alive,
+            timestamp=time.time(),
+            latency=time.perf_counter() - start,
+            failures=self.failures,
+            data=data,
+        )
+        self.snapshotUpdated.emit(self.snapshot)
+        if previous is None or previous.alive != alive:
+            self.connectionChanged.emit(alive)
+        return self.snapshot
+
+    def run(self):
+        while not self.stop_event.is_set():
+            self.poll()
+            self.wake_event.wait(self.next_delay())
+            self.wake_event.clear()
+
+    def refresh(self, read_data: bool = False) -> None:
+        """
+        Polls again right away, e.g. after a widget changed the device settings.
+
+        Args:
+            read_data (bool): Read the device telemetry in that poll.
+        """
+        if read_data:
+            self.data_requested.set()
+        self.wake_event.set()
+
+    def stop(self, wait: bool = False) -> None:
+        self.stop_event.set()
+        self.wake_event.set()
+        if wait:
+            self.wait()
+
+
+def get_health_poller(manager: DeviceManager, start: bool = True) -> DeviceHealthPoller:
+    """
+    Returns the poller of `manager`, creating it on first use so every widget of a
+    device shares one poller.
+
+    Args:
+        manager (DeviceManager): The device manager.
+        start (bool): Start polling if the poller is not running yet.
+    """
+    if manager.poller is None:
+        manager.poller = DeviceHealthPoller(manager)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(lambda: manager.poller.stop(wait=True))
+    if (
+        start
+        and not manager.poller.isRunning()
+        and not manager.poller.stop_event.is_set()
+    ):
+        manager.poller.start()
+    return manager.poller
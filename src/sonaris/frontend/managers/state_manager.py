@@ -1,12 +1,15 @@
+import atexit
+import json
 import logging
 import os
+import threading
 import time
 from datetime import timedelta
 from pathlib import Path
 
 from filelock import FileLock
 
-from sonaris.defaults import STATE_FILE
+from sonaris.defaults import STATE_FILE, STATE_FLUSH_INTERVAL
 from sonaris.utils import log as logutils
 
 # Setting up basic logging
@@ -16,11 +19,39 @@ logging.basicConfig(
 
 
 class StateManager:
-    def __init__(self, json_file: Path = None):
-        self.json_file = json_file or STATE_FILE
+    """
+    Keeps the application state in memory and writes it to `json_file` behind the
+    callers. Updates within `flush_interval` seconds are coalesced into one write, which
+    replaces the file atomically (temp file + rename), so reads and writes never touch
+    the disk on the caller's thread. Pending changes are flushed on `close`, which also
+    runs at interpreter exit.
+
+    With `shared=True` every read reloads the file and every write is persisted at once
+    under a `FileLock`, for setups where several processes share one state file.
+
+    Args:
+        json_file (Path): The state file, defaults to STATE_FILE.
+        flush_interval (float): Maximum delay in seconds before changes are written.
+        shared (bool): Keep the file consistent across processes on every call.
+    """
+
+    def __init__(
+        self,
+        json_file: Path = None,
+        flush_interval: float = STATE_FLUSH_INTERVAL,
+        shared: bool = False,
+    ):
+        self.json_file = Path(json_file or STATE_FILE)
         self.lock_file = self.json_file.with_suffix(".lock")
-        self.data = self.default_state()
+        self.flush_interval = flush_interval
+        self.shared = shared
+        self.lock = threading.RLock()
+        self.flush_lock = threading.Lock()
+        self.dirty = False
+        self.flush_timer: threading.Timer = None
+        self.data = self.load()
         self.birthdate = time.time()
+        atexit.register(self.close)
 
     def sanitize_key(self, key: str) -> str:
         """
@@ -28,27 +59,86 @@ class StateManager:
         """
         return key.strip().replace(" ", "_")
 
-    def read_state(self) -> dict:
+    def load(self) -> dict:
         with FileLock(self.lock_file, timeout=10):
             # Utilize the load_json_with_backup utility function with locking
-            self.data = (
+            return (
                 logutils.load_json_with_backup(self.json_file) or self.default_state()
             )
-        return self.data
+
+    def save(self, data: dict) -> None:
+        """Replaces the state file atomically, the caller holds the file lock."""
+        temp_file = self.json_file.with_name(f"{self.json_file.name}.tmp")
+        with open(temp_file, "w") as file:
+            json.dump(data, file, indent=4)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_file, self.json_file)
+
+    def read_state(self) -> dict:
+        """Returns a copy of the state, callers pass changes back through `write_state`."""
+        with self.lock:
+            if self.shared:
+                self.data = self.load()
+            return dict(self.data)
 
     def write_state(self, state: dict):
-        with FileLock(self.lock_file, timeout=10):
+        with self.lock:
+            if self.shared:
+                # Merge into the file as it is now, other processes may have changed it
+                with FileLock(self.lock_file, timeout=10):
+                    self.data = (
+                        logutils.load_json_with_backup(self.json_file)
+                        or self.default_state()
+                    )
+                    self.data.update(state)
+                    self.save(self.data)
+                return
             self.data.update(state)
-            logutils.save_json(self.data, self.json_file)
+            self.dirty = True
+            self.schedule_flush()
+
+    def schedule_flush(self) -> None:
+        """Arms the flush timer unless a flush is already pending."""
+        with self.lock:
+            if self.flush_timer is None:
+                # Later updates join this write, so the delay stays bounded
+                self.flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self.flush_timer.daemon = True
+                self.flush_timer.start()
+
+    def flush(self) -> None:
+        """Writes pending changes, callers of `write_state` never wait for the disk."""
+        # Serialises flushes, so an older snapshot never overwrites a newer one
+        with self.flush_lock:
+            with self.lock:
+                if self.flush_timer is not None:
+                    self.flush_timer.cancel()
+                    self.flush_timer = None
+                if not self.dirty:
+                    return
+                data = dict(self.data)
+                self.dirty = False
+            try:
+                with FileLock(self.lock_file, timeout=10):
+                    self.save(data)
+            except Exception as e:
+                logging.error(f"Failed to write state to {self.json_file}: {e}")
+                with self.lock:
+                    self.dirty = True
+                # Retried after the flush interval, not only on the next update
+                self.schedule_flush()
+
+    def close(self) -> None:
+        self.flush()
+        atexit.unregister(self.close)
 
     def default_state(self):
         return {}
 
     def update_device_last_alive(self, device_type: str, last_alive_time=None):
-        state = self.read_state()
         sanitized_key = self.sanitize_key(f"{device_type}_last_alive")
-        state[sanitized_key] = last_alive_time or time.time()
-        self.write_state(state)
+        self.write_state({sanitized_key: last_alive_time or time.time()})
 
     def get_device_last_alive(self, device_type: str):
         state = self.read_state()
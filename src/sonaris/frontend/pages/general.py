@@ -2,9 +2,9 @@ from typing import Callable
 
 from PyQt6.QtWidgets import QLabel, QVBoxLayout
 
-from sonaris.defaults import TICK_INTERVAL
 from sonaris.frontend.managers.dg4202 import DG4202Manager
 from sonaris.frontend.managers.edux1002a import EDUX1002AManager
+from sonaris.frontend.managers.health import get_health_poller
 from sonaris.frontend.widgets.gen_oscilloscope import EDUX1002AOscilloscopeWidget
 from sonaris.frontend.widgets.gen_signal import DG4202SignalGeneratorWidget
 from sonaris.frontend.widgets.templates import BasePage
@@ -33,13 +33,12 @@ class GeneralPage(BasePage):
         self.initUI()
 
     def check_connection(self) -> bool:
-        return self.dg4202_manager.is_device_alive()
+        snapshot = get_health_poller(self.dg4202_manager).snapshot
+        return snapshot is not None and snapshot.alive
 
     def initUI(self):
         self.main_layout = QVBoxLayout()
-        self.oscilloscope = EDUX1002AOscilloscopeWidget(
-            self.edux1002a_manager, tick=TICK_INTERVAL
-        )
+        self.oscilloscope = EDUX1002AOscilloscopeWidget(self.edux1002a_manager)
         self.main_layout.addWidget(self.oscilloscope)
         self.status_label = QLabel("")
         self.main_layout.addWidget(self.status_label)
@@ -1,4 +1,6 @@
+import queue
 import sys
+from typing import Callable
 
 import numpy as np
 import PyQt6.QtCore as QtCore
@@ -15,33 +17,122 @@ from PyQt6.QtWidgets import (
 )
 
 import sonaris.defaults as defaults
-from sonaris.defaults import TICK_INTERVAL
+from sonaris.defaults import ACQUISITION_QUEUE_SIZE
 from sonaris.frontend.managers.edux1002a import EDUX1002AManager
 from sonaris.utils.log import get_logger
 
 logger = get_logger()
 
 
+class AcquisitionWorker(QtCore.QThread):
+    """
+    Runs blocking captures back to back on its own thread and hands the frames to the
+    GUI through a bounded queue. When the consumer falls behind the oldest frame is
+    dropped, so the queue never holds more than `queue_size` frames.
+
+    Stopping only clears `active`, the capture in flight completes on the worker thread
+    instead of blocking the caller.
+    """
+
+    frameReady = QtCore.pyqtSignal()
+    acquisitionFailed = QtCore.pyqtSignal(str)
+
+    def __init__(
+        self,
+        acquire: Callable,
+        queue_size: int = ACQUISITION_QUEUE_SIZE,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.acquire = acquire
+        self.frames = queue.Queue(maxsize=queue_size)
+        self.active = False
+        self.single_shot = False
+        self.dropped_frames = 0
+        self.finished.connect(self.restart_if_active)
+
+    def run(self):
+        while self.active:
+            try:
+                frame = self.acquire()
+            except Exception as e:
+                self.active = False
+                self.acquisitionFailed.emit(str(e))
+                return
+            if frame is None:
+                self.active = False
+                self.acquisitionFailed.emit("no device connected")
+                return
+            self.put(frame)
+            self.frameReady.emit()
+            if self.single_shot:
+                self.active = False
+
+    def begin(self, single_shot: bool = False) -> None:
+        """Starts capturing, a continuous run is not downgraded by a single shot."""
+        if self.active and not single_shot:
+            self.single_shot = False
+        elif not self.active:
+            self.single_shot = single_shot
+        self.active = True
+        if not self.isRunning():
+            self.start()
+
+    def restart_if_active(self) -> None:
+        # `begin` may have been called while the previous run was winding down
+        if self.active and not self.isRunning():
+            self.start()
+
+    def put(self, frame) -> None:
+        try:
+            self.frames.put_nowait(frame)
+        except queue.Full:
+            # Only this thread produces, so the slot freed here stays free
+            try:
+                self.frames.get_nowait()
+                self.dropped_frames += 1
+            except queue.Empty:
+                pass
+            self.frames.put_nowait(frame)
+
+    def take_latest(self):
+        """Drains the queue and returns the newest frame, None if it was empty."""
+        frame = None
+        while True:
+            try:
+                newer = self.frames.get_nowait()
+            except queue.Empty:
+                return frame
+            if frame is not None:
+                self.dropped_frames += 1
+            frame = newer
+
+    def stop(self, wait: bool = False) -> None:
+        self.active = False
+        if wait:
+            self.wait()
+
+
 class EDUX1002AOscilloscopeWidget(QWidget):
     def __init__(
         self,
         edux1002a_manager: EDUX1002AManager,
         parent=None,
-        tick: int = TICK_INTERVAL,
     ):
         super().__init__(parent)
         self.edux1002a_manager = edux1002a_manager
         # self.edux1002a_manager.device.interface.debug = True
-        self.tick = int(tick)
+        self.worker = AcquisitionWorker(self.edux1002a_manager.acquire, parent=self)
+        self.worker.frameReady.connect(self.render_latest)
+        self.worker.acquisitionFailed.connect(self.on_acquisition_failed)
         self.active_channel = 1
         self.x_input = {1: None, 2: None}
         self.y_input = {1: None, 2: None}
         self.initUI()
-        # Timer setup for real-time data update
-        self.timer = QtCore.QTimer()
-        self.timer.timeout.connect(self.update_data)
         self.configuration()
-        self.timer.stop()
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(lambda: self.worker.stop(wait=True))
 
     def configuration(self):
         try:
@@ -49,7 +140,7 @@ class EDUX1002AOscilloscopeWidget(QWidget):
             if self.edux1002a_manager.get_device():
                 self.edux1002a_manager.device.set_acquisition_type("AVERage")
                 self.edux1002a_manager.device.set_waveform_return_type("AVERage")
-                self.edux1002a_manager.device.set_waveform_format("ASCII")
+                self.edux1002a_manager.device.set_waveform_format("WORD")
                 self.edux1002a_manager.device.set_acquisition_complete(100)
                 self.edux1002a_manager.device.set_acquisition_count(8)
                 self.edux1002a_manager.device.set_waveform_points(
@@ -220,9 +311,7 @@ class EDUX1002AOscilloscopeWidget(QWidget):
         button_layout.addWidget(self.freeze_button)
 
         self.auto_button = QPushButton("AUTO")
-        self.auto_button.clicked.connect(
-            lambda: self.edux1002a_manager.device.autoscale
-        )
+        self.auto_button.clicked.connect(self.autoscale)
         button_layout.addWidget(self.auto_button)
         self.setLayout(layout)
 
@@ -242,35 +331,53 @@ class EDUX1002AOscilloscopeWidget(QWidget):
     def set_active_channel(self, channel: int):
         try:
             self.active_channel = channel
-            self.edux1002a_manager.get_device().setup_waveform_readout(channel)
+            with self.edux1002a_manager.device_lock:
+                self.edux1002a_manager.get_device().setup_waveform_readout(channel)
             self.update_channel_button_styles()
         except Exception as e:
             logger.error(f"Error :{e}, is the device connected?")
 
-    def update_data(self):
+    def autoscale(self):
         try:
-            self.edux1002a_manager.update_buffer(self.active_channel)
-            voltage = self.edux1002a_manager.get_data(self.active_channel)
-            time = np.arange(len(voltage))
-            self.plot_data[self.active_channel].setData(time, voltage)
+            with self.edux1002a_manager.device_lock:
+                self.edux1002a_manager.get_device().autoscale()
         except Exception as e:
-            logger.error(f"Error: {e}, is the device connected?")
-            self.freeze()
+            logger.error(f"Error :{e}, is the device connected?")
+
+    def update_data(self):
+        """Captures a single frame without blocking the GUI thread."""
+        self.worker.begin(single_shot=True)
+
+    def render_latest(self):
+        """Plots the newest frame, frames that queued up behind it are dropped."""
+        frame = self.worker.take_latest()
+        if frame is None:
+            return
+        # Both channels come from the same trigger
+        self.edux1002a_manager.store_frame(*frame)
+        for channel in (1, 2):
+            voltage = self.edux1002a_manager.get_data(channel)
+            time = np.arange(len(voltage))
+            self.plot_data[channel].setData(time, voltage)
+
+    def on_acquisition_failed(self, error: str):
+        logger.error(f"Error: {error}, is the device connected?")
+        self.freeze()
 
     def freeze(self):
         """Stop updating the waveform"""
         self.freeze_button.setText("START")
         self.freeze_button.setStyleSheet("")  # Set text color to default
-        self.timer.stop()
+        self.worker.stop()
 
     def unfreeze(self):
         """Resume updating the waveform"""
-        self.timer.start(self.tick)
+        self.worker.begin()
         self.freeze_button.setText("STOP")
         self.freeze_button.setStyleSheet("color: red;")
 
     def toggle_freeze(self):
-        if self.timer.isActive():
+        if self.worker.active and not self.worker.single_shot:
             self.freeze()
         else:
             self.unfreeze()
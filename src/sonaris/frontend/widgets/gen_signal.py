@@ -17,9 +17,11 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from sonaris.device.dg4202 import DG4202
 from sonaris.defaults import DECIMAL_POINTS, NOT_FOUND_STRING
+from sonaris.device.dg4202 import DG4202
+from sonaris.frontend.managers.device import DeviceSnapshot
 from sonaris.frontend.managers.dg4202 import DG4202Manager
+from sonaris.frontend.managers.health import get_health_poller
 from sonaris.frontend.pages import plotter
 from sonaris.utils.log import get_logger
 
@@ -34,21 +36,33 @@ class DG4202SignalGeneratorWidget(QWidget):
         self.channel_count = 2
         self.link_channel = False
         self.dg4202_manager = dg4202_manager
-        self.all_parameters = self.dg4202_manager.get_data()
+        self.poller = get_health_poller(self.dg4202_manager)
+        # Until the first poll completes, read the parameters once directly
+        self.all_parameters = (
+            self.poller.data or self.dg4202_manager.poll_health(read_data=True)[1]
+        )
         self.input_objects = {1: {}, 2: {}}
         self.initUI()
+        self.poller.snapshotUpdated.connect(self.on_snapshot)
 
     def check_connection(self) -> bool:
-        self.dg4202_manager.device = self.dg4202_manager.get_device()
-        self.all_parameters = self.dg4202_manager.get_data()
-
-        if self.dg4202_manager.device is None:
-            return False
-
-        is_alive = self.dg4202_manager.device.is_connection_alive()
-        if not is_alive:
-            self.dg4202_manager.device = None
-        return is_alive
+        """Reads the latest health snapshot, the instrument is not queried."""
+        snapshot = self.poller.snapshot
+        if snapshot is None:
+            return bool(self.all_parameters.get("connected"))
+        if snapshot.data:
+            self.all_parameters = snapshot.data
+        return snapshot.alive
+
+    def on_snapshot(self, snapshot: DeviceSnapshot):
+        # Input fields are left alone so a poll does not overwrite what is being typed
+        if not snapshot.alive or not snapshot.data:
+            return
+        self.all_parameters = snapshot.data
+        for channel in range(1, self.channel_count + 1):
+            self.update_button_state(channel)
+            self.update_waveform_graph(channel)
+            self.update_sweep_graph(channel)
 
     def create_widgets(self):
         # A dictionary to store widgets for each channel by channel number
@@ -392,7 +406,7 @@ class DG4202SignalGeneratorWidget(QWidget):
         htime_stop: float,
     ):
         try:
-            if self.dg4202_manager.get_device():
+            if self.check_connection():
                 sweep = (
                     float(sweep)
                     if sweep
@@ -468,7 +482,13 @@ class DG4202SignalGeneratorWidget(QWidget):
                     "HTIME_STOP": htime_stop,
                 }
                 logger.info(params)
-                self.dg4202_manager.device.set_sweep_parameters(channel, params)
+                self.dg4202_manager.call_device_method(
+                    "set_sweep_parameters", channel, params
+                )
+                self.all_parameters[f"{channel}"]["mode"]["parameters"]["sweep"].update(
+                    params
+                )
+                self.poller.refresh(read_data=True)
                 self.update_sweep_graph(channel)
             else:
                 logger.error(f"{NOT_FOUND_STRING} Is device connected?.")
@@ -495,9 +515,12 @@ class DG4202SignalGeneratorWidget(QWidget):
                 logger.info(
                     f'{channel} is {self.all_parameters.get(f"{channel}", {}).get("output_status", "ERR")} -> {set_to}'
                 )
-                self.dg4202_manager.device.output_on_off(channel, set_to)
-                self.check_connection()  # updates dictionary
-                # Update the button state after toggling the output
+                self.dg4202_manager.call_device_method("output_on_off", channel, set_to)
+                # Reflect the change right away, the next poll confirms it
+                self.all_parameters[f"{channel}"]["output_status"] = (
+                    "ON" if set_to else "OFF"
+                )
+                self.poller.refresh(read_data=True)
 
             else:
                 logger.error(f"{NOT_FOUND_STRING} Is device connected?")
@@ -559,7 +582,7 @@ class DG4202SignalGeneratorWidget(QWidget):
             self.waveform_plot_data (float): Plot data reference.
         """
         try:
-            if self.dg4202_manager.get_device():
+            if self.check_connection():
                 frequency = frequency or float(
                     self.all_parameters[f"{channel}"]["waveform"]["frequency"]
                 )
@@ -575,18 +598,38 @@ class DG4202SignalGeneratorWidget(QWidget):
                 )
 
                 # If a parameter is not set, pass the current value
-                self.dg4202_manager.device.set_waveform(
-                    channel, waveform_type, frequency, amplitude, offset
-                )
-
-                if self.link_channel:
-                    self.dg4202_manager.device.set_waveform(
-                        2 if channel == 1 else 1,
+                with self.dg4202_manager.device_lock:
+                    self.dg4202_manager.call_device_method(
+                        "set_waveform",
+                        channel,
                         waveform_type,
                         frequency,
                         amplitude,
                         offset,
                     )
+                    if self.link_channel:
+                        self.dg4202_manager.call_device_method(
+                            "set_waveform",
+                            2 if channel == 1 else 1,
+                            waveform_type,
+                            frequency,
+                            amplitude,
+                            offset,
+                        )
+
+                channels = (
+                    [channel, 2 if channel == 1 else 1]
+                    if self.link_channel
+                    else [channel]
+                )
+                for updated in channels:
+                    self.all_parameters[f"{updated}"]["waveform"].update(
+                        waveform_type=waveform_type,
+                        frequency=frequency,
+                        amplitude=amplitude,
+                        offset=offset,
+                    )
+                self.poller.refresh(read_data=True)
 
                 # Update some status label or log if you have one
                 status_string = f"[{datetime.now().isoformat()}] Waveform updated."
@@ -1,14 +1,11 @@
-import json
-from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, Iterable, List
 
 from PyQt6 import QtCore
-from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import (
     QHBoxLayout,
     QHeaderView,
-    QListWidget,
+    QListView,
     QMessageBox,
     QPushButton,
     QSplitter,
@@ -18,13 +15,65 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from sonaris.defaults import MONITOR_FILE
-from sonaris.frontend.managers.device import DeviceManager
+from sonaris.defaults import MONITOR_EVENTS_IN_VIEW, MONITOR_FILE, MONITOR_PAGE_SIZE
+from sonaris.frontend.managers.device import DeviceManager, DeviceSnapshot
+from sonaris.frontend.managers.health import get_health_poller
 from sonaris.utils import log as logutils
+from sonaris.utils.eventlog import EventLog
 
 logger = logutils.get_logger()
 
 
+class EventListModel(QtCore.QAbstractListModel):
+    """
+    Monitor events in chronological order, newest last. New events beyond `capacity`
+    drop the oldest rows, pages of older events loaded on request raise the capacity by
+    their size so they stay visible.
+    """
+
+    def __init__(self, capacity: int = MONITOR_EVENTS_IN_VIEW, parent=None):
+        super().__init__(parent)
+        self.capacity = capacity
+        self.events: List[Dict[str, Any]] = []
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.events)
+
+    def data(self, index: QtCore.QModelIndex, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        event = self.events[index.row()]
+        return f"[{event.get('timestamp')}] - {event.get('description')}"
+
+    def set_events(self, events: Iterable[Dict[str, Any]]) -> None:
+        self.beginResetModel()
+        self.events = list(events)[-self.capacity :]
+        self.endResetModel()
+
+    def append_event(self, event: Dict[str, Any]) -> None:
+        row = len(self.events)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self.events.append(event)
+        self.endInsertRows()
+        excess = len(self.events) - self.capacity
+        if excess > 0:
+            self.beginRemoveRows(QtCore.QModelIndex(), 0, excess - 1)
+            del self.events[:excess]
+            self.endRemoveRows()
+
+    def prepend_events(self, events: List[Dict[str, Any]]) -> None:
+        """Inserts older events, given oldest first, above the current rows."""
+        if not events:
+            return
+        self.capacity += len(events)
+        self.beginInsertRows(QtCore.QModelIndex(), 0, len(events) - 1)
+        self.events[:0] = events
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        self.set_events([])
+
+
 class DeviceMonitorWidget(QWidget):
     def __init__(
         self,
@@ -35,11 +84,12 @@ class DeviceMonitorWidget(QWidget):
         super().__init__(parent)
         self.device_managers = device_managers  # Dictionary of device managers
         self.monitor_logs = monitor_logs or MONITOR_FILE
+        self.event_log = EventLog.open(self.monitor_logs)
         self.device_statuses = {
             device_name: False for device_name in self.device_managers.keys()
         }
         self.initUI()
-        self.setup_refresh_timer()
+        self.setup_pollers()
         self.load_event_log()
 
     def initUI(self):
@@ -61,9 +111,16 @@ class DeviceMonitorWidget(QWidget):
         # Right Side Widget and Layout
         self.rightWidget = QWidget()
         self.rightLayout = QVBoxLayout(self.rightWidget)
-        self.event_log_list = QListWidget()
+        self.event_model = EventListModel(parent=self)
+        self.event_log_list = QListView()
+        self.event_log_list.setModel(self.event_model)
+        self.event_log_list.setUniformItemSizes(True)
         self.rightLayout.addWidget(self.event_log_list)
 
+        self.load_older_button = QPushButton("Load Older Events")
+        self.load_older_button.clicked.connect(self.load_older_events)
+        self.rightLayout.addWidget(self.load_older_button)
+
         self.splitter.addWidget(self.leftWidget)
         self.splitter.addWidget(self.rightWidget)
 
@@ -75,19 +132,32 @@ class DeviceMonitorWidget(QWidget):
         self.mainLayout = QHBoxLayout(self)
         self.mainLayout.addWidget(self.splitter)
 
-    def setup_refresh_timer(self):
-        self.refresh_timer = QTimer(self)
-        self.refresh_timer.timeout.connect(self.update_device_statuses)
-        self.refresh_timer.start(1000)  # Refresh every 1 second
+    def setup_pollers(self):
+        # Statuses come from the shared background pollers, never from the GUI thread
+        self.pollers = {
+            device_name: get_health_poller(manager)
+            for device_name, manager in self.device_managers.items()
+        }
+        for poller in self.pollers.values():
+            poller.snapshotUpdated.connect(self.update_device_statuses)
+        self.update_device_statuses()
 
     def load_event_log(self):
-
-        event_log = logutils.load_json_with_backup(self.monitor_logs)
-
-        for event in event_log:
-            self.event_log_list.addItem(
-                f"[{event['timestamp']}] - {event['description']}"
-            )
+        # Only the newest page is read, older events are loaded on request
+        events = self.event_log.read_page(0, MONITOR_PAGE_SIZE)
+        self.event_model.set_events(reversed(events))
+        self.event_log_list.scrollToBottom()
+        self.update_load_older_button()
+
+    def load_older_events(self):
+        older = self.event_log.read_page(self.event_model.rowCount(), MONITOR_PAGE_SIZE)
+        self.event_model.prepend_events(list(reversed(older)))
+        self.update_load_older_button()
+
+    def update_load_older_button(self):
+        self.load_older_button.setEnabled(
+            self.event_model.rowCount() < len(self.event_log)
+        )
 
     def clear_event_log(self):
         # Confirmation message box
@@ -102,9 +172,9 @@ class DeviceMonitorWidget(QWidget):
         # Check if the user confirmed the action
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                self.event_log_list.clear()
-                with open(self.monitor_logs, "w") as file:
-                    json.dump([], file, indent=4)
+                self.event_log.clear()
+                self.event_model.clear()
+                self.update_load_older_button()
                 QMessageBox.information(
                     self, "Success", "The monitoring logs has been cleared."
                 )
@@ -112,28 +182,20 @@ class DeviceMonitorWidget(QWidget):
                 QMessageBox.critical(self, "Error", f"Could not clear the archive. {e}")
 
     def log_event(self, description: str):
-        timestamp = datetime.now().isoformat()
         logger.info(f"[Monitor]: {description}")
-        event = {"timestamp": timestamp, "description": description}
-        if not self.monitor_logs.exists():
-            with open(self.monitor_logs, "w") as file:
-                json.dump([event], file, indent=4)
-        else:
-            with open(self.monitor_logs, "r+") as file:
-                event_log = json.load(file)
-                event_log.append(event)
-                file.seek(0)
-                json.dump(event_log, file, indent=4)
-        self.event_log_list.addItem(f"[{timestamp}] - {description}")
-
-    def update_device_statuses(self):
-        self.status_table.setRowCount(len(self.device_managers))
-        for row, (device_name, manager) in enumerate(self.device_managers.items()):
-            self.update_device_status(device_name, manager, row)
- 
-    def update_device_status(self, device_name: str, manager: DeviceManager, row: int):
+        event = self.event_log.append(description)
+        self.event_model.append_event(event)
+        self.update_load_older_button()
+
+    def update_device_statuses(self, snapshot: DeviceSnapshot = None):
+        self.status_table.setRowCount(len(self.pollers))
+        for row, (device_name, poller) in enumerate(self.pollers.items()):
+            if poller.snapshot is not None:
+                self.update_device_status(device_name, poller.snapshot, row)
+
+    def update_device_status(self, device_name: str, snapshot: DeviceSnapshot, row: int):
         try:
-            is_alive = manager.is_device_alive()
+            is_alive = snapshot.alive
             if is_alive and self.device_statuses[device_name] != is_alive:
                 self.log_event(f"{device_name} Connected")
             elif not is_alive and self.device_statuses[device_name] != is_alive:
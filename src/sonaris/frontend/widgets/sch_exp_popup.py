@@ -1,4 +1,3 @@
-from datetime import datetime, timedelta
 from typing import Callable
 
 from PyQt6 import QtCore
@@ -16,7 +15,7 @@ from PyQt6.QtWidgets import (
 from sonaris.defaults import DELAY_KEYWORD, EXPERIMENT_KEYWORD
 from sonaris.frontend.widgets.sch_experiments import ExperimentConfiguration
 from sonaris.scheduler.timekeeper import Timekeeper
-from sonaris.tasks.task_validator import Validator
+from sonaris.tasks.compiler import compile_experiment
 from sonaris.tasks.tasks import TaskName, get_tasks
 from sonaris.utils.log import get_logger
 
@@ -109,32 +108,19 @@ class ExperimentConfigPopup(QDialog):
         """
         Commits the experiment configuration to schedule tasks based on the user's input.
         """
-        steps = self.experiment_config.getConfiguration().steps
-
-        for step in steps:
-            step_delay = timedelta(seconds=step.delay if step.delay else 0.0)
-            task_str: str = step.task
-            parameters = step.parameters
-            task_name_str = Validator.get_task_enum_value(task_str, self.task_enum)
-            # Assuming 'TaskName' can resolve both names and values to an Enum member
-            if not Validator.is_in_enum(task_str.strip(), self.task_enum):
-                QMessageBox.critical(
-                    self, "Error Scheduling Task", f"Unknown task: '{task_name_str}'"
-                )
-                logger.error(f"Unknown task: '{task_name_str}'")
-                return
-            schedule_time = datetime.now() + step_delay
-            try:
-                # Schedule the task with timekeeper
-                self.timekeeper.add_job(task_name_str, schedule_time, kwargs=parameters)
-            except Exception as e:
-                QMessageBox.critical(
-                    self,
-                    "Error Scheduling Task",
-                    f"Failed to schedule '{task_name_str}': {e}",
-                )
-                logger.error(f"Unknown task: '{task_name_str}: {e}'")
-                return  # Stop scheduling further tasks on error
+        experiment = self.experiment_config.getConfiguration()
+        try:
+            # One runner thread executes the whole experiment on a monotonic timeline
+            plan = compile_experiment(experiment, self.task_dict, self.task_enum)
+            self.timekeeper.run_experiment(plan)
+        except Exception as e:
+            QMessageBox.critical(
+                self,
+                "Error Scheduling Experiment",
+                f"Failed to schedule experiment: {e}",
+            )
+            logger.error(f"Failed to schedule experiment: {e}")
+            return
 
         self.callback()  # Trigger any post-scheduling actions
         super().accept()
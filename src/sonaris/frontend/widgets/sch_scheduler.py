@@ -1,29 +1,242 @@
-import json
-from typing import Callable
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
 
 from PyQt6 import QtCore
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QHeaderView,
     QLabel,
     QMessageBox,
     QPushButton,
     QSplitter,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from sonaris import factory
+from sonaris.defaults import ARCHIVE_PAGE_SIZE
 from sonaris.frontend.widgets.sch_exp_popup import ExperimentConfigPopup
 from sonaris.frontend.widgets.sch_task_popup import TaskConfigPopup, TaskDetailsDialog
+from sonaris.scheduler.events import JobEvent, JobEventType
 from sonaris.scheduler.timekeeper import Timekeeper
-from sonaris.utils import log as logutils
 from sonaris.utils.log import get_logger
 
 logger = get_logger()
 
 
+class JobEventRelay(QtCore.QObject):
+    """
+    Timekeeper event subscriber that re-emits the job events as a signal. Events are
+    delivered on the event bus thread, the queued connection hands them to the models
+    on the GUI thread.
+    """
+
+    jobEvent = QtCore.pyqtSignal(object)
+
+    def __call__(self, event: JobEvent) -> None:
+        self.jobEvent.emit(event)
+
+
+class JobsTableModel(QtCore.QAbstractTableModel):
+    """Scheduled jobs of the Timekeeper, updated row by row from its job events."""
+
+    HEADERS = ["Job ID", "Task Name", "Scheduled Time", "Parameters"]
+
+    def __init__(self, timekeeper: Timekeeper, parent=None):
+        super().__init__(parent)
+        self.timekeeper = timekeeper
+        self.job_ids: List[str] = []
+        self.rows: List[List[str]] = []
+        self.reload()
+
+    @staticmethod
+    def format_row(job_id: str, job_info: Dict[str, Any]) -> List[str]:
+        return [
+            job_id,
+            job_info["task"],
+            job_info["schedule_time"],
+            str(job_info.get("kwargs", {})),
+        ]
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        return self.rows[index.row()][index.column()]
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if (
+            role == QtCore.Qt.ItemDataRole.DisplayRole
+            and orientation == QtCore.Qt.Orientation.Horizontal
+        ):
+            return self.HEADERS[section]
+        return None
+
+    def job_at(self, row: int) -> str:
+        return self.job_ids[row]
+
+    def reload(self) -> None:
+        self.beginResetModel()
+        jobs = self.timekeeper.get_jobs()
+        self.job_ids = list(jobs)
+        self.rows = [self.format_row(job_id, jobs[job_id]) for job_id in self.job_ids]
+        self.endResetModel()
+
+    def apply_event(self, event: JobEvent) -> None:
+        """Applies one Timekeeper job event to the affected row."""
+        if event.type not in (
+            JobEventType.SUBMITTED,
+            JobEventType.UPDATED,
+            JobEventType.REMOVED,
+        ):
+            return
+        job_id, job_info = event.job_id, event.job
+        row = self.job_ids.index(job_id) if job_id in self.job_ids else None
+        if event.type == JobEventType.REMOVED:
+            if row is not None:
+                self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+                del self.job_ids[row]
+                del self.rows[row]
+                self.endRemoveRows()
+        elif row is not None:
+            self.rows[row] = self.format_row(job_id, job_info)
+            self.dataChanged.emit(
+                self.index(row, 0), self.index(row, len(self.HEADERS) - 1)
+            )
+        else:
+            row = len(self.rows)
+            self.beginInsertRows(QtCore.QModelIndex(), row, row)
+            self.job_ids.append(job_id)
+            self.rows.append(self.format_row(job_id, job_info))
+            self.endInsertRows()
+
+
+class ArchiveTableModel(QtCore.QAbstractTableModel):
+    """
+    Finished jobs newest first. Only the loaded pages are kept, the view fetches older
+    pages as it is scrolled, each page continuing after the last loaded job, so jobs
+    archived meanwhile neither repeat nor skip rows. Newly archived jobs are inserted at
+    the position the archive order gives them.
+
+    Args:
+        timekeeper (Timekeeper): Source of the archived jobs.
+        page_size (int): Jobs read from the archive per page.
+    """
+
+    HEADERS = ["Result", "Task", "Job ID"]
+
+    def __init__(
+        self, timekeeper: Timekeeper, page_size: int = ARCHIVE_PAGE_SIZE, parent=None
+    ):
+        super().__init__(parent)
+        self.timekeeper = timekeeper
+        self.page_size = page_size
+        self.job_ids: List[str] = []
+        self.rows: List[List[str]] = []
+        # Archive order key of each row, see `JobStore.archive_key`
+        self.keys: List[Optional[tuple]] = []
+        self.total = 0
+        self.reload()
+
+    @staticmethod
+    def format_row(job_id: str, job_info: Dict[str, Any]) -> List[str]:
+        return [
+            "OK" if job_info.get("result", False) else "ERR",
+            job_info.get("task", ""),
+            job_id,
+        ]
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        return self.rows[index.row()][index.column()]
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if (
+            role == QtCore.Qt.ItemDataRole.DisplayRole
+            and orientation == QtCore.Qt.Orientation.Horizontal
+        ):
+            return self.HEADERS[section]
+        return None
+
+    def job_at(self, row: int) -> str:
+        return self.job_ids[row]
+
+    def reload(self) -> None:
+        self.beginResetModel()
+        self.job_ids, self.rows, self.keys = [], [], []
+        self.total = self.timekeeper.count_archive()
+        self.endResetModel()
+        self.fetchMore()
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()) -> bool:
+        return not parent.isValid() and len(self.rows) < self.total
+
+    def fetchMore(self, parent=QtCore.QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+        after = self.job_ids[-1] if self.job_ids else None
+        page = self.timekeeper.get_archive(limit=self.page_size, after=after)
+        if not page:
+            # Older segments were rotated out of the archive
+            self.total = len(self.rows)
+            return
+        first = len(self.rows)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(page) - 1)
+        for job_id, job_info in page.items():
+            self.job_ids.append(job_id)
+            self.rows.append(self.format_row(job_id, job_info))
+            self.keys.append(self.timekeeper.archive_key(job_id, job_info))
+        self.endInsertRows()
+
+    def insert_position(self, key: Optional[tuple]) -> int:
+        """Row of a newly archived job, on top unless the archive is sorted by key."""
+        if key is None:
+            return 0
+        return next(
+            (row for row, other in enumerate(self.keys) if other < key), len(self.keys)
+        )
+
+    def apply_event(self, event: JobEvent) -> None:
+        """Applies one Timekeeper job event, archived jobs are inserted in order."""
+        if event.type == JobEventType.CLEARED:
+            self.reload()
+        elif event.type == JobEventType.ARCHIVED:
+            job_id, job_info = event.job_id, event.job
+            if job_id in self.job_ids:
+                # Re-archived, e.g. the summary of a cancelled recurring job
+                row = self.job_ids.index(job_id)
+                self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+                del self.job_ids[row]
+                del self.rows[row]
+                del self.keys[row]
+                self.endRemoveRows()
+                self.total -= 1
+            key = self.timekeeper.archive_key(job_id, job_info)
+            row = self.insert_position(key)
+            unloaded = self.canFetchMore()
+            self.total += 1
+            if row == len(self.rows) and unloaded:
+                return  # Belongs to a page not loaded yet, fetched with it
+            self.beginInsertRows(QtCore.QModelIndex(), row, row)
+            self.job_ids.insert(row, job_id)
+            self.rows.insert(row, self.format_row(job_id, job_info))
+            self.keys.insert(row, key)
+            self.endInsertRows()
+
+
 class SchedulerWidget(QWidget):
     def __init__(self, timekeeper: Timekeeper = None, root_callback: Callable = None):
         super().__init__()
@@ -34,6 +247,16 @@ class SchedulerWidget(QWidget):
         )
         self.timekeeper.set_callback(self.popup_callback)
         self.root_callback = root_callback
+        self.jobs_model = JobsTableModel(self.timekeeper, self)
+        self.archive_model = ArchiveTableModel(self.timekeeper, parent=self)
+        self.relay = JobEventRelay(self)
+        self.relay.jobEvent.connect(self.jobs_model.apply_event)
+        self.relay.jobEvent.connect(self.archive_model.apply_event)
+        self.relay.jobEvent.connect(self.update_finished_jobs_label)
+        subscription = self.timekeeper.events.subscribe(self.relay)
+        self.destroyed.connect(
+            partial(self.timekeeper.events.unsubscribe, subscription)
+        )
         self.initUI()
 
     def initUI(self):
@@ -48,15 +271,14 @@ class SchedulerWidget(QWidget):
         self.jobsLabel = QLabel("Current Jobs:", leftWidget)
         leftLayout.addWidget(self.jobsLabel)
 
-        # Create the table with 4 columns
-        self.jobsTable = QTableWidget(0, 4, leftWidget)
-        self.jobsTable.setHorizontalHeaderLabels(
-            ["Job ID", "Task Name", "Scheduled Time", "Parameters"]
-        )
+        self.jobsTable = QTableView(leftWidget)
+        self.jobsTable.setModel(self.jobs_model)
         self.jobsTable.horizontalHeader().setSectionResizeMode(
             QHeaderView.ResizeMode.Stretch
         )
-        self.update_jobs_table()
+        self.jobsTable.setSelectionBehavior(
+            QAbstractItemView.SelectionBehavior.SelectRows
+        )
         leftLayout.addWidget(self.jobsTable)
 
         # Button to configure a job
@@ -83,26 +305,31 @@ class SchedulerWidget(QWidget):
         self.finishedJobsLabel = QLabel("Finished Jobs:", rightWidget)
         rightLayout.addWidget(self.finishedJobsLabel)
 
-        self.finishedJobsTable = QTableWidget(rightWidget)
-        self.finishedJobsTable.setColumnCount(
-            3
-        )  # Assuming you have 3 columns: Result, Task, Job ID
-        self.finishedJobsTable.setHorizontalHeaderLabels(["Result", "Task", "Job ID"])
+        # The model fetches older pages as the view is scrolled down
+        self.finishedJobsTable = QTableView(rightWidget)
+        self.finishedJobsTable.setModel(self.archive_model)
         self.finishedJobsTable.horizontalHeader().setSectionResizeMode(
             QHeaderView.ResizeMode.Stretch
         )
+        self.finishedJobsTable.verticalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Fixed
+        )
         self.finishedJobsTable.setSelectionBehavior(
-            QTableWidget.SelectionBehavior.SelectRows
+            QAbstractItemView.SelectionBehavior.SelectRows
         )
         self.finishedJobsTable.setSelectionMode(
-            QTableWidget.SelectionMode.SingleSelection
+            QAbstractItemView.SelectionMode.SingleSelection
         )
 
-        self.finishedJobsTable.cellDoubleClicked.connect(self.show_archive_entry)
+        self.finishedJobsTable.doubleClicked.connect(self.show_archive_entry)
 
-        self.update_finished_jobs_list()
+        self.update_finished_jobs_label()
         rightLayout.addWidget(self.finishedJobsTable)
 
+        self.loadMoreButton = QPushButton("Load Older Jobs", rightWidget)
+        self.loadMoreButton.clicked.connect(self.load_more_finished_jobs)
+        rightLayout.addWidget(self.loadMoreButton)
+
         self.clearFinishedJobsButton = QPushButton("Clear Archive", rightWidget)
         self.clearFinishedJobsButton.clicked.connect(self.clear_finished_jobs)
         rightLayout.addWidget(self.clearFinishedJobsButton)
@@ -118,75 +345,50 @@ class SchedulerWidget(QWidget):
         mainLayout.addWidget(splitter)
 
     def update_jobs_table(self):
-        self.jobsTable.setRowCount(0)
-        jobs = self.timekeeper.get_jobs()
-        for job_id, job_info in jobs.items():
-            row_position = self.jobsTable.rowCount()
-            self.jobsTable.insertRow(row_position)
-
-            # Create QTableWidgetItem for each entry and set it to non-editable
-            job_id_item = QTableWidgetItem(job_id)
-            job_id_item.setFlags(
-                job_id_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
-            )
-            self.jobsTable.setItem(row_position, 0, job_id_item)
-
-            task_name_item = QTableWidgetItem(job_info["task"])
-            task_name_item.setFlags(
-                task_name_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
-            )
-            self.jobsTable.setItem(row_position, 1, task_name_item)
-
-            schedule_time_item = QTableWidgetItem(job_info["schedule_time"])
-            schedule_time_item.setFlags(
-                schedule_time_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
-            )
-            self.jobsTable.setItem(row_position, 2, schedule_time_item)
-
-            parameters_item = QTableWidgetItem(str(job_info["kwargs"]))
-            parameters_item.setFlags(
-                parameters_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
-            )
-            self.jobsTable.setItem(row_position, 3, parameters_item)
+        # Full reload, the model otherwise follows the Timekeeper events
+        self.jobs_model.reload()
 
     def remove_selected_job(self):
-        selected_items = self.jobsTable.selectedItems()
-        if selected_items:
-            selected_row = selected_items[0].row()
-            job_id = self.jobsTable.item(selected_row, 0).text()
+        selected_indexes = self.jobsTable.selectionModel().selectedIndexes()
+        if selected_indexes:
+            job_id = self.jobs_model.job_at(selected_indexes[0].row())
+            run_id = self.timekeeper.get_job(job_id).get("experiment")
             try:
-                self.timekeeper.cancel_job(job_id)
-                self.update_jobs_table()
+                if run_id is not None:
+                    self.cancel_experiment_step(job_id, run_id)
+                else:
+                    self.timekeeper.cancel_job(job_id)
             except Exception as e:
                 logger.info(f"Error removing job {job_id}: {e}")
         else:
             logger.info("No job selected")
 
-    def update_finished_jobs_list(self):
-        self.finishedJobsTable.setRowCount(0)  # Clear the existing rows in the table
-        finished_jobs = logutils.load_json_with_backup(self.timekeeper.archive)
-
-        for job_id, job_info in finished_jobs.items():
-            row_position = self.finishedJobsTable.rowCount()
-            self.finishedJobsTable.insertRow(row_position)
+    def cancel_experiment_step(self, job_id: str, run_id: str):
+        reply = QMessageBox.question(
+            self,
+            "Cancel Experiment",
+            f"Job {job_id} is a step of experiment {run_id}. Cancel all of its "
+            "pending steps? Choose No to remove only this step.",
+            QMessageBox.StandardButton.Yes
+            | QMessageBox.StandardButton.No
+            | QMessageBox.StandardButton.Cancel,
+            QMessageBox.StandardButton.Cancel,
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.timekeeper.cancel_experiment(run_id)
+        elif reply == QMessageBox.StandardButton.No:
+            self.timekeeper.cancel_job(job_id)
 
-            result_item = QTableWidgetItem(
-                "OK" if job_info.get("result", False) else "ERR"
-            )
-            task_item = QTableWidgetItem(job_info.get("task", ""))
-            job_id_item = QTableWidgetItem(job_id)
+    def update_finished_jobs_list(self):
+        self.archive_model.reload()
+        self.update_finished_jobs_label()
 
-            result_item.setFlags(
-                result_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
-            )
-            task_item.setFlags(task_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable)
-            job_id_item.setFlags(
-                job_id_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
-            )
+    def update_finished_jobs_label(self, *args):
+        self.finishedJobsLabel.setText(f"Finished Jobs ({self.archive_model.total}):")
 
-            self.finishedJobsTable.setItem(row_position, 0, result_item)
-            self.finishedJobsTable.setItem(row_position, 1, task_item)
-            self.finishedJobsTable.setItem(row_position, 2, job_id_item)
+    def load_more_finished_jobs(self):
+        # Older jobs are read page by page, only when asked for
+        self.archive_model.fetchMore()
 
     def clear_finished_jobs(self):
         # Confirmation message box
@@ -202,7 +404,6 @@ class SchedulerWidget(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 self.timekeeper.clear_archive()
-                self.update_finished_jobs_list()
                 QMessageBox.information(
                     self, "Success", "The archive has been cleared."
                 )
@@ -216,26 +417,20 @@ class SchedulerWidget(QWidget):
         self.experiment_popup.exec()
 
     def popup_callback(self):
-        self.update_jobs_table()
-        self.update_finished_jobs_list()
+        # The tables follow the Timekeeper events, only the tick is relayed
         if self.root_callback is not None:
             # Relay tick to main app.
             self.root_callback()
 
-    def show_archive_entry(self, row, column):
-        job_id_item = self.finishedJobsTable.item(
-            row, 2
-        )  # Assuming Job ID is in the 3rd column
-        if job_id_item:
-            job_id = job_id_item.text()
+    def show_archive_entry(self, index: QtCore.QModelIndex):
+        if index.isValid():
+            job_id = self.archive_model.job_at(index.row())
             try:
-                with self.timekeeper.archive.open("r") as file:
-                    finished_jobs = json.load(file)
-                job_details = finished_jobs.get(job_id, {})
+                job_details = self.timekeeper.get_archived_job(job_id)
                 if job_details:
                     dialog = TaskDetailsDialog(job_details, self)
                     dialog.exec()
-            except FileNotFoundError:
+            except Exception as e:
                 QMessageBox.warning(
-                    self, "Error", "File not found. Could not retrieve job details."
+                    self, "Error", f"Could not retrieve job details. {e}"
                 )
@@ -0,0 +1,139 @@
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from sonaris.utils.jsonl import JSONLinesLog
+
+
+class ArchiveLog(JSONLinesLog):
+    """
+    Append-only JSON Lines log of finished jobs, stored in rotated `JSONLinesLog`
+    segments. Each line holds one job, appending never reads or rewrites earlier
+    entries.
+
+    The newest `tail_size` entries are indexed in memory, so refreshes of recent
+    entries and lookups of recently finished jobs do not touch the disk at all.
+
+    A job archived again, e.g. after a rerun, appends another line. Reads return only
+    its newest entry and `len` counts jobs, not lines.
+
+    Args:
+        path (Path): Active log file, e.g. archive.jsonl.
+        max_bytes (int): Size at which the active file is rotated.
+        backups (int): Number of rotated segments kept.
+        tail_size (int): Number of newest entries kept in memory.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = 10 * 1024 * 1024,
+        backups: int = 5,
+        tail_size: int = 1000,
+    ):
+        super().__init__(path, max_bytes, backups)
+        self.tail_size = tail_size
+        # job_id -> job_info of the newest entries, oldest first
+        self.tail: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # job_id -> number of its lines in the log, its length is the number of jobs
+        self.entries: Counter = Counter()
+        self.load()
+
+    def load(self) -> None:
+        """Counts the entries and fills the tail index, reading each file once."""
+        with self.lock:
+            self.tail.clear()
+            self.entries.clear()
+            for path in reversed(self.segments()):
+                for job_id, job_info in self.read_jobs(path):
+                    self.entries[job_id] += 1
+                    self.remember(job_id, job_info)
+
+    def decode(self, line: bytes) -> Optional[Dict[str, Any]]:
+        entry = super().decode(line)
+        return entry if entry is not None and "job_id" in entry else None
+
+    def read_jobs(self, path: Path) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for entry in self.read_segment(path):
+            yield entry.pop("job_id"), entry
+
+    def newest_jobs(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for entry in self.newest_entries():
+            yield entry.pop("job_id"), entry
+
+    def remember(self, job_id: str, job_info: Dict[str, Any]) -> None:
+        self.tail.pop(job_id, None)
+        self.tail[job_id] = job_info
+        while len(self.tail) > self.tail_size:
+            self.tail.popitem(last=False)
+
+    def append(self, job_id: str, job_info: Dict[str, Any]) -> None:
+        with self.lock:
+            self.write({"job_id": job_id, **job_info})
+            self.entries[job_id] += 1
+            self.remember(job_id, job_info)
+            self.rotate_if_full()
+
+    def dropped(self, path: Path) -> None:
+        # Drops the jobs left without any line
+        self.entries -= Counter(job_id for job_id, _ in self.read_jobs(path))
+
+    def read_page(
+        self, offset: int = 0, limit: int = None, after: str = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns archived jobs newest first.
+
+        Args:
+            offset (int): Number of newest entries to skip.
+            limit (int, optional): Maximum number of entries, all remaining if None.
+            after (str, optional): Start right after this job, `offset` then counts from
+                there. Empty if the job is no longer archived.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: job_id -> job_info, newest first.
+        """
+        with self.lock:
+            newest = list(reversed(self.tail))
+            if after is not None and after in self.tail:
+                offset += newest.index(after) + 1
+                after = None
+            end = None if limit is None else offset + limit
+            if after is None and end is not None and end <= len(newest):
+                return {job_id: self.tail[job_id] for job_id in newest[offset:end]}
+            # Page reaches past the in-memory tail, walk the segments newest first
+            page: Dict[str, Dict[str, Any]] = {}
+            seen = set()  # A re-archived job only counts with its newest entry
+            position = 0
+            for job_id, job_info in self.newest_jobs():
+                if job_id in seen:
+                    continue
+                seen.add(job_id)
+                if after is not None:
+                    if job_id == after:
+                        after = None  # The page starts with the next job
+                    continue
+                if position >= offset:
+                    page[job_id] = job_info
+                    if end is not None and position + 1 >= end:
+                        return page
+                position += 1
+            return page
+
+    def get(self, job_id: str) -> Dict[str, Any]:
+        with self.lock:
+            if job_id in self.tail:
+                return self.tail[job_id]
+            for entry_id, job_info in self.newest_jobs():
+                if entry_id == job_id:
+                    return job_info
+            return {}
+
+    def clear(self) -> None:
+        with self.lock:
+            super().clear()
+            self.tail.clear()
+            self.entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -0,0 +1,32 @@
+import threading
+import time
+
+from sonaris.defaults import SPIN_THRESHOLD
+
+
+def wait_until(
+    deadline: float, stop: threading.Event = None, spin: float = SPIN_THRESHOLD
+) -> bool:
+    """
+    Blocks until `deadline` on the `time.monotonic` clock. The thread sleeps while the
+    deadline is further away than `spin` and busy-waits for the remainder, so wake-up
+    accuracy is not bound by the OS timer resolution.
+
+    Args:
+        deadline (float): Target time in seconds of `time.monotonic`.
+        stop (threading.Event, optional): Aborts the wait when set.
+        spin (float): Seconds before the deadline at which sleeping turns into spinning.
+
+    Returns:
+        bool: True once the deadline is reached, False if the wait was aborted.
+    """
+    stop = stop or threading.Event()
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return not stop.is_set()
+        if remaining > spin:
+            if stop.wait(remaining - spin):
+                return False
+        elif stop.is_set():
+            return False
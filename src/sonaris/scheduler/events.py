@@ -0,0 +1,166 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional
+
+from sonaris.utils.log import get_logger
+from sonaris.utils.metrics import get_metrics
+
+logger = get_logger()
+
+JOB_EVENTS = get_metrics().counter(
+    "sonaris_job_events_total", "Published job lifecycle events by type."
+)
+
+
+class JobEventType(Enum):
+    # Lifecycle of a job
+    SUBMITTED = "submitted"  # Recorded and persisted by the Timekeeper
+    SCHEDULED = "scheduled"  # Handed to the worker
+    STARTED = "started"  # Task began executing
+    SUCCEEDED = "succeeded"  # Task returned
+    FAILED = "failed"  # Task raised or is not registered
+    CANCELLED = "cancelled"  # Removed from the worker before it ran
+    # Bookkeeping of the scheduled and archived jobs
+    UPDATED = "updated"  # A recurring job recorded another run
+    ARCHIVED = "archived"
+    REMOVED = "removed"  # No longer scheduled, after it finished or was cancelled
+    CLEARED = "cleared"  # The archive was emptied, job_id is None
+
+
+# Events after which the scheduled or archived jobs read back differently
+CHANGE_EVENTS = frozenset(
+    {
+        JobEventType.SUBMITTED,
+        JobEventType.UPDATED,
+        JobEventType.ARCHIVED,
+        JobEventType.REMOVED,
+        JobEventType.CLEARED,
+    }
+)
+
+
+@dataclass(frozen=True)
+class JobEvent:
+    """
+    One notification of the Timekeeper event bus.
+
+    Attributes:
+        type (JobEventType): What happened.
+        job_id (str): The job, None for `CLEARED`.
+        job (Dict[str, Any]): Copy of the job record at the time of the event.
+        timestamp (float): UNIX time of the event.
+        duration (float): Execution time in seconds, for `SUCCEEDED` and `FAILED`.
+        lateness (float): Seconds between the scheduled and the actual start, for
+            `STARTED` of one-off jobs.
+        error_info (str): Traceback of a `FAILED` job.
+    """
+
+    type: JobEventType
+    job_id: Optional[str] = None
+    job: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+    duration: Optional[float] = None
+    lateness: Optional[float] = None
+    error_info: Optional[str] = None
+
+
+@dataclass
+class Subscription:
+    handler: Callable[[JobEvent], None]
+    types: Optional[FrozenSet[JobEventType]]
+    synchronous: bool
+
+    def accepts(self, event: JobEvent) -> bool:
+        return self.types is None or event.type in self.types
+
+
+class EventBus:
+    """
+    Publish/subscribe of `JobEvent`s. Publishing only puts the event on a queue, a single
+    dispatcher thread then calls the subscribers in publication order, so a slow handler
+    never holds up a worker thread. Synchronous subscribers are called right away on the
+    publishing thread instead, for cheap handlers that must see a change before the call
+    that made it returns, e.g. dropping a cache.
+    """
+
+    def __init__(self):
+        self.subscriptions: List[Subscription] = []
+        self.lock = threading.Lock()
+        self.queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self.thread: Optional[threading.Thread] = None
+
+    def subscribe(
+        self,
+        handler: Callable[[JobEvent], None],
+        types: Iterable[JobEventType] = None,
+        synchronous: bool = False,
+    ) -> Subscription:
+        """
+        Args:
+            handler (Callable[[JobEvent], None]): Called with each matching event.
+            types (Iterable[JobEventType], optional): Event types to receive, all if
+                None.
+            synchronous (bool): Call the handler on the publishing thread.
+
+        Returns:
+            Subscription: Pass to `unsubscribe` to stop the delivery.
+        """
+        subscription = Subscription(
+            handler, frozenset(types) if types is not None else None, synchronous
+        )
+        with self.lock:
+            self.subscriptions.append(subscription)
+            if not synchronous and self.thread is None:
+                self.thread = threading.Thread(
+                    target=self.dispatch, name="JobEventBus", daemon=True
+                )
+                self.thread.start()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self.lock:
+            if subscription in self.subscriptions:
+                self.subscriptions.remove(subscription)
+
+    def publish(self, event: JobEvent) -> None:
+        JOB_EVENTS.inc(type=event.type.value)
+        with self.lock:
+            subscriptions = list(self.subscriptions)
+        if any(not subscription.synchronous for subscription in subscriptions):
+            self.queue.put(event)
+        for subscription in subscriptions:
+            if subscription.synchronous and subscription.accepts(event):
+                self.deliver(subscription, event)
+
+    @staticmethod
+    def deliver(subscription: Subscription, event: JobEvent) -> None:
+        try:
+            subscription.handler(event)
+        except Exception as e:
+            logger.error(
+                f"Job event handler failed on {event.type.value} of {event.job_id}: {e}"
+            )
+
+    def dispatch(self) -> None:
+        while True:
+            event = self.queue.get()
+            if isinstance(event, threading.Event):
+                event.set()  # Marker of `flush`
+                continue
+            with self.lock:
+                subscriptions = list(self.subscriptions)
+            for subscription in subscriptions:
+                if not subscription.synchronous and subscription.accepts(event):
+                    self.deliver(subscription, event)
+
+    def flush(self, timeout: float = None) -> bool:
+        """Waits until the events published so far were delivered, e.g. in tests."""
+        with self.lock:
+            if self.thread is None:
+                return True
+        delivered = threading.Event()
+        self.queue.put(delivered)
+        return delivered.wait(timeout)
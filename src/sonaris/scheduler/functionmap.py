@@ -11,11 +11,15 @@ class FunctionMap:
                                        Defaults to 'function_map.json' in the CONFIG directory.
         """
         self.function_map = function_map
-
+        # identifier -> resolved callable, filled on first use
+        self.resolved: Dict[str, Callable] = {}
+        # callable -> names of its positional parameters, used to bind positional args
+        self.binders: Dict[Callable, Tuple[str, ...]] = {}
 
     def get_function(self, identifier: str) -> Optional[Callable]:
         """
-        Retrieves a function by its identifier.
+        Retrieves a function by its identifier. The module import only happens the
+        first time, afterwards the resolved function is served from the cache.
 
         Args:
             identifier (str): The identifier of the function.
@@ -23,10 +27,15 @@ class FunctionMap:
         Returns:
             Optional[Callable]: The function object if found, otherwise None.
         """
+        func = self.resolved.get(identifier)
+        if func is not None:
+            return func
         if identifier in self.function_map:
             module_name, func_name = self.function_map[identifier]
             module = __import__(module_name, globals(), locals(), [func_name], 0)
-            return getattr(module, func_name)
+            func = getattr(module, func_name)
+            self.resolved[identifier] = func
+            return func
         return None
 
     def add_function(self, identifier: str, func: Callable) -> None:
@@ -37,8 +46,33 @@ class FunctionMap:
             identifier (str): The identifier for the function.
             func (Callable): The function object to add.
         """
-        self.function_map[identifier] = (func.__module__, func.__name__)
-        
+        mapping = (func.__module__, func.__name__)
+        if self.function_map.get(identifier) != mapping:
+            self.invalidate(identifier)
+        self.function_map[identifier] = mapping
+        self.resolved.setdefault(identifier, func)
+
+    def invalidate(self, identifier: str) -> None:
+        """Drops the cached callable of an identifier whose mapping changed."""
+        func = self.resolved.pop(identifier, None)
+        if func is not None:
+            self.binders.pop(func, None)
+
+    def reload(self) -> None:
+        """
+        Clears all cached callables, needed after `function_map` was modified directly
+        instead of through `add_function`.
+        """
+        self.resolved.clear()
+        self.binders.clear()
+
+    def get_binder(self, func: Callable) -> Tuple[str, ...]:
+        arg_names = self.binders.get(func)
+        if arg_names is None:
+            arg_names = func.__code__.co_varnames[: func.__code__.co_argcount]
+            self.binders[func] = arg_names
+        return arg_names
+
     @staticmethod
     def serialize_func(func_data: Tuple[str, str]) -> Dict[str, str]:
         """
@@ -88,12 +122,12 @@ class FunctionMap:
         Returns:
             Any: The result of the function call.
         """
-        args = args if args is not None else ()
         kwargs = kwargs if kwargs is not None else {}
+        if not args:
+            return func(**kwargs)
 
-        # Extract the argument names for the function
-        arg_names = func.__code__.co_varnames[: func.__code__.co_argcount]
-        args_dict = dict(zip(arg_names, args))
+        # Argument names of the function, computed once per function
+        args_dict = dict(zip(self.get_binder(func), args))
 
         # Check for overlapping keys and use values from kwargs if they exist
         for key in args_dict:
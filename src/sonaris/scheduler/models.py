@@ -2,8 +2,8 @@ import json
 from datetime import datetime
 
 from pydantic import BaseModel
-from sqlalchemy import JSON, Boolean, Column, DateTime, String
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import JSON, Boolean, Column, DateTime, Index, String
+from sqlalchemy.orm import declarative_base
 
 
 class JobModel(BaseModel):
@@ -21,12 +21,19 @@ class Job(Base):
     __tablename__ = "jobs"
     job_id = Column(String, primary_key=True)
     task_name = Column(String, index=True)
-    schedule_time = Column(DateTime)
+    schedule_time = Column(DateTime, index=True)
     created = Column(DateTime)
     kwargs = Column(JSON)
     result = Column(Boolean, default=False)
     error_info = Column(String, nullable=True)
     is_archived = Column(Boolean, default=False)  # New column to mark archived jobs
+    # Remaining job fields, e.g. the trigger and run history of recurring jobs
+    details = Column(JSON, nullable=True)
+
+    # Scheduled and archived jobs share the table, lookups are always split by state
+    __table_args__ = (
+        Index("ix_jobs_archived_schedule_time", "is_archived", "schedule_time"),
+    )
 
     # Convert kwargs to and from JSON automatically
     @property
@@ -0,0 +1,196 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+from apscheduler.jobstores.base import ConflictingIdError
+from apscheduler.schedulers import SchedulerNotRunningError
+
+from sonaris.defaults import SPIN_THRESHOLD
+from sonaris.scheduler.clock import wait_until
+from sonaris.utils.log import get_logger
+
+logger = get_logger()
+
+
+class PrecisionScheduler:
+    """
+    Minimal scheduler on the monotonic clock, a drop-in for the subset of APScheduler's
+    `BackgroundScheduler` the Worker uses (`add_job` with a "date" trigger, `get_job`,
+    `remove_job`, `start`, `shutdown`). Recurring jobs re-arm themselves with another
+    date job when they fire, see `Worker.fire_occurrence`.
+
+    Run dates are converted to monotonic deadlines when the job is added, so wall clock
+    adjustments do not move jobs. Pending jobs sit in a heap, a single thread sleeps
+    until shortly before the earliest deadline and spins for the last `spin` seconds.
+    Jobs must return quickly, the Worker only hands them to its executors here.
+
+    Like APScheduler, adding a job under an existing ID raises `ConflictingIdError`
+    unless `replace_existing` is set, and trigger fields the trigger does not support
+    raise `TypeError` instead of being ignored.
+
+    Args:
+        spin (float): Busy-wait window in seconds before each deadline.
+        history (int): Number of firing records kept for `get_firing_errors`.
+    """
+
+    # Fields accepted by each trigger, anything else is rejected
+    TRIGGER_FIELDS = {"date": {"run_date"}}
+
+    def __init__(self, spin: float = SPIN_THRESHOLD, history: int = 1000):
+        self.spin = spin
+        self.heap: List[Tuple[float, int, str]] = []
+        # job_id -> (deadline, func, args)
+        self.jobs: Dict[str, Tuple[float, Callable, tuple]] = {}
+        self.sequence = itertools.count()  # Keeps equal deadlines in submission order
+        self.condition = threading.Condition()
+        self.stop_event = threading.Event()
+        self.thread: threading.Thread = None
+        self.firing_errors = deque(maxlen=history)
+
+    @property
+    def running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def add_job(
+        self,
+        func: Callable,
+        trigger: str = "date",
+        args: tuple = (),
+        id: str = None,
+        replace_existing: bool = False,
+        **trigger_args: Any,
+    ) -> str:
+        """
+        Args:
+            func (Callable): Called with `args` when the job fires.
+            trigger (str): "date", the only trigger supported.
+            args (tuple): Positional arguments of `func`.
+            id (str, optional): Job ID, generated if None.
+            replace_existing (bool): Replace a pending job with the same ID.
+            **trigger_args: "run_date", due at once if omitted.
+
+        Returns:
+            str: The job ID.
+
+        Raises:
+            ConflictingIdError: If a job with the ID is pending and not replaced.
+            TypeError: If a trigger field is not supported by the trigger.
+        """
+        if trigger not in self.TRIGGER_FIELDS:
+            raise ValueError(
+                f"PrecisionScheduler only supports 'date' jobs, got '{trigger}'."
+            )
+        unsupported = set(trigger_args) - self.TRIGGER_FIELDS[trigger]
+        if unsupported:
+            raise TypeError(
+                f"Unsupported {trigger} trigger arguments: {', '.join(sorted(unsupported))}"
+            )
+        run_date = self.to_datetime(trigger_args.get("run_date"))
+        deadline = self.to_deadline(run_date) if run_date else time.monotonic()
+        job_id = id or f"job-{next(self.sequence)}"
+        with self.condition:
+            if job_id in self.jobs and not replace_existing:
+                raise ConflictingIdError(job_id)
+            self.jobs[job_id] = (deadline, func, tuple(args))
+            heapq.heappush(self.heap, (deadline, next(self.sequence), job_id))
+            # The new job may be due before the one the thread is sleeping on
+            self.condition.notify()
+        return job_id
+
+    @staticmethod
+    def to_datetime(value) -> datetime:
+        return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+    @staticmethod
+    def to_deadline(run_date: datetime) -> float:
+        delay = (run_date - datetime.now(run_date.tzinfo)).total_seconds()
+        return time.monotonic() + max(delay, 0.0)
+
+    def get_job(self, job_id: str):
+        """Returns the pending job, None once it fired or was removed."""
+        with self.condition:
+            return self.jobs.get(job_id)
+
+    def remove_job(self, job_id: str) -> None:
+        with self.condition:
+            if self.jobs.pop(job_id, None) is None:
+                raise KeyError(f"No job by the id of {job_id} was found")
+            # The heap entry is skipped lazily once it reaches the top
+            self.condition.notify()
+
+    def get_jobs(self) -> List[str]:
+        with self.condition:
+            return list(self.jobs)
+
+    def start(self) -> None:
+        self.stop_event.clear()
+        self.thread = threading.Thread(
+            target=self.run, name="precision-scheduler", daemon=True
+        )
+        self.thread.start()
+
+    def shutdown(self, wait: bool = True) -> None:
+        if not self.running:
+            raise SchedulerNotRunningError
+        self.stop_event.set()
+        with self.condition:
+            self.condition.notify()
+        if wait:
+            self.thread.join()
+
+    def next_due(self) -> Tuple[float, str]:
+        """Blocks until the earliest job is within the spin window, None on shutdown."""
+        with self.condition:
+            while not self.stop_event.is_set():
+                # Drop entries of removed or re-added jobs
+                while self.heap and (
+                    self.heap[0][2] not in self.jobs
+                    or self.jobs[self.heap[0][2]][0] != self.heap[0][0]
+                ):
+                    heapq.heappop(self.heap)
+                if not self.heap:
+                    self.condition.wait()
+                    continue
+                deadline, _, job_id = self.heap[0]
+                remaining = deadline - time.monotonic()
+                if remaining > self.spin:
+                    self.condition.wait(remaining - self.spin)
+                    continue
+                return deadline, job_id
+        return None
+
+    def run(self) -> None:
+        while True:
+            due = self.next_due()
+            if due is None:
+                return
+            deadline, job_id = due
+            if not wait_until(deadline, self.stop_event, self.spin):
+                return
+            with self.condition:
+                job = self.jobs.get(job_id)
+                if job is None or job[0] != deadline:
+                    continue  # Removed or rescheduled while spinning
+                # Its heap entry is now stale and dropped by `next_due`
+                del self.jobs[job_id]
+                _, func, args = job
+            fired = time.monotonic()
+            self.firing_errors.append((job_id, fired - deadline))
+            logger.debug(f"Job {job_id} fired {(fired - deadline) * 1e3:.3f} ms late.")
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error(f"Job {job_id} raised: {e}")
+
+    def get_firing_errors(self) -> List[Tuple[str, float]]:
+        """
+        Returns the actual minus planned firing time of the most recent jobs.
+
+        Returns:
+            List[Tuple[str, float]]: (job_id, error in seconds), oldest first.
+        """
+        return list(self.firing_errors)
@@ -0,0 +1,136 @@
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+
+from sonaris.scheduler.clock import wait_until
+from sonaris.tasks.compiler import ExperimentPlan, PlanStep
+from sonaris.utils.log import get_logger
+
+logger = get_logger()
+
+
+@dataclass(frozen=True)
+class StepTelemetry:
+    """
+    Timing of one executed plan step, all values in seconds on the monotonic clock.
+
+    Attributes:
+        planned (float): Offset of the step from the plan start.
+        started (float): Measured offset at which the task was called.
+        lateness (float): `started - planned`, the firing error of the step.
+        duration (float): Execution time of the task.
+    """
+
+    index: int
+    task_name: str
+    planned: float
+    started: float
+    lateness: float
+    duration: float
+    result: bool
+    error_info: Optional[str] = None
+
+
+class PlanRunner:
+    """
+    Executes an `ExperimentPlan` on a single thread. Every step fires at an absolute
+    deadline `start + offset` of the monotonic clock, so a late or slow step does not
+    shift the steps after it and timing errors do not accumulate over the plan.
+
+    Args:
+        plan (ExperimentPlan): The compiled plan.
+        execute (Callable): Runs a step, returns (result, error_info), or None if the
+            step was skipped, e.g. cancelled before it was due.
+        on_step (Callable, optional): Called with the step and its StepTelemetry.
+        on_finish (Callable, optional): Called with the runner once it stops.
+    """
+
+    def __init__(
+        self,
+        plan: ExperimentPlan,
+        execute: Callable[[PlanStep], Optional[Tuple[bool, Optional[str]]]],
+        on_step: Callable[[PlanStep, StepTelemetry], None] = None,
+        on_finish: Callable[["PlanRunner"], None] = None,
+    ):
+        self.plan = plan
+        self.execute = execute
+        self.on_step = on_step
+        self.on_finish = on_finish
+        self.telemetry: List[StepTelemetry] = []
+        self.stop_event = threading.Event()
+        self.start_monotonic: float = None
+        self.start_time: datetime = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self) -> "PlanRunner":
+        self.thread.start()
+        return self
+
+    def cancel(self) -> None:
+        """Stops the runner before its next step, a running step is not interrupted."""
+        self.stop_event.set()
+
+    def join(self, timeout: float = None) -> None:
+        self.thread.join(timeout)
+
+    @property
+    def cancelled(self) -> bool:
+        return self.stop_event.is_set()
+
+    def is_alive(self) -> bool:
+        return self.thread.is_alive()
+
+    def run(self) -> None:
+        self.start_time = datetime.now()
+        self.start_monotonic = time.monotonic()
+        try:
+            for step in self.plan.steps:
+                deadline = self.start_monotonic + step.offset
+                if not wait_until(deadline, self.stop_event):
+                    logger.info(f"Plan {self.plan.plan_id} cancelled.")
+                    break
+                started = time.monotonic()
+                try:
+                    outcome = self.execute(step)
+                except Exception as e:
+                    outcome = False, str(e)
+                if outcome is None:
+                    continue  # Skipped, no telemetry
+                result, error_info = outcome
+                finished = time.monotonic()
+                telemetry = StepTelemetry(
+                    index=step.index,
+                    task_name=step.task_name,
+                    planned=step.offset,
+                    started=started - self.start_monotonic,
+                    lateness=started - deadline,
+                    duration=finished - started,
+                    result=result,
+                    error_info=error_info,
+                )
+                self.telemetry.append(telemetry)
+                if self.on_step is not None:
+                    self.on_step(step, telemetry)
+        finally:
+            if self.on_finish is not None:
+                self.on_finish(self)
+
+    def summary(self) -> dict:
+        """
+        Aggregates the step telemetry.
+
+        Returns:
+            dict: Executed step count, mean and max lateness and total drift in seconds.
+        """
+        lateness = [entry.lateness for entry in self.telemetry]
+        return {
+            "plan_id": self.plan.plan_id,
+            "steps": len(self.plan.steps),
+            "executed": len(self.telemetry),
+            "cancelled": self.cancelled,
+            "mean_lateness": sum(lateness) / len(lateness) if lateness else 0.0,
+            "max_lateness": max(lateness, default=0.0),
+            "drift": lateness[-1] if lateness else 0.0,
+        }
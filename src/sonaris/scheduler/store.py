@@ -0,0 +1,399 @@
+import abc
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import (
+    and_,
+    create_engine,
+    delete,
+    event,
+    func,
+    inspect,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.orm import sessionmaker
+
+from sonaris.scheduler.archive import ArchiveLog
+from sonaris.scheduler.models import Base, Job
+from sonaris.utils.log import get_logger, load_json_with_backup
+
+logger = get_logger()
+
+# Job fields with a dedicated column, anything else is kept in `Job.details`
+JOB_COLUMNS = ("task", "created", "schedule_time", "kwargs", "result", "error_info")
+
+
+class JobStore(abc.ABC):
+    """
+    Persistence backend of the Timekeeper. Jobs are exchanged as the dictionaries the
+    Timekeeper keeps in memory: {"task", "created", "schedule_time", "kwargs"} with ISO
+    formatted timestamps, archived jobs additionally carry "result" and "error_info".
+    """
+
+    @abc.abstractmethod
+    def load_jobs(self) -> Dict[str, Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def add_jobs(self, jobs: Dict[str, Dict[str, Any]]) -> None:
+        """Persists all given jobs in one write, either all of them or none."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def remove_jobs(self, job_ids: Iterable[str]) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def archive_job(self, job_id: str, job_info: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_archive(
+        self, offset: int = 0, limit: int = None, after: str = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns archived jobs newest first, paged by `offset` and `limit`. Passing the
+        last job of the previous page as `after` starts the page right after it, so jobs
+        archived meanwhile do not shift the pages.
+        """
+        raise NotImplementedError
+
+    def archive_key(self, job_id: str, job_info: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Sort key of the archive order, `get_archive` returns jobs by descending key.
+        None if the archive is in archiving order, a newly archived job is the newest.
+        """
+        return None
+
+    @abc.abstractmethod
+    def count_archive(self) -> int:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_archived_job(self, job_id: str) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def clear_archive(self) -> None:
+        raise NotImplementedError
+
+    def add_job(self, job_id: str, job_info: Dict[str, Any]) -> None:
+        self.add_jobs({job_id: job_info})
+
+    def remove_job(self, job_id: str) -> None:
+        self.remove_jobs([job_id])
+
+    def find_jobs(
+        self,
+        task_name: str = None,
+        start: datetime = None,
+        end: datetime = None,
+        archived: bool = False,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Looks up jobs by task and schedule time. Stores without indexes filter all jobs
+        in memory, see `SQLiteJobStore.find_jobs`.
+
+        Args:
+            task_name (str, optional): Only jobs of this task.
+            start (datetime, optional): Only jobs scheduled at or after this time.
+            end (datetime, optional): Only jobs scheduled before this time.
+            archived (bool): Search the archive instead of the scheduled jobs.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Matching jobs ordered by schedule time.
+        """
+        jobs = self.get_archive() if archived else self.load_jobs()
+        found = []
+        for job_id, job_info in jobs.items():
+            schedule_time = datetime.fromisoformat(job_info["schedule_time"])
+            if task_name is not None and job_info["task"] != task_name:
+                continue
+            if start is not None and schedule_time < start:
+                continue
+            if end is not None and schedule_time >= end:
+                continue
+            found.append((schedule_time, job_id, job_info))
+        return {
+            job_id: job_info
+            for _, job_id, job_info in sorted(found, key=lambda item: item[:2])
+        }
+
+    def close(self) -> None:
+        pass
+
+
+class JSONJobStore(JobStore):
+    """
+    Stores scheduled jobs in a JSON file, rewritten on every change, and finished jobs in
+    an append-only `ArchiveLog` next to the `archive` path (archive.json becomes
+    archive.jsonl). An existing archive.json is imported into the log once.
+    """
+
+    def __init__(self, persistence_file: Path, archive: Path, **log_options):
+        self.persistence_file = Path(persistence_file)
+        self.archive = Path(archive)
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.lock = threading.RLock()
+        self.archive_log = ArchiveLog(self.archive.with_suffix(".jsonl"), **log_options)
+        if self.archive.suffix != ".jsonl" and self.archive.exists():
+            self.migrate_archive()
+
+    def migrate_archive(self) -> None:
+        entries = load_json_with_backup(self.archive)
+        for job_id, job_info in entries.items():
+            self.archive_log.append(job_id, job_info)
+        if self.archive.exists():
+            self.archive.rename(self.archive.with_name(f"{self.archive.name}.migrated"))
+        logger.info(f"Migrated {len(entries)} archived jobs to {self.archive_log.path}")
+
+    def load_jobs(self) -> Dict[str, Dict[str, Any]]:
+        with self.lock:
+            try:
+                with open(self.persistence_file, "r") as file:
+                    self.jobs = json.load(file)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self.jobs = {}
+            return dict(self.jobs)
+
+    def save_jobs(self) -> None:
+        with open(self.persistence_file, "w") as file:
+            json.dump(self.jobs, file, indent=4)
+
+    def add_jobs(self, jobs: Dict[str, Dict[str, Any]]) -> None:
+        with self.lock:
+            self.jobs.update(jobs)
+            self.save_jobs()
+
+    def remove_jobs(self, job_ids: Iterable[str]) -> None:
+        with self.lock:
+            for job_id in job_ids:
+                self.jobs.pop(job_id, None)
+            self.save_jobs()
+
+    def archive_job(self, job_id: str, job_info: Dict[str, Any]) -> None:
+        self.archive_log.append(job_id, job_info)
+
+    def get_archive(
+        self, offset: int = 0, limit: int = None, after: str = None
+    ) -> Dict[str, Dict[str, Any]]:
+        return self.archive_log.read_page(offset, limit, after)
+
+    def count_archive(self) -> int:
+        return len(self.archive_log)
+
+    def get_archived_job(self, job_id: str) -> Dict[str, Any]:
+        return self.archive_log.get(job_id)
+
+    def clear_archive(self) -> None:
+        self.archive_log.clear()
+
+
+class SQLiteJobStore(JobStore):
+    """
+    Stores jobs as rows of the `Job` model in an SQLite database running in WAL mode.
+    Every operation touches only the affected rows, archiving flips `is_archived` on the
+    job's row, so the cost per job does not grow with the size of the archive.
+
+    Args:
+        database (Path): Path to the SQLite database file.
+        legacy_jobs (Path, optional): jobs.json of the JSON backend to import once.
+        legacy_archive (Path, optional): archive.json of the JSON backend to import once.
+    """
+
+    def __init__(
+        self, database: Path, legacy_jobs: Path = None, legacy_archive: Path = None
+    ):
+        self.database = Path(database)
+        self.engine = create_engine(f"sqlite:///{self.database}")
+        event.listen(self.engine, "connect", self.configure_connection)
+        Base.metadata.create_all(self.engine)
+        self.add_missing_columns()
+        self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
+        self.migrate(legacy_jobs, legacy_archive)
+
+    @staticmethod
+    def configure_connection(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        # WAL lets readers (e.g. the datasource service) run alongside the writer
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    def add_missing_columns(self) -> None:
+        """Adds model columns that a database created by an older version lacks."""
+        existing = {
+            column["name"] for column in inspect(self.engine).get_columns("jobs")
+        }
+        with self.engine.begin() as connection:
+            for column in Job.__table__.columns:
+                if column.name not in existing:
+                    column_type = column.type.compile(self.engine.dialect)
+                    connection.execute(
+                        text(f"ALTER TABLE jobs ADD COLUMN {column.name} {column_type}")
+                    )
+
+    @staticmethod
+    def to_row(job_id: str, job_info: Dict[str, Any], archived: bool = False) -> Job:
+        return Job(
+            job_id=job_id,
+            task_name=job_info.get("task"),
+            schedule_time=datetime.fromisoformat(job_info["schedule_time"]),
+            created=datetime.fromisoformat(
+                job_info.get("created", job_info["schedule_time"])
+            ),
+            kwargs=job_info.get("kwargs", {}),
+            result=bool(job_info.get("result", False)),
+            error_info=job_info.get("error_info"),
+            is_archived=archived,
+            details={
+                key: value for key, value in job_info.items() if key not in JOB_COLUMNS
+            }
+            or None,
+        )
+
+    @staticmethod
+    def to_info(job: Job) -> Dict[str, Any]:
+        job_info = {
+            "task": job.task_name,
+            "created": job.created.isoformat(),
+            "schedule_time": job.schedule_time.isoformat(),
+            "kwargs": job.kwargs or {},
+            **(job.details or {}),
+        }
+        if job.is_archived:
+            job_info["result"] = job.result
+            if job.error_info:
+                job_info["error_info"] = job.error_info
+        return job_info
+
+    def migrate(self, legacy_jobs: Path = None, legacy_archive: Path = None) -> None:
+        """
+        Imports the JSON files of the previous backend and renames them to
+        `<name>.migrated`, so the import only ever happens once.
+        """
+        for path, archived in ((legacy_jobs, False), (legacy_archive, True)):
+            if path is None or not Path(path).exists():
+                continue
+            path = Path(path)
+            entries = load_json_with_backup(path)
+            with self.Session.begin() as session:
+                for job_id, job_info in entries.items():
+                    try:
+                        session.merge(self.to_row(job_id, job_info, archived))
+                    except (KeyError, TypeError, ValueError) as e:
+                        logger.warning(f"Skipped malformed job {job_id} in {path}: {e}")
+            if path.exists():  # A corrupt file was already moved to a backup
+                path.rename(path.with_name(f"{path.name}.migrated"))
+            logger.info(f"Migrated {len(entries)} jobs from {path} to {self.database}")
+
+    def load_jobs(self) -> Dict[str, Dict[str, Any]]:
+        with self.Session() as session:
+            jobs = session.scalars(
+                select(Job)
+                .where(Job.is_archived.is_(False))
+                .order_by(Job.schedule_time)
+            )
+            return {job.job_id: self.to_info(job) for job in jobs}
+
+    def add_jobs(self, jobs: Dict[str, Dict[str, Any]]) -> None:
+        with self.Session.begin() as session:
+            for job_id, job_info in jobs.items():
+                session.merge(self.to_row(job_id, job_info))
+
+    def remove_jobs(self, job_ids: Iterable[str]) -> None:
+        job_ids = list(job_ids)
+        if not job_ids:
+            return
+        with self.Session.begin() as session:
+            session.execute(
+                delete(Job).where(Job.job_id.in_(job_ids), Job.is_archived.is_(False))
+            )
+
+    def archive_job(self, job_id: str, job_info: Dict[str, Any]) -> None:
+        with self.Session.begin() as session:
+            session.merge(self.to_row(job_id, job_info, archived=True))
+
+    def get_archive(
+        self, offset: int = 0, limit: int = None, after: str = None
+    ) -> Dict[str, Dict[str, Any]]:
+        query = (
+            select(Job)
+            .where(Job.is_archived.is_(True))
+            # The ID breaks ties, so pages of equal schedule times do not overlap
+            .order_by(Job.schedule_time.desc(), Job.job_id.desc())
+            .offset(offset)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        with self.Session() as session:
+            if after is not None:
+                cursor = session.get(Job, after)
+                if cursor is None or not cursor.is_archived:
+                    return {}
+                query = query.where(
+                    or_(
+                        Job.schedule_time < cursor.schedule_time,
+                        and_(
+                            Job.schedule_time == cursor.schedule_time,
+                            Job.job_id < cursor.job_id,
+                        ),
+                    )
+                )
+            return {job.job_id: self.to_info(job) for job in session.scalars(query)}
+
+    def archive_key(self, job_id: str, job_info: Dict[str, Any]) -> Optional[tuple]:
+        return (datetime.fromisoformat(job_info["schedule_time"]), job_id)
+
+    def count_archive(self) -> int:
+        with self.Session() as session:
+            return session.scalar(
+                select(func.count()).select_from(Job).where(Job.is_archived.is_(True))
+            )
+
+    def get_archived_job(self, job_id: str) -> Dict[str, Any]:
+        with self.Session() as session:
+            job = session.get(Job, job_id)
+            return self.to_info(job) if job is not None and job.is_archived else {}
+
+    def find_jobs(
+        self,
+        task_name: str = None,
+        start: datetime = None,
+        end: datetime = None,
+        archived: bool = False,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Looks up jobs through the task and schedule time indexes.
+
+        Args:
+            task_name (str, optional): Only jobs of this task.
+            start (datetime, optional): Only jobs scheduled at or after this time.
+            end (datetime, optional): Only jobs scheduled before this time.
+            archived (bool): Search the archive instead of the scheduled jobs.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Matching jobs ordered by schedule time.
+        """
+        query = select(Job).where(Job.is_archived.is_(archived))
+        if task_name is not None:
+            query = query.where(Job.task_name == task_name)
+        if start is not None:
+            query = query.where(Job.schedule_time >= start)
+        if end is not None:
+            query = query.where(Job.schedule_time < end)
+        with self.Session() as session:
+            jobs = session.scalars(query.order_by(Job.schedule_time, Job.job_id))
+            return {job.job_id: self.to_info(job) for job in jobs}
+
+    def clear_archive(self) -> None:
+        with self.Session.begin() as session:
+            session.execute(delete(Job).where(Job.is_archived.is_(True)))
+
+    def close(self) -> None:
+        self.engine.dispose()
@@ -1,13 +1,19 @@
 import hashlib
-import json
 import logging
 import os
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, Dict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
-from sonaris.defaults import DEFAULT_DATADIR
+from sonaris.defaults import DEFAULT_DATADIR, RECURRING_HISTORY
+from sonaris.scheduler.events import EventBus, JobEvent, JobEventType
+from sonaris.scheduler.runner import PlanRunner
+from sonaris.scheduler.store import JobStore, JSONJobStore
 from sonaris.scheduler.worker import Worker
+from sonaris.tasks.compiler import ExperimentPlan, PlanStep
 from sonaris.utils.log import create_numbered_backup, get_logger
 
 
@@ -19,6 +25,7 @@ class Timekeeper:
         logger: logging.Logger = None,
         user_callback: Callable = None,
         archive: Path = None,
+        store: JobStore = None,
     ):
         """
         Initializes the Timekeeper class, responsible for managing and scheduling jobs.
@@ -26,60 +33,168 @@ class Timekeeper:
         Args:
             persistence_file (Path): Path to the file used for persisting job data.
             worker_instance (Worker): An instance of the Worker class to execute scheduled tasks.
+            store (JobStore, optional): Persistence backend, defaults to the JSON files
+                `persistence_file` and `archive`.
         """
         self.logger = logger or get_logger()
         self.persistence_file = persistence_file
         self.worker = worker_instance
-        self.jobs = self.load_jobs()
         self.archive = (
             archive
-            or Path(os.getenv("DATA"), "archive.json")
+            or (Path(os.getenv("DATA"), "archive.json") if os.getenv("DATA") else None)
             or DEFAULT_DATADIR / "archive.json"
         )
+        self.store = store or JSONJobStore(self.persistence_file, self.archive)
+        self.runners: Dict[str, PlanRunner] = {}
+        # Experiment steps the runners are executing, they can no longer be cancelled
+        self.running_steps = set()
+        # Guards `jobs` and its records, worker callbacks change them on their threads
+        self.lock = threading.RLock()
+        # Lifecycle and bookkeeping events of the jobs, see `publish`
+        self.events = EventBus()
+        # job_id -> time.perf_counter() at the start of the running task
+        self.started: Dict[str, float] = {}
+        self.worker.on_start = self.job_started
+        # Set first, resumed experiment steps may finish during the rescheduling
+        self.user_callback = user_callback
+        self.jobs = self.load_jobs()
         self.reload_function_map()
         self.__reschedule_jobs__()
-        self.user_callback = user_callback
-    def get_archive(self) -> Dict[str, Any]:
-        return json.loads(self.archive.read_text())
+
+    def get_archive(
+        self, offset: int = 0, limit: int = None, after: str = None
+    ) -> Dict[str, Any]:
+        """
+        Returns finished jobs newest first.
+
+        Args:
+            offset (int): Number of newest jobs to skip.
+            limit (int, optional): Page size, the whole archive if None.
+            after (str, optional): ID of the last job of the previous page, the page
+                starts right after it, so jobs archived meanwhile do not shift it.
+
+        Returns:
+            Dict[str, Any]: A dictionary of archived jobs indexed by their IDs.
+        """
+        return self.store.get_archive(offset, limit, after)
+
+    def archive_key(self, job_id: str, job_info: Dict[str, Any]) -> Optional[tuple]:
+        """Position of a job in the archive order, see `JobStore.archive_key`."""
+        return self.store.archive_key(job_id, job_info)
+
+    def find_archive(
+        self, task_name: str = None, start: datetime = None, end: datetime = None
+    ) -> Dict[str, Any]:
+        """
+        Returns finished jobs matching the task and schedule time newest first, looked
+        up by the store instead of reading the whole archive.
+
+        Args:
+            task_name (str, optional): Only jobs of this task.
+            start (datetime, optional): Only jobs scheduled at or after this time.
+            end (datetime, optional): Only jobs scheduled before this time.
+
+        Returns:
+            Dict[str, Any]: A dictionary of archived jobs indexed by their IDs.
+        """
+        jobs = self.store.find_jobs(task_name, start, end, archived=True)
+        return dict(reversed(list(jobs.items())))
+
+    def count_archive(self) -> int:
+        return self.store.count_archive()
+
+    def get_archived_job(self, job_id: str) -> Dict[str, Any]:
+        return self.store.get_archived_job(job_id)
+
     def set_callback(self, user_callback: Callable) -> None:
         self.user_callback = user_callback
 
+    def publish(
+        self,
+        event_type: JobEventType,
+        job_id: str = None,
+        job_info: Dict[str, Any] = None,
+        **details: Any,
+    ) -> None:
+        """
+        Publishes a job event on `events`. Subscribers receive a copy of the job record,
+        so they may keep it while the job changes.
+
+        Args:
+            event_type (JobEventType): What happened.
+            job_id (str, optional): The job, None for events about the whole archive.
+            job_info (Dict[str, Any], optional): The job record.
+            **details: Timing and error fields of `JobEvent`.
+        """
+        event = JobEvent(event_type, job_id, dict(job_info or {}), **details)
+        self.events.publish(event)
+
+    def job_started(self, task_name: str, job_id: str) -> None:
+        """Called by the worker when the task of a job begins."""
+        self.started[job_id] = time.perf_counter()
+        job_info = self.jobs.get(job_id) or {"task": task_name}
+        lateness = None
+        if not job_info.get("trigger") and "schedule_time" in job_info:
+            schedule_time = datetime.fromisoformat(job_info["schedule_time"])
+            lateness = (datetime.now() - schedule_time).total_seconds()
+        self.publish(JobEventType.STARTED, job_id, job_info, lateness=lateness)
+
+    def publish_result(
+        self,
+        job_id: str,
+        job_info: Dict[str, Any],
+        result: bool,
+        error_info: str = None,
+        duration: float = None,
+    ) -> None:
+        started = self.started.pop(job_id, None)
+        if duration is None and started is not None:
+            duration = time.perf_counter() - started
+        self.publish(
+            JobEventType.SUCCEEDED if result else JobEventType.FAILED,
+            job_id,
+            job_info,
+            duration=duration,
+            error_info=error_info,
+        )
+
     def cancel_job(self, job_id: str) -> None:
-        """Removes job from worker and erases entry
+        """Removes job from worker and erases entry. Experiment steps are skipped by
+        their runner instead, a step the runner already started is not cancelled.
 
         Args:
             job_id (str): _description_
         """
-        self.worker.remove_scheduled_task(job_id)
-        self.remove_job(job_id)
+        # Held throughout, so a runner cannot claim the step while it is removed
+        with self.lock:
+            job_info = self.jobs.get(job_id, {})
+            if job_id in self.running_steps:
+                self.logger.info(f"Job {job_id} is already running, not cancelled.")
+                return
+            if not job_info.get("experiment"):
+                self.worker.remove_scheduled_task(job_id)
+            if job_id in self.jobs:
+                self.publish(JobEventType.CANCELLED, job_id, job_info)
+            if job_info.get("trigger") and job_info.get("runs"):
+                # Keep the run history of a recurring job that already ran
+                self.archive_job(job_id, self.summarize_recurring(job_info))
+            self.remove_job(job_id)
 
     def clear_archive(self):
-        # Clear the JSON file
         try:
-            with self.archive.open("w") as file:
-                json.dump({}, file)
+            self.store.clear_archive()
         except Exception as e:
             self.logger.error(f"Error clearing finished jobs: {e}")
+        self.publish(JobEventType.CLEARED)
 
     def load_jobs(self) -> Dict[str, Any]:
         """
-        Loads the jobs from the persistence file.
+        Loads the jobs from the persistence backend.
 
         Returns:
             Dict[str, Any]: A dictionary of jobs indexed by their IDs.
         """
-        try:
-            with open(self.persistence_file, "r") as file:
-                return json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
-
-    def save_jobs(self) -> None:
-        """
-        Saves the current jobs to the persistence file.
-        """
-        with open(self.persistence_file, "w") as file:
-            json.dump(self.jobs, file, indent=4)
+        return self.store.load_jobs()
 
     def compute_hash(
         self, task_name: str, schedule_time: datetime, *args, **kwargs
@@ -114,19 +229,342 @@ class Timekeeper:
             str: The ID of the scheduled job.
         """
         job_id = self.compute_hash(task_name, schedule_time, kwargs)
-        self.jobs[job_id] = {
-            "task": task_name,
-            "created": datetime.now().isoformat(),
-            "schedule_time": schedule_time.isoformat(),
-            **kwargs,
-        }
-        self.save_jobs()
+        with self.lock:
+            self.jobs[job_id] = {
+                "task": task_name,
+                "created": datetime.now().isoformat(),
+                "schedule_time": schedule_time.isoformat(),
+                **kwargs,
+            }
+        self.store.add_job(job_id, self.jobs[job_id])
+        self.publish(JobEventType.SUBMITTED, job_id, self.jobs[job_id])
         self.logger.info(
             f"Received job {job_id} with task {task_name} to run at {schedule_time}"
         )
         self.schedule_job_to_worker(job_id)
+        self.publish(JobEventType.SCHEDULED, job_id, self.jobs[job_id])
         return job_id
 
+    def add_jobs(
+        self,
+        batch: Iterable[Dict[str, Any]],
+        schedule: Callable[[List[str]], None] = None,
+    ) -> List[str]:
+        """
+        Adds several jobs, e.g. the steps of an experiment, as one unit. All jobs are
+        validated first, persisted in a single write and then scheduled. If any step
+        fails, every job of the batch is removed again so no partial batch remains.
+
+        Args:
+            batch (Iterable[Dict[str, Any]]): One dictionary per job with "task_name" and
+                "schedule_time", remaining keys are stored like the **kwargs of `add_job`.
+            schedule (Callable[[List[str]], None], optional): Hands the persisted jobs to
+                the executor of the whole batch instead of one worker job each, e.g. the
+                runner of an experiment. Raising rolls the batch back like a failed
+                worker job.
+
+        Returns:
+            List[str]: The IDs of the scheduled jobs in batch order.
+
+        Raises:
+            ValueError: If a job is malformed or its task is not registered.
+        """
+        created = datetime.now().isoformat()
+        entries: Dict[str, Dict[str, Any]] = {}
+        for index, job in enumerate(batch):
+            job = dict(job)
+            task_name = job.pop("task_name", None)
+            schedule_time = job.pop("schedule_time", None)
+            if task_name not in self.worker.function_map.function_map:
+                raise ValueError(f"Step {index}: unknown task '{task_name}'.")
+            if not isinstance(schedule_time, datetime):
+                raise ValueError(f"Step {index}: schedule_time must be a datetime.")
+            job_id = self.compute_hash(task_name, schedule_time, job)
+            # Identical steps at the same time are still separate jobs
+            sequence = 0
+            while job_id in entries or job_id in self.jobs:
+                sequence += 1
+                job_id = self.compute_hash(task_name, schedule_time, job, sequence)
+            entries[job_id] = {
+                "task": task_name,
+                "created": created,
+                "schedule_time": schedule_time.isoformat(),
+                **job,
+            }
+
+        self.store.add_jobs(entries)
+        with self.lock:
+            self.jobs.update(entries)
+        scheduled = []
+        try:
+            if schedule is not None:
+                schedule(list(entries))
+            else:
+                for job_id in entries:
+                    self.schedule_job_to_worker(job_id)
+                    scheduled.append(job_id)
+        except Exception as e:
+            self.logger.error(f"Failed to schedule batch, rolling back: {e}")
+            for job_id in scheduled:
+                self.worker.remove_scheduled_task(job_id)
+            with self.lock:
+                for job_id in entries:
+                    self.jobs.pop(job_id, None)
+            self.store.remove_jobs(entries)
+            raise
+        for job_id, job_info in entries.items():
+            self.publish(JobEventType.SUBMITTED, job_id, job_info)
+            self.publish(JobEventType.SCHEDULED, job_id, job_info)
+        self.logger.info(f"Received batch of {len(entries)} jobs.")
+        return list(entries)
+
+    def run_experiment(self, plan: ExperimentPlan) -> str:
+        """
+        Submits a compiled experiment plan. Its steps are persisted as one batch through
+        `add_jobs`, so they are listed, published and cancelled like other jobs and
+        survive a restart, but a single `PlanRunner` executes them on one monotonic
+        timeline instead of one worker job per step. Each step is archived under its job
+        ID with the run ID in its "experiment" field.
+
+        Args:
+            plan (ExperimentPlan): The plan from `compile_experiment`.
+
+        Returns:
+            str: The run ID, used by `cancel_experiment` and `get_runner`. Runners
+            stay available after they finish so their telemetry can be read.
+        """
+        start = datetime.now()
+        run_id = self.compute_hash(plan.name or "experiment", start, plan.plan_id)
+        batch = [
+            {
+                "task_name": step.task_name,
+                "schedule_time": start + timedelta(seconds=step.offset),
+                "kwargs": dict(step.parameters),
+                "experiment": run_id,
+                "step": step.index,
+            }
+            for step in plan.steps
+        ]
+        self.add_jobs(
+            batch, schedule=lambda job_ids: self.create_runner(run_id, plan, job_ids)
+        )
+        self.logger.info(
+            f"Running experiment {plan.name or plan.plan_id} as {run_id}, "
+            f"{len(plan.steps)} steps over {plan.duration}s."
+        )
+        # Started once the steps were published, so no step starts before it is listed
+        self.runners[run_id].start()
+        return run_id
+
+    def create_runner(
+        self, run_id: str, plan: ExperimentPlan, job_ids: List[str]
+    ) -> PlanRunner:
+        """Creates the runner of an experiment, `job_ids` are the jobs of its steps."""
+        step_jobs = {step.index: job_id for step, job_id in zip(plan.steps, job_ids)}
+
+        def on_finish(runner: PlanRunner) -> None:
+            self.logger.info(f"Experiment run {run_id} finished: {runner.summary()}")
+
+        runner = PlanRunner(
+            plan,
+            lambda step: self.execute_plan_step(step, step_jobs[step.index]),
+            on_finish=on_finish,
+        )
+        self.runners[run_id] = runner
+        return runner
+
+    def resume_experiment(self, run_id: str, steps: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Runs the pending steps of an experiment submitted before a restart on a new
+        runner, keeping the schedule times they were persisted with.
+        """
+        now = datetime.now()
+        steps = dict(sorted(steps.items(), key=lambda item: item[1]["schedule_time"]))
+        plan = ExperimentPlan(
+            plan_id=run_id,
+            name=None,
+            steps=tuple(
+                PlanStep(
+                    index=job_info["step"],
+                    task_name=job_info["task"],
+                    offset=max(
+                        (
+                            datetime.fromisoformat(job_info["schedule_time"]) - now
+                        ).total_seconds(),
+                        0.0,
+                    ),
+                    parameters=MappingProxyType(dict(job_info.get("kwargs", {}))),
+                )
+                for job_info in steps.values()
+            ),
+        )
+        runner = self.create_runner(run_id, plan, list(steps))
+        for job_id, job_info in steps.items():
+            self.publish(JobEventType.SCHEDULED, job_id, job_info)
+        self.logger.info(f"Resumed experiment {run_id} with {len(steps)} steps.")
+        runner.start()
+
+    def execute_plan_step(self, step: PlanStep, job_id: str) -> Optional[tuple]:
+        """
+        Runs a plan step through the worker, which reports it to `callback` like any
+        other job. Returns (result, error_info), None if the step was cancelled.
+        """
+        with self.lock:
+            if job_id not in self.jobs:
+                return None
+            # Claimed under the lock, so `cancel_job` no longer removes it
+            self.running_steps.add(job_id)
+        outcome = {}
+
+        def capture(job_id: str, result: bool, error_info: str = None) -> None:
+            outcome["error_info"] = error_info
+            self.callback(job_id, result, error_info)
+
+        try:
+            # Goes through the device queue, so the step never overlaps other jobs on it
+            result = self.worker.submit_task(
+                step.task_name, job_id, capture, (), dict(step.parameters)
+            ).result()
+        finally:
+            with self.lock:
+                self.running_steps.discard(job_id)
+        return result, outcome.get("error_info")
+
+    def get_runner(self, run_id: str) -> PlanRunner:
+        return self.runners.get(run_id)
+
+    def cancel_experiment(self, run_id: str) -> None:
+        """
+        Stops the runner of an experiment and cancels its pending steps, a step that is
+        already running still finishes and is archived.
+
+        Args:
+            run_id (str): The run ID returned by `run_experiment`.
+        """
+        runner = self.runners.get(run_id)
+        if runner is not None:
+            runner.cancel()
+        with self.lock:
+            steps = [
+                job_id
+                for job_id, job_info in self.jobs.items()
+                if job_info.get("experiment") == run_id
+            ]
+            for job_id in steps:
+                self.cancel_job(job_id)
+
+    def add_recurring_job(
+        self,
+        task_name: str,
+        trigger: str,
+        trigger_args: Dict[str, Any],
+        **kwargs,
+    ) -> str:
+        """
+        Adds a job that runs repeatedly. It is kept as a single record holding a run
+        counter and the last `RECURRING_HISTORY` results, and archived as one compact
+        entry once its schedule ends or it is cancelled.
+
+        Args:
+            task_name (str): The name of the task to schedule.
+            trigger (str): "interval" or "cron".
+            trigger_args (Dict[str, Any]): Trigger fields, e.g. {"seconds": 5,
+                "end_date": datetime} for interval or {"minute": "*/10"} for cron jobs.
+            **kwargs: Keyword arguments to pass to the task.
+
+        Returns:
+            str: The ID of the scheduled job.
+        """
+        if trigger not in ("interval", "cron"):
+            raise ValueError(f"Unsupported trigger '{trigger}', use interval or cron.")
+        trigger_args = {
+            key: value.isoformat() if isinstance(value, datetime) else value
+            for key, value in trigger_args.items()
+        }
+        now = datetime.now()
+        job_id = self.compute_hash(task_name, now, trigger, trigger_args, kwargs)
+        with self.lock:
+            self.jobs[job_id] = {
+                "task": task_name,
+                "created": now.isoformat(),
+                "schedule_time": now.isoformat(),
+                "trigger": trigger,
+                "trigger_args": trigger_args,
+                "runs": 0,
+                "succeeded": 0,
+                "failed": 0,
+                "results": [],
+                **kwargs,
+            }
+        self.store.add_job(job_id, self.jobs[job_id])
+        self.logger.info(
+            f"Received {trigger} job {job_id} with task {task_name} ({trigger_args})"
+        )
+        try:
+            self.schedule_job_to_worker(job_id)
+        except Exception:
+            with self.lock:
+                self.jobs.pop(job_id)
+            self.store.remove_job(job_id)
+            raise
+        self.publish(JobEventType.SUBMITTED, job_id, self.jobs[job_id])
+        self.publish(JobEventType.SCHEDULED, job_id, self.jobs[job_id])
+        return job_id
+
+    def recurring_callback(
+        self, job_id: str, result: bool, error_info: str = None, last_run: bool = False
+    ) -> None:
+        """
+        Callback after every run of a recurring job. Updates the run counter and the
+        bounded result history of its single record, and archives it after the last run.
+
+        Args:
+            job_id (str): The ID of the recurring job.
+            result (bool): Whether the run succeeded.
+            error_info (str, optional): Traceback of a failed run.
+            last_run (bool): The trigger has no further fire time, set by the worker when
+                the occurrence fired.
+        """
+        entry = {"time": datetime.now().isoformat(), "result": result}
+        if error_info:
+            entry["error_info"] = error_info
+        with self.lock:
+            job_info = self.jobs.get(job_id)
+            if job_info is None:
+                return  # Cancelled while the run was in flight
+            job_info["runs"] += 1
+            job_info["succeeded" if result else "failed"] += 1
+            job_info["results"] = (job_info["results"] + [entry])[-RECURRING_HISTORY:]
+        self.publish_result(job_id, job_info, result, error_info)
+
+        if not last_run:
+            self.store.add_job(job_id, job_info)
+            self.publish(JobEventType.UPDATED, job_id, job_info)
+        else:
+            self.archive_job(job_id, self.summarize_recurring(job_info))
+            self.remove_job(job_id)
+
+        if self.user_callback is not None:
+            self.user_callback()
+
+    @staticmethod
+    def summarize_recurring(job_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Compact archive entry of a recurring job, OK only if no run failed."""
+        summary = {**job_info, "result": job_info.get("failed", 0) == 0}
+        errors = [
+            entry for entry in job_info.get("results", []) if "error_info" in entry
+        ]
+        if errors:
+            summary["error_info"] = errors[-1]["error_info"]
+        return summary
+
+    @staticmethod
+    def recurrence_ended(job_info: Dict[str, Any]) -> bool:
+        end_date = job_info.get("trigger_args", {}).get("end_date")
+        return (
+            end_date is not None and datetime.fromisoformat(end_date) < datetime.now()
+        )
+
     def schedule_job_to_worker(self, job_id: str) -> None:
         """
         Schedules a job to be executed by the worker.
@@ -135,6 +573,16 @@ class Timekeeper:
             job_id (str): The ID of the job to schedule.
         """
         job_info = self.jobs[job_id]
+        if job_info.get("trigger"):
+            self.worker.__schedule_recurring_task__(
+                job_info["task"],
+                job_info["trigger"],
+                job_info["trigger_args"],
+                job_id,
+                self.recurring_callback,
+                **job_info.get("kwargs", {}),
+            )
+            return
         schedule_time = datetime.fromisoformat(job_info["schedule_time"])
         self.worker.__schedule_task__(
             job_info["task"],
@@ -149,6 +597,7 @@ class Timekeeper:
         Reloads the function map from the Worker instance.
         """
         try:
+            self.worker.function_map.reload()
             for (
                 func_identifier,
                 func_data,
@@ -170,7 +619,18 @@ class Timekeeper:
         self.logger.debug(f"Found {len(self.jobs)} scheduled.")
         now = datetime.now()
         self.prune()
-        for job_id, job_info in self.jobs.items():
+        experiments: Dict[str, Dict[str, Any]] = {}
+        for job_id, job_info in list(self.jobs.items()):
+            if job_info.get("experiment"):
+                experiments.setdefault(job_info["experiment"], {})[job_id] = job_info
+                continue
+            if job_info.get("trigger"):
+                if self.recurrence_ended(job_info):
+                    self.archive_job(job_id, self.summarize_recurring(job_info))
+                    self.remove_job(job_id)
+                else:
+                    self.schedule_job_to_worker(job_id)
+                continue
             schedule_time = datetime.fromisoformat(job_info["schedule_time"])
             if schedule_time < now:
                 schedule_time = now + timedelta(seconds=10)
@@ -182,6 +642,9 @@ class Timekeeper:
                 self.callback,
                 **job_info["kwargs"],
             )
+            self.publish(JobEventType.SCHEDULED, job_id, job_info)
+        for run_id, steps in experiments.items():
+            self.resume_experiment(run_id, steps)
 
     def archive_job(self, job_id: str, job_info: Dict[str, Any]) -> None:
         """
@@ -192,20 +655,12 @@ class Timekeeper:
             job_info (Dict[str, Any]): The details of the completed job.
         """
         try:
-            if not self.archive.exists():
-                # Create the archive file if it doesn't exist
-                with open(self.archive, "w") as file:
-                    json.dump({}, file)
-
-            with open(self.archive, "r+") as file:
-                archived_jobs = json.load(file)
-                archived_jobs[job_id] = job_info
-                file.seek(0)
-                json.dump(archived_jobs, file, indent=4)
-
+            self.store.archive_job(job_id, job_info)
             self.logger.info(f"Job {job_id} archived.")
         except Exception as e:
             self.logger.error(f"Failed to archive job {job_id}: {e}")
+            return
+        self.publish(JobEventType.ARCHIVED, job_id, job_info)
 
     def callback(self, job_id: str, result: bool, error_info: str = None) -> None:
         """
@@ -216,15 +671,17 @@ class Timekeeper:
             result (bool): The result of the job execution, True if successful, False otherwise.
             error_info (str, optional): The traceback or error information if the job failed.
         """
-        # Retrieve the job information, if not found, use an empty dictionary
-        job_info = self.jobs.get(job_id, {})
+        with self.lock:
+            # Retrieve the job information, if not found, use an empty dictionary
+            job_info = self.jobs.get(job_id, {})
 
-        # Update the job_info dictionary with the result of the execution
-        job_info["result"] = result
+            # Update the job_info dictionary with the result of the execution
+            job_info["result"] = result
 
-        # If there is error information (job execution failed), add it to the job_info
-        if error_info:
-            job_info["error_info"] = error_info
+            # If there is error information (job execution failed), add it to the job_info
+            if error_info:
+                job_info["error_info"] = error_info
+        self.publish_result(job_id, job_info, result, error_info)
 
         # Perform job archival and removal
         self.archive_job(
@@ -243,30 +700,44 @@ class Timekeeper:
         Args:
             job_id (str): _description_
         """
-        self.jobs.pop(job_id)
-        self.save_jobs()
+        with self.lock:
+            job_info = self.jobs.pop(job_id)
+        self.store.remove_job(job_id)
+        self.publish(JobEventType.REMOVED, job_id, job_info)
         self.logger.info(f"Job {job_id} removed.")
 
     def prune(self) -> None:
         """
         Removes jobs that are no longer valid or have passed their schedule time.
+        Recurring jobs are kept, their schedule_time is only the creation time.
         """
         now = datetime.now()
-        jobs_to_remove = [
-            job_id
-            for job_id, job_info in self.jobs.items()
-            if datetime.fromisoformat(job_info["schedule_time"]) < now
-        ]
+        with self.lock:
+            jobs_to_remove = [
+                job_id
+                for job_id, job_info in self.jobs.items()
+                if not job_info.get("trigger")
+                and datetime.fromisoformat(job_info["schedule_time"]) < now
+            ]
+            pruned = {job_id: self.jobs.pop(job_id) for job_id in jobs_to_remove}
         for job_id in jobs_to_remove:
-            del self.jobs[job_id]
             self.logger.info(f"Pruned job {job_id}")
-        self.save_jobs()
+        self.store.remove_jobs(jobs_to_remove)
+        for job_id, job_info in pruned.items():
+            self.publish(JobEventType.REMOVED, job_id, job_info)
+
+    def get_job(self, job_id: str) -> Dict[str, Any]:
+        """Returns a copy of one scheduled job, empty if it is not scheduled."""
+        with self.lock:
+            return dict(self.jobs.get(job_id, {}))
 
     def get_jobs(self) -> Dict[str, Any]:
         """
-        Returns the currently scheduled jobs.
+        Returns a snapshot of the currently scheduled jobs, taken under the lock so it
+        can be read on any thread while worker callbacks change the jobs.
 
         Returns:
-            Dict[str, Any]: A dictionary of the scheduled jobs.
+            Dict[str, Any]: A copy of the scheduled jobs and their records.
         """
-        return self.jobs
+        with self.lock:
+            return {job_id: dict(job_info) for job_id, job_info in self.jobs.items()}
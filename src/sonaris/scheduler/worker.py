@@ -1,13 +1,42 @@
 import logging
+import threading
+import time
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Callable
+from functools import partial
+from typing import Any, Callable, Dict, Iterable
 
+from apscheduler.schedulers import SchedulerNotRunningError
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.base import BaseTrigger
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 from sonaris.scheduler.functionmap import FunctionMap
+from sonaris.scheduler.precision import PrecisionScheduler
 from sonaris.utils.log import get_logger
-from apscheduler.schedulers import SchedulerNotRunningError
+from sonaris.utils.metrics import get_metrics
+
+# Executor of tasks that are not bound to an instrument
+SHARED_EXECUTOR = "shared"
+# Triggers of recurring jobs, they only compute the fire times
+RECURRING_TRIGGERS = {"interval": IntervalTrigger, "cron": CronTrigger}
+
+TASK_DURATION = get_metrics().histogram(
+    "sonaris_task_duration_seconds", "Execution time of tasks in seconds."
+)
+TASK_RESULTS = get_metrics().counter(
+    "sonaris_tasks_total", "Executed tasks by task name and result."
+)
+JOB_LATENESS = get_metrics().histogram(
+    "sonaris_job_lateness_seconds",
+    "Delay between the scheduled and the actual start of a job in seconds.",
+)
+QUEUE_DEPTH = get_metrics().gauge(
+    "sonaris_queue_depth", "Jobs waiting on the executor of a device."
+)
+
 
 class Worker:
     def __init__(
@@ -15,29 +44,155 @@ class Worker:
         function_map: dict,
         daemon: bool = False,
         logger: logging.Logger = None,
+        shared_workers: int = 4,
+        precise: bool = False,
     ):
         """
         Initializes the Worker class.
 
+        Tasks registered with a device run on that device's single-threaded executor,
+        so jobs on one instrument execute strictly in submission order while different
+        instruments run in parallel. Tasks without a device share a small pool.
+
         Args:
             function_map_file (Path): Path to the file containing the function map.
+            shared_workers (int): Threads of the executor for tasks without a device.
+            precise (bool): Use the monotonic `PrecisionScheduler` instead of APScheduler
+                for sub-millisecond firing accuracy.
         """
         self.logger = logger or get_logger()
-        self.scheduler = BackgroundScheduler(daemon=daemon)
+        self.scheduler = (
+            PrecisionScheduler() if precise else BackgroundScheduler(daemon=daemon)
+        )
         self.function_map = FunctionMap(function_map)
+        self.shared_workers = shared_workers
+        self.task_devices: Dict[str, str] = {}
+        self.executors: Dict[str, ThreadPoolExecutor] = {}
+        self.queue_stats: Dict[str, dict] = {}
+        # job_id -> planned start of pending one-off jobs, for the lateness metric
+        self.run_times: Dict[str, datetime] = {}
+        # Called with (task_name, job_id) when a task begins, set by the Timekeeper
+        self.on_start: Callable[[str, str], None] = None
+        # job_id -> {"pending", "final", "lock"} of recurring jobs that were not
+        # cancelled, guarded by `executor_lock`, see `finish_occurrence`
+        self.recurring: Dict[str, dict] = {}
+        self.executor_lock = threading.Lock()
         self.logger.info("Function Map OK")
 
-    def register_task(self, func: Callable, task_name: str) -> None:
+    def register_task(self, func: Callable, task_name: str, device: str = None) -> None:
         """
         Registers a function under a task name for the scheduler to recognize.
 
         Args:
             func (Callable): The function to be registered.
             task_name (str): The name associated with the function.
+            device (str, optional): Instrument the task talks to, its jobs are serialized.
         """
         self.function_map.add_function(task_name, func)
+        if device is not None:
+            self.task_devices[task_name] = device
         self.logger.info(f"Added function {task_name} {func.__name__}.")
 
+    def register_tasks(self, device_tasks: Dict[str, Dict[str, Callable]]) -> None:
+        """
+        Registers tasks grouped by device, e.g. `TASK_LIST_DICTIONARY`.
+
+        Args:
+            device_tasks (Dict[str, Dict[str, Callable]]): { device : { task-name : func } }
+        """
+        for device, tasks in device_tasks.items():
+            for task_name, func in tasks.items():
+                self.register_task(func, task_name, device)
+
+    def get_executor(self, task_name: str) -> ThreadPoolExecutor:
+        device = self.task_devices.get(task_name, SHARED_EXECUTOR)
+        with self.executor_lock:
+            if device not in self.executors:
+                self.executors[device] = ThreadPoolExecutor(
+                    max_workers=1 if device != SHARED_EXECUTOR else self.shared_workers,
+                    thread_name_prefix=f"worker-{device}",
+                )
+                self.queue_stats[device] = {
+                    "queued": 0,
+                    "running": 0,
+                    "executed": 0,
+                    "last_wait": 0.0,
+                    "max_wait": 0.0,
+                    "total_wait": 0.0,
+                }
+            return self.executors[device]
+
+    def submit_task(
+        self,
+        task_name: str,
+        job_id: str = None,
+        _callback: Callable = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Future:
+        """
+        Queues a task on the executor of its device, takes the same arguments as
+        `execute_task`.
+
+        Returns:
+            Future: Resolves to the result of `execute_task`.
+        """
+        device = self.task_devices.get(task_name, SHARED_EXECUTOR)
+        executor = self.get_executor(task_name)
+        enqueued = time.monotonic()
+        with self.executor_lock:
+            self.queue_stats[device]["queued"] += 1
+            QUEUE_DEPTH.set(self.queue_stats[device]["queued"], device=device)
+
+        def run() -> Any:
+            waited = time.monotonic() - enqueued
+            run_time = self.run_times.pop(job_id, None)
+            if run_time is not None:
+                JOB_LATENESS.observe(
+                    (datetime.now() - run_time).total_seconds(), device=device
+                )
+            with self.executor_lock:
+                stats = self.queue_stats[device]
+                stats["queued"] -= 1
+                QUEUE_DEPTH.set(stats["queued"], device=device)
+                stats["running"] += 1
+                stats["last_wait"] = waited
+                stats["max_wait"] = max(stats["max_wait"], waited)
+                stats["total_wait"] += waited
+            try:
+                return self.execute_task(task_name, job_id, _callback, *args, **kwargs)
+            finally:
+                with self.executor_lock:
+                    stats["running"] -= 1
+                    stats["executed"] += 1
+
+        return executor.submit(run)
+
+    def get_queue_stats(self) -> Dict[str, dict]:
+        """
+        Returns per-device queue depth and wait times of the task executors.
+
+        Returns:
+            Dict[str, dict]: { device : {"queued", "running", "executed", "last_wait",
+            "max_wait", "mean_wait"} } with wait times in seconds.
+        """
+        with self.executor_lock:
+            return {
+                device: {
+                    **{
+                        key: value
+                        for key, value in stats.items()
+                        if key != "total_wait"
+                    },
+                    "mean_wait": (
+                        stats["total_wait"] / stats["executed"]
+                        if stats["executed"]
+                        else 0.0
+                    ),
+                }
+                for device, stats in self.queue_stats.items()
+            }
+
     def __schedule_task__(
         self,
         task_name: str,
@@ -59,14 +214,154 @@ class Worker:
             **kwargs (Any): Keyword arguments to pass to the task.
         """
         self.scheduler.add_job(
-            func=self.execute_task,
+            func=self.submit_task,
             trigger="date",
             run_date=run_time,
             args=(task_name, job_id, _callback, args, kwargs),
             id=job_id,
         )
+        self.run_times[job_id] = run_time
         self.logger.debug(f"Scheduled task '{task_name}' to run at {run_time}")
 
+    def __schedule_recurring_task__(
+        self,
+        task_name: str,
+        trigger: str,
+        trigger_args: Dict[str, Any],
+        job_id: str,
+        _callback: Callable,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Schedules a task to run repeatedly, the callback is called after every run.
+
+        Each occurrence is scheduled as a one-off job at the next fire time of the
+        trigger, and schedules the following one when it fires. Once an occurrence
+        finds no further fire time, the run that finishes last gets `last_run=True` in
+        its callback. This is decided from the trigger and the runs in flight, so it does
+        not depend on when the callbacks of earlier runs get to check the scheduler.
+
+        Args:
+            task_name (str): The name of the task to schedule.
+            trigger (str): "interval" or "cron".
+            trigger_args (Dict[str, Any]): Trigger fields as accepted by APScheduler, e.g.
+                {"seconds": 5, "end_date": ...} or {"minute": "*/10"}.
+            job_id (str): The unique identifier of the job.
+            _callback(Callable): Callback function for the run bookkeeping under
+                Timekeeper, called with the `last_run` keyword.
+            *args (Any): Positional arguments to pass to the task.
+            **kwargs (Any): Keyword arguments to pass to the task.
+        """
+        if trigger not in RECURRING_TRIGGERS:
+            raise ValueError(f"Unsupported trigger '{trigger}', use interval or cron.")
+        schedule = RECURRING_TRIGGERS[trigger](**trigger_args)
+        fire_time = schedule.get_next_fire_time(None, datetime.now(schedule.timezone))
+        if fire_time is None:
+            raise ValueError(f"The {trigger} trigger {trigger_args} never fires.")
+        with self.executor_lock:
+            self.recurring[job_id] = {
+                "pending": 0,
+                "final": False,
+                "lock": threading.Lock(),
+            }
+        self.schedule_occurrence(
+            task_name, schedule, fire_time, job_id, _callback, args, kwargs
+        )
+        self.logger.debug(f"Scheduled {trigger} task '{task_name}' with {trigger_args}")
+
+    def schedule_occurrence(
+        self,
+        task_name: str,
+        schedule: BaseTrigger,
+        fire_time: datetime,
+        job_id: str,
+        _callback: Callable,
+        args: tuple,
+        kwargs: dict,
+    ) -> None:
+        options = {}
+        if not isinstance(self.scheduler, PrecisionScheduler):
+            # APScheduler counts the occurrence that schedules this one as a running
+            # instance of the job, and skips late ones, either would end the chain
+            options = {"max_instances": 2, "misfire_grace_time": None}
+        self.scheduler.add_job(
+            func=self.fire_occurrence,
+            trigger="date",
+            run_date=fire_time,
+            args=(task_name, schedule, fire_time, job_id, _callback, args, kwargs),
+            id=job_id,
+            replace_existing=True,
+            **options,
+        )
+
+    def fire_occurrence(
+        self,
+        task_name: str,
+        schedule: BaseTrigger,
+        fire_time: datetime,
+        job_id: str,
+        _callback: Callable,
+        args: tuple,
+        kwargs: dict,
+    ) -> Future:
+        """
+        Runs one occurrence of a recurring job and schedules the next one. Fire times
+        that passed meanwhile are skipped, like APScheduler coalesces missed runs.
+        """
+        now = datetime.now(schedule.timezone)
+        next_time = schedule.get_next_fire_time(fire_time, now)
+        while next_time is not None and next_time <= now:
+            next_time = schedule.get_next_fire_time(next_time, now)
+        with self.executor_lock:
+            state = self.recurring.get(job_id)
+            if state is None:
+                return None  # Cancelled while this occurrence was firing
+            if next_time is None:
+                state["final"] = True
+            else:
+                self.schedule_occurrence(
+                    task_name, schedule, next_time, job_id, _callback, args, kwargs
+                )
+            state["pending"] += 1
+        callback = partial(self.finish_occurrence, state, _callback)
+        return self.submit_task(task_name, job_id, callback, args, kwargs)
+
+    def finish_occurrence(
+        self,
+        state: dict,
+        _callback: Callable,
+        job_id: str,
+        result: bool,
+        error_info: str = None,
+    ) -> None:
+        """
+        Calls back after a run of a recurring job. Runs on the shared executor may finish
+        out of order, so the callbacks of a job are serialized and `last_run` is only
+        set for the run that finishes last after the final occurrence fired.
+        """
+        with state["lock"]:
+            with self.executor_lock:
+                state["pending"] -= 1
+                last_run = state["final"] and state["pending"] == 0
+                if last_run and self.recurring.get(job_id) is state:
+                    del self.recurring[job_id]
+            if _callback is not None:
+                _callback(job_id, result, error_info, last_run=last_run)
+
+    def is_scheduled(self, job_id: str) -> bool:
+        """Whether the job has a pending run, False after the last run of a recurring job."""
+        return self.scheduler.get_job(job_id) is not None
+
+    def get_firing_errors(self) -> list:
+        """
+        Returns (job_id, actual - planned firing time in s) of recent jobs, only
+        recorded by the precision engine.
+        """
+        if isinstance(self.scheduler, PrecisionScheduler):
+            return self.scheduler.get_firing_errors()
+        return []
+
     def remove_scheduled_task(self, job_id: str) -> None:
         """
         Removes a scheduled task from the scheduler.
@@ -74,6 +369,9 @@ class Worker:
         Args:
             job_id (str): The unique identifier of the job to be removed.
         """
+        self.run_times.pop(job_id, None)
+        with self.executor_lock:
+            self.recurring.pop(job_id, None)
         try:
             self.scheduler.remove_job(job_id)
             self.logger.info(
@@ -102,6 +400,11 @@ class Worker:
             self.logger.info("APScheduler is already stopped.")
         except Exception as e:
             self.logger.error(f"Error stopping APScheduler: {e}.")
+        with self.executor_lock:
+            executors, self.executors = list(self.executors.values()), {}
+        for executor in executors:
+            # Queued jobs are dropped, a task talking to an instrument is left to finish
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def execute_task(
         self,
@@ -129,8 +432,14 @@ class Worker:
         error_info = None  # Initialize a variable to store exception info
         if task_func:
             self.logger.info(f"Executing task '{task_name}'(id:{job_id}).")
+            if self.on_start is not None and job_id:
+                try:
+                    self.on_start(task_name, job_id)
+                except Exception as e:
+                    self.logger.error(f"Start hook of job {job_id} failed: {e}")
             try:
-                self.function_map.parse_and_call(task_func, *args, **kwargs)
+                with TASK_DURATION.time(task=task_name):
+                    self.function_map.parse_and_call(task_func, *args, **kwargs)
                 result = True
                 self.logger.info(
                     f"Task '{task_name}' successfully executed."
@@ -139,6 +448,7 @@ class Worker:
                 error_info = traceback.format_exc()  # Capture and format the traceback
                 self.logger.error(f"Task '{task_name}' failed to execute. Error: {e}")
                 self.logger.error(f"{error_info}")
+            TASK_RESULTS.inc(task=task_name, result="success" if result else "failure")
         else:
             self.logger.error(f"Task '{task_name}' is not registered.")
         if _callback and job_id:
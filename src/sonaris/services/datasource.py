@@ -1,21 +1,35 @@
+import asyncio
+import base64
+import hashlib
 import json
+import threading
+import traceback
+from collections import OrderedDict
 from datetime import datetime
 from logging import Logger
 from pathlib import Path
-from typing import Optional
-import traceback
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
 import yaml
-from fastapi import FastAPI
+from fastapi import FastAPI, Query, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
 from sonaris.defaults import (
+    DATA_SOURCE_CACHE_SIZE,
     DATA_SOURCE_NAME,
     DATA_SOURCE_PORT,
     GF_PROVISIONING_DIR,
+    STREAM_KEEPALIVE,
+    STREAM_QUEUE_SIZE,
 )
-from sonaris.services.dashboards import DS_SONARIS_DATASOURCE,TASK_DASHBOARD
+from sonaris.frontend.managers.edux1002a import EDUX1002AManager
+from sonaris.scheduler.events import CHANGE_EVENTS, JobEvent
 from sonaris.scheduler.timekeeper import Timekeeper
+from sonaris.services.dashboards import DS_SONARIS_DATASOURCE, TASK_DASHBOARD
 from sonaris.services.service import MultithreadedServer, Service
+from sonaris.services.stream import WaveformStream
 from sonaris.utils.log import get_logger
+from sonaris.utils.metrics import get_metrics
 
 logger = get_logger()
 
@@ -27,13 +41,33 @@ class DataSourceService(Service):
         port: int = None,
         logger: Optional[Logger] = None,
         name: str = None,
+        oscilloscope: Optional[EDUX1002AManager] = None,
+        cache_size: int = DATA_SOURCE_CACHE_SIZE,
     ):
+        """
+        Args:
+            timekeeper (Timekeeper): Source of the scheduled and archived jobs.
+            oscilloscope (EDUX1002AManager, optional): Enables the waveform stream
+                endpoints, which relay the frames this manager acquires.
+            cache_size (int): Number of responses cached, the least recently requested
+                is dropped first. Grafana sends a new time range on every refresh.
+        """
         super().__init__()
         self.name = str(name) or str(DATA_SOURCE_NAME)
         self.timekeeper = timekeeper
         self.port = port or DATA_SOURCE_PORT
         self.logger = logger or get_logger()
         self.app = FastAPI(title="Sonaris Data Source Service")
+        # (source, query parameters) -> (serialized body, ETag), least recent first
+        self.cache: "OrderedDict[tuple, Tuple[bytes, str]]" = OrderedDict()
+        self.cache_size = cache_size
+        self.cache_lock = threading.Lock()
+        self.generation = 0
+        # Synchronous, so a request right after a change never sees the old rows
+        self.timekeeper.events.subscribe(
+            self.invalidate, CHANGE_EVENTS, synchronous=True
+        )
+        self.waveforms = WaveformStream(oscilloscope) if oscilloscope else None
         self.setup_routes()
 
         # Prepare the Uvicorn config here
@@ -46,12 +80,11 @@ class DataSourceService(Service):
         host="http://host.docker.internal", port=DATA_SOURCE_PORT, name=DATA_SOURCE_NAME
     ):
         # Update the data source type to match the plugin being used (e.g., for Grafana Infinity)
-        return DS_SONARIS_DATASOURCE(str(host),str(port))
+        return DS_SONARIS_DATASOURCE(str(host), str(port))
 
     @staticmethod
     def get_dashboard_manifest(
         host="http://host.docker.internal", port=DATA_SOURCE_PORT, name=DATA_SOURCE_NAME
-
     ):
         try:
             return json.loads(TASK_DASHBOARD)
@@ -59,32 +92,32 @@ class DataSourceService(Service):
             logger.error(f"Error loading TASK_DASHBOARD: {e}")
             logger.error(f"{traceback.format_exc()}")
             return {}
+
     @staticmethod
     def dashboard_config():
         return {
-            "apiVersion":
-            1,
-            "providers": [{
-                "name": "dashboards",
-                "orgId": 1,
-                "folderUid": "",
-                "type": "file",
-                "disableDeletion": True,
-                "updateIntervalSeconds": 15,
-                "allowUiUpdates": False,
-                "options": {
-                    "path": "/etc/grafana/provisioning/dashboards",
-                    "foldersFromFilesStructure": True,
-                },
-            }],
+            "apiVersion": 1,
+            "providers": [
+                {
+                    "name": "dashboards",
+                    "orgId": 1,
+                    "folderUid": "",
+                    "type": "file",
+                    "disableDeletion": True,
+                    "updateIntervalSeconds": 15,
+                    "allowUiUpdates": False,
+                    "options": {
+                        "path": "/etc/grafana/provisioning/dashboards",
+                        "foldersFromFilesStructure": True,
+                    },
+                }
+            ],
         }
 
-    def write_provisioning_files(
-        self, provisioning_dir: str
-    ):
+    def write_provisioning_files(self, provisioning_dir: str):
         # Ensure directories exist
-        datasources_dir = Path (provisioning_dir or GF_PROVISIONING_DIR ) / "datasources"
-        dashboards_dir = Path(provisioning_dir or GF_PROVISIONING_DIR ) / "dashboards"
+        datasources_dir = Path(provisioning_dir or GF_PROVISIONING_DIR) / "datasources"
+        dashboards_dir = Path(provisioning_dir or GF_PROVISIONING_DIR) / "dashboards"
 
         datasources_dir.mkdir(parents=True, exist_ok=True)
         dashboards_dir.mkdir(parents=True, exist_ok=True)
@@ -108,73 +141,234 @@ class DataSourceService(Service):
         logger.info(f"Datasource files written: {data_source_path}")
         logger.info(f"Dashboard files written: {dashboard_path}")
 
+    def invalidate(self, event: JobEvent = None) -> None:
+        """Drops the cached responses, subscribed to the Timekeeper job changes."""
+        with self.cache_lock:
+            self.generation += 1
+            self.cache.clear()
+
+    @staticmethod
+    def format_job(
+        job_id: str, job: Dict[str, Any], default_result: str
+    ) -> Dict[str, Any]:
+        # Timestamps are stored as ISO strings already, no need to parse them
+        return {
+            "id": job_id,
+            "timestamp": job["created"],
+            "task": job["task"],
+            "result": job.get("result", default_result),
+            "kwargs": job.get("kwargs", {}),
+            "schedule_time": job["schedule_time"],
+        }
+
+    @staticmethod
+    def matches(
+        row: Dict[str, Any],
+        start: Optional[datetime],
+        end: Optional[datetime],
+        task: Optional[str],
+        result: Optional[str],
+    ) -> bool:
+        if task is not None and row["task"] != task:
+            return False
+        if result is not None and str(row["result"]).lower() != result.lower():
+            return False
+        if start is not None or end is not None:
+            schedule_time = datetime.fromisoformat(row["schedule_time"])
+            if start is not None and schedule_time < start:
+                return False
+            if end is not None and schedule_time >= end:
+                return False
+        return True
+
+    def query_rows(
+        self,
+        source: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        task: Optional[str] = None,
+        result: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Formats and filters the scheduled ("jobs") or finished ("archive") jobs.
+
+        Args:
+            source (str): "jobs" or "archive".
+            start (datetime, optional): Only jobs scheduled at or after this time.
+            end (datetime, optional): Only jobs scheduled before this time.
+            task (str, optional): Only jobs of this task.
+            result (str, optional): Only jobs with this result, e.g. "true", "Pending".
+            offset (int): Number of matching jobs to skip.
+            limit (int, optional): Maximum number of jobs, all remaining if None.
+
+        Returns:
+            List[Dict[str, Any]]: The formatted rows, archived jobs newest first.
+        """
+        filtered = any(value is not None for value in (start, end, task, result))
+        if source == "archive":
+            if filtered:
+                # The store looks up task and time range, the result is matched below
+                jobs = self.timekeeper.find_archive(task, start, end)
+            else:
+                # Without filters the archive is paged by the store itself
+                jobs = self.timekeeper.get_archive(offset, limit)
+            default_result = "Completed"
+        else:
+            jobs = self.timekeeper.get_jobs()
+            default_result = "Pending"
+
+        rows = [
+            self.format_job(job_id, job, default_result) for job_id, job in jobs.items()
+        ]
+        if filtered or source != "archive":
+            rows = [row for row in rows if self.matches(row, start, end, task, result)]
+            rows = rows[offset:] if limit is None else rows[offset : offset + limit]
+        return rows
+
+    def cached_response(
+        self, key: tuple, build: Callable[[], Any]
+    ) -> Tuple[bytes, str]:
+        """
+        Returns the serialized body and ETag for `key`, building it only if the jobs
+        changed since the last request with the same parameters.
+        """
+        with self.cache_lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                return self.cache[key]
+            generation = self.generation
+        body = json.dumps(build(), default=str).encode()
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        with self.cache_lock:
+            # A change while building means the body may already be stale
+            if generation == self.generation:
+                self.cache[key] = (body, etag)
+                while len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+        return body, etag
+
+    def respond(
+        self, request: Request, key: tuple, build: Callable[[], Any]
+    ) -> Response:
+        body, etag = self.cached_response(key, build)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
 
     def setup_routes(self):
 
-        @self.app.get("/jobs")
-        async def get_jobs():
-            # Fetch jobs data
-            jobs_data = self.timekeeper.get_jobs()  # This returns a dict of jobs
+        def route(source: str):
+            async def get_rows(
+                request: Request,
+                start: Optional[datetime] = None,
+                end: Optional[datetime] = None,
+                task: Optional[str] = None,
+                result: Optional[str] = None,
+                offset: int = Query(0, ge=0),
+                limit: Optional[int] = Query(None, ge=0),
+            ):
+                def build():
+                    rows = self.query_rows(
+                        source, start, end, task, result, offset, limit
+                    )
+                    # Grafana renders an empty list as "no data", keep a readable row
+                    return rows or [{"task": "No tasks found"}]
 
-            # Check if jobs_data is empty and return a message if true
-            if not jobs_data:
-                return [{"task": "No tasks found"}]
+                key = (source, start, end, task, result, offset, limit)
+                return self.respond(request, key, build)
 
-            # Otherwise, format and return jobs data
-            formatted_jobs = [
-                {
-                    "id":
-                    job_id,
-                    "timestamp":
-                    datetime.strptime(job["created"],
-                                    "%Y-%m-%dT%H:%M:%S.%f").isoformat(),
-                    "task":
-                    job["task"],
-                    "result":
-                    job.get(
-                        "result",
-                        "Pending"),  # Default to "Pending" if result is not set
-                    "kwargs":
-                    job["kwargs"],
-                    "schedule_time":
-                    datetime.strptime(job["schedule_time"],
-                                    "%Y-%m-%dT%H:%M:%S.%f"),
-                } for job_id, job in jobs_data.items()
-            ]
-            return formatted_jobs
-
-        @self.app.get("/archive")
-        async def get_archive():
-            # Fetch archive data
-            archive_data = self.timekeeper.get_archive(
-            )  # This returns a dict of archived jobs
-
-            # Check if archive_data is empty and return a message if true
-            if not archive_data:
-                return [{"task": "No tasks found"}]
-
-            # Otherwise, format and return archive data
-            formatted_archive = [
-                {
-                    "id":
-                    archive_id,
-                    "timestamp":
-                    datetime.strptime(archive["created"],
-                                    "%Y-%m-%dT%H:%M:%S.%f").isoformat(),
-                    "task":
-                    archive["task"],
-                    "result":
-                    archive.get("result", "Completed"
-                                ),  # Default to "Completed" if result is not set
-                    "kwargs":
-                    archive["kwargs"],
-                    "schedule_time":
-                    datetime.strptime(archive["schedule_time"],
-                                    "%Y-%m-%dT%H:%M:%S.%f"),
-                } for archive_id, archive in archive_data.items()
-            ]
-            return formatted_archive
+            return get_rows
+
+        self.app.get("/jobs")(route("jobs"))
+        self.app.get("/archive")(route("archive"))
+
+        @self.app.get("/metrics", response_class=PlainTextResponse)
+        async def get_metrics_text():
+            # Prometheus text exposition format, version 0.0.4
+            return PlainTextResponse(
+                get_metrics().render_prometheus(),
+                media_type="text/plain; version=0.0.4; charset=utf-8",
+            )
+
+        @self.app.get("/metrics/series")
+        async def get_metrics_series(
+            metric: Optional[str] = None, since: Optional[float] = None
+        ):
+            # Flat rows for the Infinity datasource, `since` is a UNIX time in ms
+            return get_metrics().series(
+                metric, since / 1000 if since is not None else None
+            )
+
+        if self.waveforms is not None:
+            self.setup_stream_routes()
+
+    def setup_stream_routes(self):
+        # Frames are `encode_frame` payloads: a uint32 row and point count, then the
+        # time axis and each channel as little-endian float32 rows.
+
+        @self.app.websocket("/stream/waveform")
+        async def stream_waveform(
+            websocket: WebSocket,
+            decimation: int = Query(1, ge=1),
+            queue_size: int = Query(STREAM_QUEUE_SIZE, ge=1),
+        ):
+            await websocket.accept()
+            subscriber = self.waveforms.subscribe(
+                asyncio.get_running_loop(), decimation, queue_size
+            )
+
+            async def send_frames():
+                while True:
+                    # Awaiting the send is the backpressure, frames queued meanwhile
+                    # are dropped oldest first by the subscriber
+                    await websocket.send_bytes(await subscriber.get())
+
+            sender = asyncio.create_task(send_frames())
+            try:
+                # Viewers only listen, receive returns once they disconnect
+                while (await websocket.receive())["type"] != "websocket.disconnect":
+                    pass
+            except WebSocketDisconnect:
+                pass
+            finally:
+                sender.cancel()
+                self.waveforms.unsubscribe(subscriber)
+
+        @self.app.get("/stream/waveform/sse")
+        async def stream_waveform_sse(
+            request: Request,
+            decimation: int = Query(1, ge=1),
+            queue_size: int = Query(STREAM_QUEUE_SIZE, ge=1),
+        ):
+            subscriber = self.waveforms.subscribe(
+                asyncio.get_running_loop(), decimation, queue_size
+            )
+
+            async def events():
+                # SSE is text only, frames are sent base64 encoded
+                try:
+                    while not await request.is_disconnected():
+                        try:
+                            payload = await asyncio.wait_for(
+                                subscriber.get(), STREAM_KEEPALIVE
+                            )
+                        except asyncio.TimeoutError:
+                            yield ": keepalive\n\n"
+                            continue
+                        data = base64.b64encode(payload).decode()
+                        yield f"event: frame\ndata: {data}\n\n"
+                finally:
+                    self.waveforms.unsubscribe(subscriber)
+
+            return StreamingResponse(events(), media_type="text/event-stream")
 
+        @self.app.get("/stream/waveform/stats")
+        async def stream_waveform_stats():
+            return self.waveforms.get_stats()
 
     def start(self):
         self.logger.info("Starting DataSourceService...")
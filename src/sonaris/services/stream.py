@@ -0,0 +1,157 @@
+import asyncio
+import struct
+import threading
+from typing import Dict, List
+
+import numpy as np
+
+from sonaris.defaults import STREAM_QUEUE_SIZE
+from sonaris.frontend.managers.edux1002a import EDUX1002AManager
+from sonaris.utils.log import get_logger
+
+logger = get_logger()
+
+# Little-endian uint32 row count and uint32 points per row
+FRAME_HEADER = struct.Struct("<II")
+
+
+def encode_frame(
+    time_axis: np.ndarray, voltages: np.ndarray, decimation: int = 1
+) -> bytes:
+    """
+    Packs a frame as the binary payload of the waveform stream: `FRAME_HEADER` followed
+    by the rows time axis, channel 1, channel 2, ... as little-endian float32, each row
+    keeping every `decimation`-th sample.
+
+    Args:
+        time_axis (np.ndarray): Sample times in seconds.
+        voltages (np.ndarray): Channel voltages, one row per channel.
+        decimation (int): Sample stride, 1 sends every sample.
+
+    Returns:
+        bytes: The encoded frame.
+    """
+    rows = np.vstack(
+        [np.asarray(time_axis)[::decimation], np.atleast_2d(voltages)[:, ::decimation]]
+    ).astype("<f4", copy=False)
+    return FRAME_HEADER.pack(*rows.shape) + rows.tobytes()
+
+
+def decode_frame(payload: bytes) -> np.ndarray:
+    """Inverse of `encode_frame`, returns the (rows, points) float32 array."""
+    rows, points = FRAME_HEADER.unpack_from(payload)
+    return np.frombuffer(payload, dtype="<f4", offset=FRAME_HEADER.size).reshape(
+        rows, points
+    )
+
+
+class WaveformSubscriber:
+    """
+    Bounded frame queue of one remote viewer, living on the event loop that serves it.
+    When the viewer falls behind the oldest queued frame is dropped, so a slow client
+    sees fewer but current frames and never holds back the acquisition.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        decimation: int = 1,
+        queue_size: int = STREAM_QUEUE_SIZE,
+    ):
+        if decimation < 1:
+            raise ValueError("Decimation must be at least 1.")
+        self.loop = loop
+        self.decimation = decimation
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max(queue_size, 1))
+        self.dropped = 0
+        self.sent = 0
+
+    def offer(self, payload: bytes) -> None:
+        """Queues a payload from any thread."""
+        self.loop.call_soon_threadsafe(self.put, payload)
+
+    def put(self, payload: bytes) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(payload)
+
+    async def get(self) -> bytes:
+        payload = await self.queue.get()
+        self.sent += 1
+        return payload
+
+
+class WaveformStream:
+    """
+    Fans out the frames acquired by `EDUX1002AManager` to any number of remote viewers.
+    The stream listens to frames the acquisition already captured, all subscribers share
+    that single acquisition and none of them queries the instrument. Every frame is
+    encoded once per distinct decimation, not once per subscriber.
+
+    Args:
+        manager (EDUX1002AManager): The oscilloscope manager whose frames are streamed.
+    """
+
+    def __init__(self, manager: EDUX1002AManager):
+        self.manager = manager
+        self.subscribers: List[WaveformSubscriber] = []
+        self.lock = threading.Lock()
+        manager.add_frame_listener(self.publish)
+
+    def subscribe(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        decimation: int = 1,
+        queue_size: int = STREAM_QUEUE_SIZE,
+    ) -> WaveformSubscriber:
+        """Registers a viewer, it receives the last captured frame right away."""
+        subscriber = WaveformSubscriber(loop, decimation, queue_size)
+        with self.lock:
+            self.subscribers.append(subscriber)
+        last_frame = self.manager.last_frame
+        if last_frame is not None:
+            subscriber.offer(encode_frame(*last_frame, decimation))
+        logger.info(f"Waveform subscriber added, {len(self.subscribers)} connected.")
+        return subscriber
+
+    def unsubscribe(self, subscriber: WaveformSubscriber) -> None:
+        with self.lock:
+            if subscriber in self.subscribers:
+                self.subscribers.remove(subscriber)
+        logger.info(
+            f"Waveform subscriber removed after {subscriber.sent} frames "
+            f"({subscriber.dropped} dropped), {len(self.subscribers)} connected."
+        )
+
+    def publish(self, time_axis: np.ndarray, voltages: np.ndarray) -> None:
+        """Frame listener, runs on the acquiring thread."""
+        with self.lock:
+            subscribers = list(self.subscribers)
+        payloads: Dict[int, bytes] = {}
+        for subscriber in subscribers:
+            payload = payloads.get(subscriber.decimation)
+            if payload is None:
+                payload = payloads[subscriber.decimation] = encode_frame(
+                    time_axis, voltages, subscriber.decimation
+                )
+            try:
+                subscriber.offer(payload)
+            except RuntimeError:
+                # The serving event loop is closed, the viewer is gone
+                self.unsubscribe(subscriber)
+
+    def close(self) -> None:
+        self.manager.remove_frame_listener(self.publish)
+
+    def get_stats(self) -> List[Dict[str, int]]:
+        with self.lock:
+            return [
+                {
+                    "decimation": subscriber.decimation,
+                    "queued": subscriber.queue.qsize(),
+                    "sent": subscriber.sent,
+                    "dropped": subscriber.dropped,
+                }
+                for subscriber in self.subscribers
+            ]
@@ -0,0 +1,106 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from enum import Enum
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
+
+from sonaris.tasks.model import Experiment, ExperimentWrapper
+from sonaris.tasks.task_validator import Validator
+
+
+@dataclass(frozen=True)
+class PlanStep:
+    """
+    A resolved experiment step.
+
+    Attributes:
+        index (int): Position of the step in the experiment configuration.
+        task_name (str): Registered task name the worker executes.
+        offset (float): Seconds after the start of the experiment the step fires.
+        parameters (Mapping[str, Any]): Read-only keyword arguments of the task.
+    """
+
+    index: int
+    task_name: str
+    offset: float
+    parameters: Mapping[str, Any]
+    description: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ExperimentPlan:
+    """Immutable, time-ordered sequence of steps produced by `compile_experiment`."""
+
+    plan_id: str
+    name: Optional[str]
+    steps: Tuple[PlanStep, ...]
+
+    @property
+    def duration(self) -> float:
+        return self.steps[-1].offset if self.steps else 0.0
+
+
+def resolve_task_name(
+    task: str, task_functions: Dict[str, Callable], task_enum: Optional[Enum]
+) -> str:
+    """Maps a configured task, given by enum name or value, to its registered name."""
+    if task in task_functions:
+        return task
+    if task_enum is not None:
+        task_name = Validator.get_task_enum_value(task.strip(), task_enum)
+        if task_name in task_functions:
+            return task_name
+    raise ValueError(f"Unknown task: '{task}'")
+
+
+def compile_experiment(
+    experiment: Union[ExperimentWrapper, Experiment],
+    task_functions: Dict[str, Callable],
+    task_enum: Optional[Enum] = None,
+) -> ExperimentPlan:
+    """
+    Compiles an experiment configuration into an immutable plan. Step delays are
+    offsets from the experiment start, steps with equal delays keep their configured
+    order, so the same configuration always yields the same sequence.
+
+    Args:
+        experiment (Union[ExperimentWrapper, Experiment]): The loaded configuration.
+        task_functions (Dict[str, Callable]): Registered tasks, see `get_tasks(flatten=True)`.
+        task_enum (Optional[Enum]): Enum used to resolve task names given by alias.
+
+    Returns:
+        ExperimentPlan: The compiled plan.
+
+    Raises:
+        ValueError: If a task is unknown or a delay is negative.
+    """
+    if isinstance(experiment, ExperimentWrapper):
+        experiment = experiment.experiment
+
+    steps = []
+    for index, step in enumerate(experiment.steps):
+        delay = float(step.delay or 0.0)
+        if delay < 0:
+            raise ValueError(f"Step {index + 1}: negative delay {delay}")
+        steps.append(
+            PlanStep(
+                index=index,
+                task_name=resolve_task_name(step.task, task_functions, task_enum),
+                offset=delay,
+                parameters=MappingProxyType(dict(step.parameters)),
+                description=step.description,
+            )
+        )
+    # sorted() is stable, equal offsets stay in configuration order
+    steps = tuple(sorted(steps, key=lambda step: step.offset))
+
+    digest = hashlib.sha256(
+        json.dumps(
+            [experiment.name]
+            + [[s.task_name, s.offset, dict(s.parameters)] for s in steps],
+            sort_keys=True,
+            default=str,
+        ).encode()
+    ).hexdigest()[:12]
+    return ExperimentPlan(plan_id=digest, name=experiment.name, steps=steps)
@@ -9,6 +9,8 @@ from sonaris.tasks.task_decorator import parameter_annotations, parameter_constr
 """
 These tasks are used by the scheduler, they are wrappers for the scheduler to call the manager objects.
 You will have to point to them under header.py
+Every instrument access holds the manager's `device_lock`, the GUI and the health poller
+talk to the same instrument from their own threads.
 """
 
 
@@ -21,10 +23,12 @@ class TaskName(Enum):
 
 @parameter_constraints(channel=(1, 2), output=["ON", "OFF"])
 def task_on_off_dg4202(channel: int, output: bool) -> bool:
-    factory.dg4202_manager.device.output_on_off(
-        channel=channel,
-        status=output,  # the decorator above will be handled by ui_factory.py
-    )
+    manager = factory.dg4202_manager
+    with manager.device_lock:
+        manager.get_device().output_on_off(
+            channel=channel,
+            status=output,  # the decorator above will be handled by ui_factory.py
+        )
     return True
 
 
@@ -48,16 +52,19 @@ def task_set_waveform_parameters(
     frequency: float,
     offset: float,
 ) -> bool:
-    factory.dg4202_manager.device.set_waveform(
-        channel=channel,
-        waveform_type=waveform_type,
-        amplitude=amplitude,
-        frequency=frequency,
-        params=None,
-        offset=offset,
-    )
-    if send_on:
-        factory.dg4202_manager.device.output_on_off(channel, True)
+    manager = factory.dg4202_manager
+    with manager.device_lock:
+        device = manager.get_device()
+        device.set_waveform(
+            channel=channel,
+            waveform_type=waveform_type,
+            amplitude=amplitude,
+            frequency=frequency,
+            params=None,
+            offset=offset,
+        )
+        if send_on:
+            device.output_on_off(channel, True)
     return True
 
 
@@ -96,18 +103,21 @@ def task_set_sweep_parameters(
         "HTIME_START": htime_start,
         "HTIME_STOP": htime_stop,
     }
-    factory.dg4202_manager.device.set_sweep_parameters(
-        channel=channel, sweep_params=params
-    )
-    if send_on:
-        factory.dg4202_manager.device.output_on_off(channel, True)
+    manager = factory.dg4202_manager
+    with manager.device_lock:
+        device = manager.get_device()
+        device.set_sweep_parameters(channel=channel, sweep_params=params)
+        if send_on:
+            device.output_on_off(channel, True)
     return True
 
 
 @parameter_constraints(press=["OK"])
 def task_auto_edux1002a(press: str):
     # for testing, kwarg_value means nothing
-    factory.edux1002a_manager.device.autoscale()
+    manager = factory.edux1002a_manager
+    with manager.device_lock:
+        manager.get_device().autoscale()
     return True
 
 
@@ -0,0 +1,95 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+from sonaris.utils.jsonl import JSONLinesLog
+from sonaris.utils.log import get_logger, load_json_with_backup
+
+logger = get_logger()
+
+
+class EventLog(JSONLinesLog):
+    """
+    Append-only JSON Lines log of monitor events, stored in rotated `JSONLinesLog`
+    segments like `ArchiveLog`. Appending writes one line, reading pages walks the
+    segments backwards from their end, so the newest events are found without reading
+    the rest.
+
+    Args:
+        path (Path): Active log file, e.g. monitor.jsonl.
+        max_bytes (int): Size at which the active file is rotated.
+        backups (int): Number of rotated segments kept.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = 1024 * 1024, backups: int = 5):
+        super().__init__(path, max_bytes, backups)
+        # Only events that decode, the number of entries `read_page` can return
+        self.count = sum(self.count_events(path) for path in self.segments())
+
+    @classmethod
+    def open(cls, legacy_path: Path, **options) -> "EventLog":
+        """
+        Opens the log next to `legacy_path` (monitor.json becomes monitor.jsonl) and
+        imports the events of an existing JSON list file once.
+        """
+        legacy_path = Path(legacy_path)
+        event_log = cls(legacy_path.with_suffix(".jsonl"), **options)
+        if legacy_path.suffix != ".jsonl" and legacy_path.exists():
+            events = load_json_with_backup(legacy_path) or []
+            for event in events:
+                event_log.write(event)
+            if legacy_path.exists():
+                legacy_path.rename(
+                    legacy_path.with_name(f"{legacy_path.name}.migrated")
+                )
+            logger.info(f"Migrated {len(events)} monitor events to {event_log.path}")
+        return event_log
+
+    def count_events(self, path: Path) -> int:
+        return sum(1 for _ in self.read_segment(path))
+
+    def append(self, description: str, timestamp: datetime = None) -> Dict[str, Any]:
+        """Logs an event now, returns the stored entry."""
+        event = {
+            "timestamp": (timestamp or datetime.now()).isoformat(),
+            "description": description,
+        }
+        self.write(event)
+        return event
+
+    def write(self, event: Dict[str, Any]) -> None:
+        with self.lock:
+            super().write(event)
+            self.count += 1
+            self.rotate_if_full()
+
+    def dropped(self, path: Path) -> None:
+        self.count -= self.count_events(path)
+
+    def read_page(self, offset: int = 0, limit: int = None) -> List[Dict[str, Any]]:
+        """
+        Returns events newest first.
+
+        Args:
+            offset (int): Number of newest events to skip.
+            limit (int, optional): Maximum number of events, all remaining if None.
+
+        Returns:
+            List[Dict[str, Any]]: {"timestamp", "description"} entries, newest first.
+        """
+        page = []
+        with self.lock:
+            for position, event in enumerate(self.newest_entries()):
+                if limit is not None and len(page) >= limit:
+                    break
+                if position >= offset:
+                    page.append(event)
+        return page
+
+    def clear(self) -> None:
+        with self.lock:
+            super().clear()
+            self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
@@ -0,0 +1,139 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from sonaris.utils.log import get_logger
+
+logger = get_logger()
+
+
+class JSONLinesLog:
+    """
+    Append-only JSON Lines file split into size bounded segments, the storage shared by
+    `ArchiveLog` and `EventLog`. Once the active file exceeds `max_bytes` it is rotated
+    to `<name>.1`, older segments shift up to `<name>.<backups>` and the oldest one is
+    deleted. Reading newest first walks the segments backwards from their end, so recent
+    entries are found without reading the rest.
+
+    Lines that do not decode, e.g. torn by a crash mid-write, are skipped by every read,
+    subclasses count entries the same way so their length matches what reads return.
+
+    Args:
+        path (Path): Active log file, e.g. archive.jsonl.
+        max_bytes (int): Size at which the active file is rotated.
+        backups (int): Number of rotated segments kept.
+    """
+
+    BLOCK_SIZE = 64 * 1024
+
+    def __init__(self, path: Path, max_bytes: int, backups: int):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.lock = threading.RLock()
+        # A torn last line must not swallow the next entry
+        self.terminated = self.ends_with_newline(self.path)
+
+    @staticmethod
+    def ends_with_newline(path: Path) -> bool:
+        if not path.exists() or path.stat().st_size == 0:
+            return True
+        with open(path, "rb") as file:
+            file.seek(-1, os.SEEK_END)
+            return file.read(1) == b"\n"
+
+    def segments(self) -> List[Path]:
+        """Log files, newest first."""
+        rotated = [
+            self.path.with_name(f"{self.path.name}.{index}")
+            for index in range(1, self.backups + 1)
+        ]
+        return [path for path in [self.path] + rotated if path.exists()]
+
+    def decode(self, line: bytes) -> Optional[Dict[str, Any]]:
+        """Returns the entry of a line, None if it is corrupt."""
+        try:
+            entry = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        return entry if isinstance(entry, dict) else None
+
+    def read_segment(self, path: Path) -> Iterator[Dict[str, Any]]:
+        """Yields the entries of one segment, oldest first."""
+        with open(path, "rb") as file:
+            for line in file:
+                if line.strip():
+                    yield from self.checked(line, path)
+
+    def checked(self, line: bytes, path: Path) -> Iterator[Dict[str, Any]]:
+        entry = self.decode(line)
+        if entry is None:
+            logger.warning(f"Skipped corrupt line in {path}")
+        else:
+            yield entry
+
+    @classmethod
+    def reverse_lines(cls, path: Path) -> Iterator[bytes]:
+        """Yields the lines of a file last first, reading it in blocks from the end."""
+        with open(path, "rb") as file:
+            position = file.seek(0, os.SEEK_END)
+            remainder = b""
+            while position > 0:
+                size = min(cls.BLOCK_SIZE, position)
+                position -= size
+                file.seek(position)
+                lines = (file.read(size) + remainder).split(b"\n")
+                # The first piece may continue in the previous block
+                remainder = lines.pop(0)
+                for line in reversed(lines):
+                    if line.strip():
+                        yield line
+            if remainder.strip():
+                yield remainder
+
+    def newest_entries(self) -> Iterator[Dict[str, Any]]:
+        """Yields the entries newest first across all segments."""
+        for path in self.segments():
+            for line in self.reverse_lines(path):
+                yield from self.checked(line, path)
+
+    def write(self, entry: Dict[str, Any]) -> None:
+        """Appends one line, `rotate_if_full` is left to the caller."""
+        line = json.dumps(entry, default=str) + "\n"
+        with self.lock:
+            with open(self.path, "a") as file:
+                file.write(line if self.terminated else "\n" + line)
+            self.terminated = True
+
+    def rotate_if_full(self) -> None:
+        with self.lock:
+            if self.path.exists() and self.path.stat().st_size > self.max_bytes:
+                self.rotate()
+
+    def rotate(self) -> None:
+        with self.lock:
+            oldest = self.path.with_name(f"{self.path.name}.{self.backups}")
+            if oldest.exists():
+                self.dropped(oldest)
+                oldest.unlink()
+            for index in range(self.backups - 1, 0, -1):
+                segment = self.path.with_name(f"{self.path.name}.{index}")
+                if segment.exists():
+                    segment.rename(self.path.with_name(f"{self.path.name}.{index + 1}"))
+            if self.backups > 0:
+                self.path.rename(self.path.with_name(f"{self.path.name}.1"))
+            else:
+                self.dropped(self.path)
+                self.path.unlink()
+            logger.info(f"Rotated log {self.path}")
+
+    def dropped(self, path: Path) -> None:
+        """Called with a segment right before rotation deletes it."""
+
+    def clear(self) -> None:
+        with self.lock:
+            for path in self.segments():
+                path.unlink()
+            self.terminated = True
@@ -0,0 +1,267 @@
+import bisect
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Tuple
+
+from sonaris.defaults import METRICS_BUCKETS, METRICS_HISTORY
+
+# Sorted (label, value) pairs identifying one series of a metric
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def format_labels(key: LabelKey, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ""
+    escaped = (
+        (name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in pairs
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+class Metric:
+    """
+    Base of the in-process metrics. Updates take a lock and touch a few numbers, so they
+    are cheap enough for every SCPI call. The newest `history` samples are kept with
+    their wall clock time for the JSON time series of the datasource service.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, description: str, history: int = METRICS_HISTORY):
+        self.name = name
+        self.description = description
+        self.lock = threading.Lock()
+        # (time.time(), label key, value), oldest first
+        self.samples = deque(maxlen=history)
+
+    def record(self, key: LabelKey, value: float) -> None:
+        self.samples.append((time.time(), key, value))
+
+    def series(self, since: float = None) -> List[Tuple[float, LabelKey, float]]:
+        with self.lock:
+            samples = list(self.samples)
+        if since is not None:
+            samples = [sample for sample in samples if sample[0] >= since]
+        return samples
+
+    def expose(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """Monotonically increasing count, e.g. reconnects or failed tasks."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, description: str, history: int = METRICS_HISTORY):
+        super().__init__(name, description, history)
+        self.values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = label_key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0.0) + amount
+            self.record(key, self.values[key])
+
+    def get(self, **labels: Any) -> float:
+        with self.lock:
+            return self.values.get(label_key(labels), 0.0)
+
+    def expose(self) -> List[str]:
+        with self.lock:
+            return [
+                f"{self.name}{format_labels(key)} {value}"
+                for key, value in self.values.items()
+            ]
+
+
+class Gauge(Metric):
+    """Value that goes up and down, e.g. the depth of a task queue."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, description: str, history: int = METRICS_HISTORY):
+        super().__init__(name, description, history)
+        self.values: Dict[LabelKey, float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = label_key(labels)
+        with self.lock:
+            self.values[key] = value
+            self.record(key, value)
+
+    def get(self, **labels: Any) -> float:
+        with self.lock:
+            return self.values.get(label_key(labels), 0.0)
+
+    def expose(self) -> List[str]:
+        with self.lock:
+            return [
+                f"{self.name}{format_labels(key)} {value}"
+                for key, value in self.values.items()
+            ]
+
+
+class Histogram(Metric):
+    """
+    Distribution of observed values in cumulative buckets, e.g. latencies in seconds.
+
+    Args:
+        buckets (Tuple[float, ...]): Upper bounds of the buckets, ascending.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        buckets: Tuple[float, ...] = METRICS_BUCKETS,
+        history: int = METRICS_HISTORY,
+    ):
+        super().__init__(name, description, history)
+        self.buckets = tuple(sorted(buckets))
+        # label key -> [per-bucket counts (+Inf last), sum, count]
+        self.values: Dict[LabelKey, list] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = label_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            entry = self.values.get(key)
+            if entry is None:
+                entry = self.values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+            self.record(key, value)
+
+    def time(self, **labels: Any) -> "Timer":
+        """Context manager observing the duration of its block."""
+        return Timer(self, labels)
+
+    def summary(self, **labels: Any) -> Dict[str, float]:
+        with self.lock:
+            entry = self.values.get(label_key(labels))
+            if entry is None:
+                return {"count": 0, "sum": 0.0, "mean": 0.0}
+            return {"count": entry[2], "sum": entry[1], "mean": entry[1] / entry[2]}
+
+    def expose(self) -> List[str]:
+        lines = []
+        with self.lock:
+            for key, (counts, total, count) in self.values.items():
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + (None,), counts):
+                    cumulative += bucket_count
+                    le = "+Inf" if bound is None else repr(float(bound))
+                    lines.append(
+                        f"{self.name}_bucket{format_labels(key, (('le', le),))} {cumulative}"
+                    )
+                lines.append(f"{self.name}_sum{format_labels(key)} {total}")
+                lines.append(f"{self.name}_count{format_labels(key)} {count}")
+        return lines
+
+
+class Timer:
+    def __init__(self, histogram: Histogram, labels: Dict[str, Any]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self) -> "Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+
+
+class MetricsRegistry:
+    """
+    Process wide collection of metrics. Metrics are created on first use, asking for an
+    existing name returns the same instance.
+    """
+
+    def __init__(self):
+        self.metrics: Dict[str, Metric] = {}
+        self.lock = threading.Lock()
+
+    def get_or_create(self, metric_type: type, name: str, *args, **kwargs) -> Metric:
+        with self.lock:
+            metric = self.metrics.get(name)
+            if metric is None:
+                metric = self.metrics[name] = metric_type(name, *args, **kwargs)
+            elif not isinstance(metric, metric_type):
+                raise ValueError(f"Metric {name} is already a {metric.kind}.")
+            return metric
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        return self.get_or_create(Counter, name, description)
+
+    def gauge(self, name: str, description: str = "") -> Gauge:
+        return self.get_or_create(Gauge, name, description)
+
+    def histogram(
+        self,
+        name: str,
+        description: str = "",
+        buckets: Tuple[float, ...] = METRICS_BUCKETS,
+    ) -> Histogram:
+        return self.get_or_create(Histogram, name, description, buckets)
+
+    def render_prometheus(self) -> str:
+        """Renders every metric in the Prometheus text exposition format."""
+        with self.lock:
+            metrics = list(self.metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.expose())
+        return "\n".join(lines) + "\n"
+
+    def series(self, name: str = None, since: float = None) -> List[Dict[str, Any]]:
+        """
+        Flattens the recorded samples into rows for the Grafana Infinity datasource.
+
+        Args:
+            name (str, optional): Only samples of this metric.
+            since (float, optional): Only samples at or after this UNIX time.
+
+        Returns:
+            List[Dict[str, Any]]: {"timestamp", "metric", "series", "value"} rows, where
+            "series" names the label set, oldest first.
+        """
+        with self.lock:
+            metrics = [
+                metric
+                for metric in self.metrics.values()
+                if name is None or metric.name == name
+            ]
+        rows = []
+        for metric in metrics:
+            for timestamp, key, value in metric.series(since):
+                rows.append(
+                    {
+                        "timestamp": timestamp * 1000,  # Grafana expects milliseconds
+                        "metric": metric.name,
+                        "series": ",".join(f"{k}={v}" for k, v in key) or metric.name,
+                        "value": value,
+                    }
+                )
+        rows.sort(key=lambda row: row["timestamp"])
+        return rows
+
+
+metrics = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    return metrics
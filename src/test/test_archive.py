@@ -0,0 +1,109 @@
+import json
+
+from sonaris.scheduler.archive import ArchiveLog
+from sonaris.scheduler.store import JSONJobStore, SQLiteJobStore
+
+
+def entry(index):
+    return {
+        "task": "sleep",
+        "schedule_time": f"2024-01-01T00:00:{index:02d}",
+        "result": True,
+    }
+
+
+def test_append_and_page_newest_first(tmp_path):
+    log = ArchiveLog(tmp_path / "archive.jsonl", tail_size=5)
+    for index in range(12):
+        log.append(f"job{index}", entry(index))
+
+    assert len(log) == 12
+    # Served from the in-memory tail
+    assert list(log.read_page(0, 3)) == ["job11", "job10", "job9"]
+    # Reaches past the tail into the file
+    assert list(log.read_page(4, 4)) == ["job7", "job6", "job5", "job4"]
+    assert list(log.read_page(10)) == ["job1", "job0"]
+    assert log.get("job0")["schedule_time"].endswith("00")
+
+    # Appending never rewrites earlier lines
+    lines = (tmp_path / "archive.jsonl").read_text().splitlines()
+    assert len(lines) == 12 and json.loads(lines[0])["job_id"] == "job0"
+
+
+def test_rotation_and_reload(tmp_path):
+    path = tmp_path / "archive.jsonl"
+    log = ArchiveLog(path, max_bytes=300, backups=2, tail_size=3)
+    for index in range(20):
+        log.append(f"job{index}", entry(index))
+
+    assert (tmp_path / "archive.jsonl.1").exists()
+    assert not (tmp_path / "archive.jsonl.3").exists()
+    reloaded = ArchiveLog(path, max_bytes=300, backups=2, tail_size=3)
+    assert len(reloaded) == len(log) < 20
+    assert list(reloaded.read_page(0, 2)) == ["job19", "job18"]
+    assert list(reloaded.read_page()) == list(log.read_page())
+
+    log.clear()
+    assert len(log) == 0 and log.read_page() == {}
+    assert not path.exists()
+
+
+def test_json_store_migrates_legacy_archive(tmp_path):
+    legacy = tmp_path / "archive.json"
+    legacy.write_text(json.dumps({"old": entry(1)}))
+
+    store = JSONJobStore(tmp_path / "jobs.json", legacy)
+    store.archive_job("new", entry(2))
+
+    assert list(store.get_archive()) == ["new", "old"]
+    assert store.count_archive() == 2
+    assert (tmp_path / "archive.json.migrated").exists()
+
+
+def test_rearchived_job_counts_once(tmp_path):
+    path = tmp_path / "archive.jsonl"
+    log = ArchiveLog(path, max_bytes=300, backups=1, tail_size=2)
+    for index in range(3):
+        log.append(f"job{index}", entry(index))
+    log.append("job0", {**entry(0), "result": False})
+
+    assert len(log) == len(log.read_page()) == 3
+    assert log.read_page(0, 1)["job0"]["result"] is False
+    assert len(ArchiveLog(path, max_bytes=300, backups=1)) == 3
+
+    for index in range(3, 20):
+        log.append(f"job{index}", entry(index))
+    assert len(log) == len(log.read_page())
+
+
+def test_sqlite_archive_pages_do_not_overlap_on_equal_times(tmp_path):
+    store = SQLiteJobStore(tmp_path / "jobs.db")
+    for index in range(6):
+        store.archive_job(f"job{index}", entry(0))
+
+    pages = [list(store.get_archive(offset, 2)) for offset in (0, 2, 4)]
+    assert sorted(sum(pages, [])) == [f"job{index}" for index in range(6)]
+    store.close()
+
+
+def test_pages_continue_after_cursor(tmp_path):
+    log = ArchiveLog(tmp_path / "archive.jsonl", tail_size=3)
+    for index in range(8):
+        log.append(f"job{index}", entry(index))
+
+    first = list(log.read_page(0, 3))
+    log.append("late", entry(20))  # Archived while paging
+    assert list(log.read_page(limit=3, after=first[-1])) == ["job4", "job3", "job2"]
+    assert list(log.read_page(limit=3, after="job2")) == ["job1", "job0"]
+    assert log.read_page(after="unknown") == {}
+
+    store = SQLiteJobStore(tmp_path / "jobs.db")
+    for index in range(6):
+        store.archive_job(f"job{index}", entry(index // 2))
+    store.archive_job("job2x", entry(1))  # Sorted into the next page
+
+    assert list(store.get_archive(0, 3)) == ["job5", "job4", "job3"]
+    assert list(store.get_archive(limit=3, after="job3")) == ["job2x", "job2", "job1"]
+    assert list(store.get_archive(after="job1")) == ["job0"]
+    assert store.get_archive(after="unknown") == {}
+    store.close()
@@ -0,0 +1,44 @@
+from unittest.mock import Mock
+
+import numpy as np
+
+from sonaris.device.data import DataBuffer
+
+
+def test_append_and_latest_frame_view():
+    buffer = DataBuffer(Mock(), buffer_size=3)
+    assert buffer.latest() is None
+    assert buffer.get_data().size == 0
+
+    buffer.append([1.0, 2.0])
+    buffer.append([3.0, 4.0])
+
+    assert len(buffer) == 2
+    assert buffer.latest().dtype == np.float32
+    np.testing.assert_array_equal(buffer.latest(), [3.0, 4.0])
+    assert np.shares_memory(buffer.latest(), buffer.buffer)
+    np.testing.assert_array_equal(buffer.get_data(), [1.0, 2.0, 3.0, 4.0])
+
+
+def test_ring_buffer_wraps_and_keeps_memory_constant():
+    buffer = DataBuffer(Mock(), buffer_size=3, dtype=np.float64)
+    buffer.append([0.0, 0.0])
+    storage = buffer.buffer
+
+    for i in range(1, 6):
+        buffer.append([i, i])
+
+    assert buffer.buffer is storage
+    assert len(buffer) == 3
+    np.testing.assert_array_equal(buffer.get_data(), [3, 3, 4, 4, 5, 5])
+    np.testing.assert_array_equal(buffer.frames(), [[3, 3], [4, 4], [5, 5]])
+
+
+def test_update_queries_data_source():
+    source = Mock()
+    source.query_data.return_value = np.arange(4)
+    buffer = DataBuffer(source, buffer_size=2)
+
+    buffer.update()
+
+    np.testing.assert_array_equal(buffer.latest(), [0, 1, 2, 3])
@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from sonaris.scheduler.store import JSONJobStore, SQLiteJobStore
+from sonaris.scheduler.timekeeper import Timekeeper
+from sonaris.services.datasource import DataSourceService
+
+
+@pytest.fixture
+def timekeeper(tmp_path):
+    worker = Mock()
+    worker.function_map.function_map = {}
+    worker.__schedule_task__ = Mock()
+    store = JSONJobStore(tmp_path / "jobs.json", tmp_path / "archive.json")
+    return Timekeeper(tmp_path / "jobs.json", worker, store=store)
+
+
+@pytest.fixture
+def client(timekeeper):
+    service = DataSourceService(timekeeper, name="test")
+    return TestClient(service.app)
+
+
+def test_jobs_filtered_and_paged(timekeeper, client):
+    now = datetime.now()
+    for minutes in range(5):
+        timekeeper.add_job("sleep", now + timedelta(minutes=10 + minutes), kwargs={})
+    timekeeper.add_job("beep", now + timedelta(hours=2), kwargs={})
+
+    rows = client.get("/jobs").json()
+    assert len(rows) == 6
+    assert rows[0]["result"] == "Pending"
+
+    assert len(client.get("/jobs", params={"task": "sleep"}).json()) == 5
+    late = client.get("/jobs", params={"start": (now + timedelta(hours=1)).isoformat()})
+    assert [row["task"] for row in late.json()] == ["beep"]
+    page = client.get("/jobs", params={"task": "sleep", "offset": 1, "limit": 2}).json()
+    assert len(page) == 2
+    assert client.get("/jobs", params={"task": "none"}).json() == [
+        {"task": "No tasks found"}
+    ]
+
+
+def test_archive_filtered_by_result(timekeeper, client):
+    for index in range(4):
+        job_id = timekeeper.add_job(
+            "sleep", datetime.now() + timedelta(minutes=index + 1), kwargs={}
+        )
+        timekeeper.callback(job_id, index % 2 == 0)
+
+    assert len(client.get("/archive").json()) == 4
+    assert len(client.get("/archive", params={"limit": 3}).json()) == 3
+    failed = client.get("/archive", params={"result": "false"}).json()
+    assert len(failed) == 2
+    assert all(row["result"] is False for row in failed)
+
+
+def test_etag_and_invalidation(timekeeper, client):
+    first = client.get("/jobs")
+    etag = first.headers["etag"]
+
+    cached = client.get("/jobs", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    job_id = timekeeper.add_job(
+        "sleep", datetime.now() + timedelta(minutes=5), kwargs={}
+    )
+    changed = client.get("/jobs", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()[0]["id"] == job_id
+
+    timekeeper.callback(job_id, True)
+    assert client.get("/jobs").json() == [{"task": "No tasks found"}]
+    assert client.get("/archive").json()[0]["id"] == job_id
+
+
+def test_cache_keeps_most_recent_responses(timekeeper):
+    service = DataSourceService(timekeeper, name="test", cache_size=2)
+    client = TestClient(service.app)
+    for minutes in range(4):
+        start = datetime.now() - timedelta(minutes=minutes)
+        client.get("/archive", params={"start": start.isoformat()})
+    client.get("/jobs")
+
+    assert len(service.cache) == 2
+    assert list(service.cache)[-1][0] == "jobs"
+
+
+def test_archive_filters_are_looked_up_by_the_store(tmp_path):
+    worker = Mock()
+    worker.function_map.function_map = {}
+    worker.__schedule_task__ = Mock()
+    store = SQLiteJobStore(tmp_path / "jobs.db")
+    timekeeper = Timekeeper(tmp_path / "jobs.json", worker, store=store)
+    now = datetime.now()
+    for index, task in enumerate(["sleep", "beep", "sleep", "sleep"]):
+        job_id = timekeeper.add_job(task, now + timedelta(minutes=index + 1), kwargs={})
+        timekeeper.callback(job_id, index != 3)
+    store.get_archive = Mock(side_effect=AssertionError("Read the whole archive"))
+    client = TestClient(DataSourceService(timekeeper, name="test").app)
+
+    rows = client.get("/archive", params={"task": "sleep"}).json()
+    assert [row["schedule_time"] for row in rows] == sorted(
+        (row["schedule_time"] for row in rows), reverse=True
+    )
+    assert len(rows) == 3
+    late = {"task": "sleep", "start": (now + timedelta(minutes=2)).isoformat()}
+    assert len(client.get("/archive", params=late).json()) == 2
+    assert len(client.get("/archive", params={**late, "result": "true"}).json()) == 1
+    store.close()
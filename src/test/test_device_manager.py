@@ -0,0 +1,96 @@
+from unittest.mock import Mock
+
+import pytest
+import pyvisa
+
+from sonaris.device.device import DeviceDiscovery
+from sonaris.device.dg4202 import DG4202
+from sonaris.frontend.managers.dg4202 import DG4202Manager
+from sonaris.frontend.managers.state_manager import StateManager
+
+
+@pytest.fixture
+def resource_manager():
+    rm = Mock()
+    resource = Mock()
+    resource.resource_name = "TCPIP0::192.168.1.100::INSTR"
+    resource.query.return_value = "RIGOL TECHNOLOGIES,DG4202,DG4E0000000001,00.01.12"
+    rm.list_resources.return_value = [resource.resource_name]
+    rm.open_resource.return_value = resource
+    return rm
+
+
+@pytest.fixture
+def manager(tmp_path, resource_manager):
+    return DG4202Manager(
+        StateManager(json_file=tmp_path / "state.json"),
+        args_dict={"hardware_mock": False},
+        resource_manager=resource_manager,
+    )
+
+
+def test_get_device_reuses_cached_handle(manager, resource_manager):
+    device = manager.get_device()
+    assert device is not None
+    for _ in range(5):
+        assert manager.get_device() is device
+
+    # Detection only ran once during construction
+    assert resource_manager.list_resources.call_count == 1
+    assert manager.get_connection_stats()["detection_count"] == 1
+
+
+def test_device_resolved_by_one_scan_skips_detection(tmp_path, resource_manager):
+    discovery = DeviceDiscovery(resource_manager)
+    device = discovery.detect_all([DG4202])[DG4202]
+
+    manager = DG4202Manager(
+        StateManager(json_file=tmp_path / "state.json"),
+        args_dict={"hardware_mock": False},
+        resource_manager=resource_manager,
+        discovery=discovery,
+        device=device,
+    )
+
+    assert manager.get_device() is device
+    assert resource_manager.list_resources.call_count == 1
+    assert manager.get_connection_stats()["detection_count"] == 0
+
+
+def test_call_device_method_does_not_rescan(manager, resource_manager):
+    manager.call_device_method("output_on_off", 1, True)
+    manager.call_device_method("output_on_off", 1, False)
+    assert resource_manager.list_resources.call_count == 1
+
+
+def test_io_error_triggers_single_reconnect(manager, resource_manager):
+    resource = resource_manager.open_resource.return_value
+    resource.write.side_effect = [pyvisa.errors.VisaIOError(-1073807339), None]
+    # The link dropped, the connection check fails once
+    resource.query.side_effect = [
+        pyvisa.errors.VisaIOError(-1073807339),
+        resource.query.return_value,
+    ]
+
+    manager.call_device_method("output_on_off", 1, True)
+
+    stats = manager.get_connection_stats()
+    assert stats["reconnect_count"] == 1
+    assert stats["detection_count"] == 2
+    assert resource.write.call_count == 2
+
+
+def test_io_error_on_live_connection_is_not_retried(manager, resource_manager):
+    resource = resource_manager.open_resource.return_value
+    resource.write.side_effect = [pyvisa.errors.VisaIOError(-1073807339), None]
+
+    assert manager.call_device_method("output_on_off", 1, True) is None
+
+    assert manager.get_connection_stats()["reconnect_count"] == 0
+    assert resource.write.call_count == 1
+
+
+def test_explicit_reconnect(manager, resource_manager):
+    manager.reconnect()
+    assert manager.reconnect_count == 1
+    assert resource_manager.list_resources.call_count == 2
@@ -1,13 +1,14 @@
-from unittest.mock import Mock, call
+from unittest.mock import MagicMock, call
 
 import pytest
+import pyvisa
 
 from sonaris.device.dg4202 import DG4202
 
 
 @pytest.fixture
 def mock_interface():
-    interface = Mock()
+    interface = MagicMock()
     return interface
 
 
@@ -100,3 +101,48 @@ def test_is_connection_alive(mock_interface):
     # Test for dead connection
     mock_interface.read.side_effect = Exception("Connection lost")
     assert device.is_connection_alive() == False
+
+
+def test_shadow_state_sends_only_changed_settings(mock_interface):
+    mock_interface.query_batch.side_effect = lambda queries: ["1"] * len(queries)
+    device = DG4202(mock_interface, shadow=True)
+
+    device.set_waveform(
+        channel=1, waveform_type="SIN", frequency=1000, amplitude=1.0, offset=0.5
+    )
+    assert mock_interface.write.call_count == 4
+
+    mock_interface.write.reset_mock()
+    device.set_waveform(
+        channel=1, waveform_type="SIN", frequency=2000, amplitude=1.0, offset=0.5
+    )
+    mock_interface.write.assert_called_once_with("SOURce1:FREQuency:FIXed 2000")
+
+    # Getters are served from the shadow copy
+    parameters = device.get_waveform_parameters(1)
+    mock_interface.query_batch.assert_not_called()
+    assert parameters["frequency"] == 2000.0
+
+    # An explicit sync reloads from the device
+    device.sync(1)
+    assert mock_interface.query_batch.called
+    assert device.get_waveform_parameters(1)["frequency"] == 1.0
+
+
+def test_shadow_is_recorded_only_after_the_batch_was_sent(mock_interface):
+    mock_interface.query_batch.side_effect = lambda queries: ["1"] * len(queries)
+    device = DG4202(mock_interface, shadow=True)
+    device.set_waveform(channel=1, frequency=1000)
+
+    flush = mock_interface.batch.return_value.__exit__
+    flush.side_effect = pyvisa.errors.VisaIOError(-1073807339)
+    with pytest.raises(pyvisa.errors.VisaIOError):
+        device.set_waveform(channel=1, frequency=2000)
+
+    # The failed value is not served, the device is asked again
+    assert device.shadowed("SOURce1:FREQuency:FIXed") is None
+    flush.side_effect = None
+    mock_interface.write.reset_mock()
+    device.set_waveform(channel=1, frequency=2000)
+    mock_interface.write.assert_called_once_with("SOURce1:FREQuency:FIXed 2000")
+    assert device.shadowed("SOURce1:FREQuency:FIXed") == "2000"
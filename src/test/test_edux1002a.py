@@ -0,0 +1,89 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from sonaris.device.edux1002a import EDUX1002A
+
+PREAMBLE_WORD = "+1,+2,+4,+1,+1.0E-06,-2.0E-06,+0,+1.0E-03,+0.0E+00,+32768"
+
+
+@pytest.fixture
+def mock_interface():
+    interface = MagicMock()
+    interface.read.side_effect = lambda command: {
+        ":WAVeform:PREamble?": PREAMBLE_WORD,
+    }.get(command, "")
+    return interface
+
+
+def test_word_data_uses_binary_block_read(mock_interface):
+    mock_interface.query_binary.return_value = np.array(
+        [32768, 33768, 31768, 32768], dtype=np.uint16
+    )
+    device = EDUX1002A(mock_interface)
+
+    time, voltage = device.get_waveform(1)
+
+    mock_interface.query_binary.assert_called_once_with(":WAVeform:DATA?", "H", True)
+    np.testing.assert_allclose(voltage, [0.0, 1.0, -1.0, 0.0])
+    np.testing.assert_allclose(time, [-2e-6, -1e-6, 0.0, 1e-6])
+
+
+def test_ascii_data_is_returned_in_volts(mock_interface):
+    mock_interface.read.side_effect = lambda command: {
+        ":WAVeform:PREamble?": "+4,+2,+3,+1,+1.0E-06,+0.0E+00,+0,+1.0E-03,+0.0E+00,+0",
+        ":WAVeform:DATA?": "#800000038 1.5e-01, -2.0e-01, 3.0e-01",
+    }.get(command, "")
+    device = EDUX1002A(mock_interface)
+
+    _, voltage = device.get_waveform(1)
+
+    mock_interface.query_binary.assert_not_called()
+    np.testing.assert_allclose(voltage, [0.15, -0.2, 0.3])
+
+
+def test_repeated_captures_reuse_cached_preamble(mock_interface):
+    mock_interface.query_binary.return_value = np.full(4, 32768, dtype=np.uint16)
+    device = EDUX1002A(mock_interface)
+
+    for _ in range(3):
+        device.capture(1)
+
+    preamble_reads = [
+        c
+        for c in mock_interface.read.call_args_list
+        if c.args[0] == ":WAVeform:PREamble?"
+    ]
+    assert len(preamble_reads) == 1
+    assert mock_interface.query_binary.call_count == 3
+
+    # Changing the vertical scale through the driver invalidates the cache
+    device.set_channel_scale(1, 0.5)
+    device.capture(1)
+    preamble_reads = [
+        c
+        for c in mock_interface.read.call_args_list
+        if c.args[0] == ":WAVeform:PREamble?"
+    ]
+    assert len(preamble_reads) == 2
+
+
+def test_capture_channels_uses_single_acquisition(mock_interface):
+    mock_interface.query_binary.side_effect = [
+        np.array([32768, 33768, 32768], dtype=np.uint16),
+        np.array([31768, 32768, 33768], dtype=np.uint16),
+    ]
+    device = EDUX1002A(mock_interface)
+
+    time, voltages = device.capture_channels((1, 2))
+
+    digitize_calls = [
+        c
+        for c in mock_interface.write.call_args_list
+        if c.args[0].startswith(":DIGitize")
+    ]
+    assert [c.args[0] for c in digitize_calls] == [":DIGitize CHANnel1,CHANnel2"]
+    assert voltages.shape == (2, 3)
+    assert len(time) == 3
+    np.testing.assert_allclose(voltages[1], [-1.0, 0.0, 1.0])
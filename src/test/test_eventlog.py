@@ -0,0 +1,79 @@
+import json
+
+from sonaris.utils.eventlog import EventLog
+
+
+def descriptions(events):
+    return [event["description"] for event in events]
+
+
+def test_pages_are_read_newest_first_across_segments(tmp_path):
+    event_log = EventLog(tmp_path / "monitor.jsonl", max_bytes=300, backups=10)
+    for index in range(40):
+        event_log.append(f"event {index}")
+
+    assert len(event_log.segments()) > 1
+    assert len(event_log) == 40
+    assert descriptions(event_log.read_page(0, 3)) == [
+        "event 39",
+        "event 38",
+        "event 37",
+    ]
+    assert descriptions(event_log.read_page(38, 5)) == ["event 1", "event 0"]
+    assert len(event_log.read_page()) == 40
+
+
+def test_rotation_drops_oldest_segment(tmp_path):
+    event_log = EventLog(tmp_path / "monitor.jsonl", max_bytes=200, backups=1)
+    for index in range(30):
+        event_log.append(f"event {index}")
+
+    assert len(event_log.segments()) <= 2
+    events = event_log.read_page()
+    assert descriptions(events)[0] == "event 29"
+    assert len(event_log) == len(events) < 30
+
+
+def test_reverse_lines_spans_blocks(tmp_path, monkeypatch):
+    monkeypatch.setattr(EventLog, "BLOCK_SIZE", 7)
+    event_log = EventLog(tmp_path / "monitor.jsonl")
+    for index in range(10):
+        event_log.append(f"a longer event description {index}")
+
+    assert descriptions(event_log.read_page(0, 2)) == [
+        "a longer event description 9",
+        "a longer event description 8",
+    ]
+
+
+def test_open_migrates_legacy_json(tmp_path):
+    legacy = tmp_path / "monitor.json"
+    legacy.write_text(
+        json.dumps([{"timestamp": "2024-01-01T00:00:00", "description": "old"}])
+    )
+
+    event_log = EventLog.open(legacy)
+    event_log.append("new")
+
+    assert not legacy.exists()
+    assert (tmp_path / "monitor.json.migrated").exists()
+    assert descriptions(EventLog.open(legacy).read_page()) == ["new", "old"]
+
+    event_log.clear()
+    assert len(event_log) == 0
+    assert event_log.read_page() == []
+
+
+def test_corrupt_lines_are_not_counted(tmp_path):
+    path = tmp_path / "monitor.jsonl"
+    event_log = EventLog(path)
+    event_log.append("first")
+    with open(path, "a") as file:
+        file.write("not json\n")
+        file.write('{"timestamp": "2024-01-01T00:00:00", "descr')  # Torn write
+
+    reopened = EventLog(path)
+    reopened.append("after the crash")
+
+    assert len(reopened) == len(reopened.read_page()) == 2
+    assert descriptions(reopened.read_page()) == ["after the crash", "first"]
@@ -0,0 +1,113 @@
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from sonaris.scheduler.events import EventBus, JobEvent, JobEventType
+from sonaris.scheduler.store import JSONJobStore
+from sonaris.scheduler.timekeeper import Timekeeper
+from sonaris.scheduler.worker import Worker
+
+
+def noop():
+    pass
+
+
+def crash():
+    raise ZeroDivisionError("boom")
+
+
+@pytest.fixture
+def timekeeper(tmp_path):
+    worker = Worker({})
+    worker.register_task(noop, "noop")
+    worker.register_task(crash, "crash")
+    store = JSONJobStore(tmp_path / "jobs.json", tmp_path / "archive.json")
+    return Timekeeper(tmp_path / "jobs.json", worker, store=store)
+
+
+def test_publish_does_not_wait_for_handlers():
+    bus = EventBus()
+    release, received = threading.Event(), []
+
+    def slow(event):
+        release.wait(5)
+        received.append(event.type)
+
+    bus.subscribe(slow)
+    bus.subscribe(lambda event: received.append("sync"), synchronous=True)
+    bus.publish(JobEvent(JobEventType.SUBMITTED, "a"))
+    bus.publish(JobEvent(JobEventType.SCHEDULED, "a"))
+
+    assert received == ["sync", "sync"]
+    release.set()
+    assert bus.flush(5)
+    assert received[2:] == [JobEventType.SUBMITTED, JobEventType.SCHEDULED]
+
+
+def test_subscribers_filter_types_and_survive_errors():
+    bus = EventBus()
+    received = []
+    bus.subscribe(Mock(side_effect=RuntimeError), synchronous=True)
+    subscription = bus.subscribe(
+        received.append, [JobEventType.FAILED], synchronous=True
+    )
+
+    bus.publish(JobEvent(JobEventType.SUCCEEDED, "a"))
+    bus.publish(JobEvent(JobEventType.FAILED, "b"))
+    bus.unsubscribe(subscription)
+    bus.publish(JobEvent(JobEventType.FAILED, "c"))
+
+    assert [event.job_id for event in received] == ["b"]
+
+
+def run(timekeeper, task):
+    job_id = timekeeper.add_job(task, datetime.now() + timedelta(minutes=10), kwargs={})
+    timekeeper.worker.execute_task(task, job_id, timekeeper.callback, (), {})
+    return job_id
+
+
+def test_job_lifecycle_events(timekeeper):
+    events = []
+    timekeeper.events.subscribe(events.append, synchronous=True)
+
+    ok = run(timekeeper, "noop")
+    failed = run(timekeeper, "crash")
+
+    assert [event.type for event in events if event.job_id == ok] == [
+        JobEventType.SUBMITTED,
+        JobEventType.SCHEDULED,
+        JobEventType.STARTED,
+        JobEventType.SUCCEEDED,
+        JobEventType.ARCHIVED,
+        JobEventType.REMOVED,
+    ]
+    started = next(event for event in events if event.type == JobEventType.STARTED)
+    assert started.lateness < 0  # Run ahead of its schedule time
+    result = next(
+        event
+        for event in events
+        if event.job_id == failed and event.type == JobEventType.FAILED
+    )
+    assert result.duration >= 0
+    assert "ZeroDivisionError" in result.error_info
+    assert result.job["task"] == "crash"
+    assert timekeeper.started == {}
+
+
+def test_cancel_publishes_cancelled(timekeeper):
+    job_id = timekeeper.add_job(
+        "noop", datetime.now() + timedelta(minutes=10), kwargs={}
+    )
+    events = []
+    timekeeper.events.subscribe(events.append)
+
+    timekeeper.cancel_job(job_id)
+
+    assert timekeeper.events.flush(5)
+    assert [event.type for event in events] == [
+        JobEventType.CANCELLED,
+        JobEventType.REMOVED,
+    ]
+    assert events[0].job["task"] == "noop"
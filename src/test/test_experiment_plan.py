@@ -0,0 +1,109 @@
+from enum import Enum
+
+import pytest
+
+from sonaris.scheduler.runner import PlanRunner
+from sonaris.tasks.compiler import compile_experiment
+from sonaris.tasks.model import ExperimentWrapper
+
+
+class Tasks(Enum):
+    SWEEP = "Set Sweep Parameters"
+    TOGGLE = "Toggle Output"
+
+
+TASK_FUNCTIONS = {Tasks.SWEEP.value: print, Tasks.TOGGLE.value: print}
+
+
+def wrapper(*steps):
+    return ExperimentWrapper(experiment={"name": "sweep", "steps": list(steps)})
+
+
+def test_compile_orders_steps_stably():
+    plan = compile_experiment(
+        wrapper(
+            {"task": "TOGGLE", "delay": 1.0, "parameters": {"channel": 1}},
+            {"task": "SWEEP", "delay": 0.5},
+            {"task": "Toggle Output", "delay": 0.5, "parameters": {"channel": 2}},
+        ),
+        TASK_FUNCTIONS,
+        Tasks,
+    )
+
+    assert [step.index for step in plan.steps] == [1, 2, 0]
+    assert [step.task_name for step in plan.steps] == [
+        "Set Sweep Parameters",
+        "Toggle Output",
+        "Toggle Output",
+    ]
+    assert plan.duration == 1.0
+    with pytest.raises(TypeError):
+        plan.steps[0].parameters["channel"] = 3
+    # Same configuration, same plan
+    assert plan == compile_experiment(
+        wrapper(
+            {"task": "TOGGLE", "delay": 1.0, "parameters": {"channel": 1}},
+            {"task": "SWEEP", "delay": 0.5},
+            {"task": "Toggle Output", "delay": 0.5, "parameters": {"channel": 2}},
+        ),
+        TASK_FUNCTIONS,
+        Tasks,
+    )
+
+
+def test_compile_rejects_unknown_task():
+    with pytest.raises(ValueError):
+        compile_experiment(wrapper({"task": "MISSING"}), TASK_FUNCTIONS, Tasks)
+
+
+def test_runner_executes_dense_steps_on_time():
+    plan = compile_experiment(
+        wrapper(*[{"task": "SWEEP", "delay": i * 0.01} for i in range(20)]),
+        TASK_FUNCTIONS,
+        Tasks,
+    )
+    executed = []
+    runner = PlanRunner(
+        plan, lambda step: (executed.append(step.index), (True, None))[1]
+    )
+
+    runner.start().join(5)
+
+    assert executed == list(range(20))
+    summary = runner.summary()
+    assert summary["executed"] == 20
+    assert 0 <= summary["max_lateness"] < 0.01
+
+
+def test_runner_records_failures_and_cancels():
+    plan = compile_experiment(
+        wrapper({"task": "SWEEP"}, {"task": "SWEEP", "delay": 10}),
+        TASK_FUNCTIONS,
+        Tasks,
+    )
+
+    def execute(step):
+        runner.cancel()
+        raise RuntimeError("device offline")
+
+    runner = PlanRunner(plan, execute)
+    runner.start().join(5)
+
+    assert not runner.is_alive()
+    assert len(runner.telemetry) == 1
+    assert runner.telemetry[0].error_info == "device offline"
+    assert runner.summary()["cancelled"]
+
+
+def test_runner_skips_cancelled_steps():
+    plan = compile_experiment(
+        wrapper({"task": "SWEEP"}, {"task": "SWEEP", "delay": 0.01}),
+        TASK_FUNCTIONS,
+        Tasks,
+    )
+
+    runner = PlanRunner(plan, lambda step: None if step.index == 0 else (True, None))
+    runner.start().join(5)
+
+    assert [entry.index for entry in runner.telemetry] == [1]
+    assert runner.summary()["executed"] == 1
@@ -0,0 +1,45 @@
+import builtins
+import json
+import math
+from unittest.mock import patch
+
+from sonaris.scheduler.functionmap import FunctionMap
+
+
+def scale(value, factor=2):
+    return value * factor
+
+
+def test_resolved_callables_are_cached():
+    function_map = FunctionMap({"dumps": ("json", "dumps")})
+
+    with patch.object(builtins, "__import__", wraps=builtins.__import__) as imports:
+        for _ in range(100):
+            assert function_map.get_function("dumps") is json.dumps
+    assert imports.call_count == 1
+    assert function_map.get_function("missing") is None
+
+
+def test_cache_invalidated_when_mapping_changes():
+    function_map = FunctionMap({})
+    function_map.add_function("task", scale)
+    assert function_map.get_function("task") is scale
+
+    # Same mapping again keeps the cache
+    function_map.add_function("task", scale)
+    assert function_map.resolved["task"] is scale
+
+    function_map.add_function("task", math.sqrt)
+    assert function_map.get_function("task") is math.sqrt
+
+    function_map.function_map["task"] = ("json", "loads")
+    function_map.reload()
+    assert function_map.get_function("task") is json.loads
+
+
+def test_parse_and_call_binds_positional_args_once():
+    function_map = FunctionMap({})
+    assert function_map.parse_and_call(scale, (3,), {}) == 6
+    assert function_map.parse_and_call(scale, (3,), {"factor": 3}) == 9
+    assert function_map.parse_and_call(scale, (), {"value": 2}) == 4
+    assert function_map.binders == {scale: ("value", "factor")}
@@ -0,0 +1,85 @@
+from unittest.mock import Mock
+
+import pytest
+
+from sonaris.frontend.managers.dg4202 import DG4202Manager
+from sonaris.frontend.managers.health import DeviceHealthPoller, get_health_poller
+from sonaris.frontend.managers.state_manager import StateManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return DG4202Manager(
+        StateManager(json_file=tmp_path / "state.json"),
+        args_dict={"hardware_mock": True},
+        resource_manager=Mock(),
+    )
+
+
+def test_poll_publishes_snapshot_with_telemetry(manager):
+    poller = DeviceHealthPoller(manager)
+    snapshots, changes = [], []
+    poller.snapshotUpdated.connect(snapshots.append)
+    poller.connectionChanged.connect(changes.append)
+
+    snapshot = poller.poll()
+    poller.poll()
+
+    assert snapshot.alive
+    assert snapshot.data["connected"] is True
+    assert "waveform" in snapshot.data["1"]
+    assert len(snapshots) == 2
+    assert changes == [True]
+    assert poller.next_delay() == poller.period
+
+
+def test_failed_polls_back_off(manager):
+    poller = DeviceHealthPoller(manager, period=1.0, max_backoff=5.0)
+    changes = []
+    poller.connectionChanged.connect(changes.append)
+    poller.poll()
+    manager.set_mock_state(True)
+
+    delays = []
+    for _ in range(5):
+        assert not poller.poll().alive
+        delays.append(poller.next_delay())
+
+    assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+    assert changes == [True, False]
+
+    manager.set_mock_state(False)
+    assert poller.poll().alive
+    assert poller.failures == 0
+    assert changes == [True, False, True]
+
+
+def test_poller_is_shared_and_stops(manager):
+    poller = get_health_poller(manager)
+    try:
+        assert get_health_poller(manager) is poller
+        poller.refresh()
+        for _ in range(100):
+            if poller.snapshot is not None:
+                break
+            poller.msleep(10)
+        assert poller.snapshot.alive
+    finally:
+        poller.stop(wait=True)
+    assert not poller.isRunning()
+
+
+def test_parameters_are_read_on_demand(manager):
+    poller = DeviceHealthPoller(manager)
+    manager.get_data = Mock(wraps=manager.get_data)
+
+    first = poller.poll()
+    periodic = poller.poll()
+    poller.refresh(read_data=True)
+    requested = poller.poll()
+
+    assert "waveform" in first.data["1"]
+    assert periodic.alive and periodic.data == {}
+    assert "waveform" in requested.data["1"]
+    assert manager.get_data.call_count == 2
+    assert poller.data is requested.data
@@ -1,7 +1,10 @@
 from unittest.mock import Mock, patch
 
-from sonaris.device.device import Device, DeviceDetector
-from sonaris.device.interface import EthernetInterface, USBInterface
+import pytest
+import pyvisa
+
+from sonaris.device.device import Device, DeviceDetector, DeviceDiscovery
+from sonaris.device.interface import EthernetInterface, Interface, USBInterface
 
 
 class GenericDevice(Device):
@@ -58,3 +61,130 @@ def test_detect_device_with_no_device(mock_resource_manager):
 
     # Ensure that the detection result is None when no devices are found
     assert result is None
+
+
+class OtherDevice(Device):
+    IDN_STRING = "Other Device ID"
+
+
+def test_discovery_resolves_all_device_types_from_one_scan():
+    mock_rm = Mock()
+    idns = {
+        "TCPIP0::192.168.1.100::INSTR": "Manufacturer,Generic Device ID,Serial,Version",
+        "USB0::0x1234::0x5678::SN12345::0::INSTR": "Manufacturer,Other Device ID,Serial,Version",
+        "TCPIP0::192.168.1.200::INSTR": None,  # stale LAN entry
+    }
+
+    def open_resource(name, **kwargs):
+        if idns[name] is None:
+            raise pyvisa.errors.VisaIOError(-1073807339)
+        resource = Mock()
+        resource.resource_name = name
+        resource.query.return_value = idns[name]
+        return resource
+
+    mock_rm.list_resources.return_value = list(idns)
+    mock_rm.open_resource.side_effect = open_resource
+
+    discovery = DeviceDiscovery(mock_rm)
+    devices = discovery.detect_all([GenericDevice, OtherDevice])
+
+    assert isinstance(devices[GenericDevice].interface, EthernetInterface)
+    assert isinstance(devices[OtherDevice].interface, USBInterface)
+    # Three probes, then the two matching resources are opened for their drivers
+    assert mock_rm.open_resource.call_count == 5
+
+    # Within the TTL nothing is probed again, claimed resources are not handed out twice
+    assert discovery.detect(GenericDevice) is None
+    assert mock_rm.open_resource.call_count == 5
+
+    # Releasing a claimed resource makes it discoverable again
+    discovery.release(devices[GenericDevice].interface.inst)
+    assert isinstance(discovery.detect(GenericDevice), GenericDevice)
+    assert mock_rm.open_resource.call_count == 7
+
+
+def test_discovery_closes_probes_and_retries_silent_resources_soon():
+    mock_rm = Mock()
+    name = "USB0::0x1234::0x5678::SN12345::0::INSTR"
+    probes = []
+
+    def open_resource(name, **kwargs):
+        resource = Mock()
+        if probes:
+            resource.query.return_value = "Manufacturer,Other Device ID,Serial,Version"
+        else:
+            resource.query.side_effect = pyvisa.errors.VisaIOError(-1073807339)
+        probes.append(resource)
+        return resource
+
+    mock_rm.list_resources.return_value = [name]
+    mock_rm.open_resource.side_effect = open_resource
+    discovery = DeviceDiscovery(mock_rm, negative_ttl=0.0)
+
+    # Not powered on yet, the probed handle is closed and the miss is not kept
+    assert discovery.detect(GenericDevice) is None
+    assert all(probe.close.called for probe in probes)
+
+    assert isinstance(discovery.detect(OtherDevice), OtherDevice)
+    assert all(probe.close.called for probe in probes[:2])
+    assert not probes[2].close.called  # The claimed handle stays open
+
+
+def test_batch_joins_writes_into_one_message():
+    resource = Mock()
+    interface = Interface(resource)
+
+    with interface.batch():
+        interface.write("SOURce1:FUNCtion SIN")
+        interface.write("SOURce1:FREQuency:FIXed 1000")
+        with interface.batch():  # nested batches join the outer one
+            interface.write("*CLS")
+        resource.write.assert_not_called()
+
+    resource.write.assert_called_once_with(
+        ":SOURce1:FUNCtion SIN;:SOURce1:FREQuency:FIXed 1000;*CLS"
+    )
+
+
+def test_batch_drops_pending_writes_when_body_raises():
+    resource = Mock()
+    interface = Interface(resource)
+
+    with pytest.raises(ValueError):
+        with interface.batch():
+            interface.write("SOURce1:FUNCtion SQU")
+            raise ValueError("amplitude out of range")
+
+    resource.write.assert_not_called()
+    assert interface.pending is None
+    interface.write("OUTPut1 ON")
+    resource.write.assert_called_once_with("OUTPut1 ON")
+
+
+def test_read_inside_batch_flushes_pending_writes():
+    resource = Mock()
+    resource.query.return_value = "1"
+    interface = Interface(resource)
+
+    with interface.batch():
+        interface.write("OUTPut1 ON")
+        assert interface.read("OUTPut1?") == "1"
+        resource.write.assert_called_once_with(":OUTPut1 ON")
+
+
+def test_query_batch_splits_responses_and_honours_message_length():
+    resource = Mock()
+    resource.query.side_effect = lambda message: ";".join(
+        str(i) for i, _ in enumerate(message.split(";"))
+    )
+    interface = Interface(resource)
+    interface.max_message_length = 40
+
+    queries = [f"SOURce1:SWEEp:HTIMe{i}?" for i in range(5)]
+    results = interface.query_batch(queries)
+
+    assert len(results) == 5
+    assert resource.query.call_count > 1
+    for (message,), _ in resource.query.call_args_list:
+        assert len(message) <= 40
@@ -0,0 +1,77 @@
+from unittest.mock import Mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from sonaris.device.interface import SCPI_ERRORS, SCPI_LATENCY, USBInterface
+from sonaris.scheduler.worker import TASK_RESULTS, Worker
+from sonaris.services.datasource import DataSourceService
+from sonaris.utils.metrics import MetricsRegistry
+
+
+def fail():
+    raise RuntimeError("boom")
+
+
+def test_histogram_buckets_and_prometheus_text():
+    registry = MetricsRegistry()
+    latency = registry.histogram("test_latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 2.0):
+        latency.observe(value, operation="query")
+    registry.counter("test_total", "Count.").inc(operation='say "hi"')
+
+    text = registry.render_prometheus()
+    assert "# TYPE test_latency_seconds histogram" in text
+    assert 'test_latency_seconds_bucket{operation="query",le="0.1"} 1' in text
+    assert 'test_latency_seconds_bucket{operation="query",le="1.0"} 2' in text
+    assert 'test_latency_seconds_bucket{operation="query",le="+Inf"} 3' in text
+    assert 'test_latency_seconds_count{operation="query"} 3' in text
+    assert 'test_total{operation="say \\"hi\\""} 1.0' in text
+    assert latency.summary(operation="query")["mean"] == pytest.approx(2.55 / 3)
+
+    rows = registry.series("test_latency_seconds")
+    assert [row["value"] for row in rows] == [0.05, 0.5, 2.0]
+    assert rows[0]["series"] == "operation=query"
+
+    with pytest.raises(ValueError):
+        registry.gauge("test_total")
+
+
+def test_interface_records_latency_and_errors():
+    resource = Mock()
+    resource.resource_name = "USB0::1::INSTR"
+    resource.query.side_effect = ["1", OSError("timeout")]
+    interface = USBInterface(resource)
+    queries = SCPI_LATENCY.summary(operation="query")["count"]
+    errors = SCPI_ERRORS.get(operation="query")
+
+    interface.read("*IDN?")
+    with pytest.raises(OSError):
+        interface.read("*IDN?")
+
+    assert SCPI_LATENCY.summary(operation="query")["count"] == queries + 2
+    assert SCPI_ERRORS.get(operation="query") == errors + 1
+
+
+def test_worker_counts_task_results():
+    worker = Worker(function_map={})
+    worker.register_task(fail, "fail")
+    failures = TASK_RESULTS.get(task="fail", result="failure")
+
+    assert worker.submit_task("fail", None, None).result(5) is False
+    assert TASK_RESULTS.get(task="fail", result="failure") == failures + 1
+    worker.stop_worker()
+
+
+def test_metrics_endpoints():
+    timekeeper = Mock()
+    client = TestClient(DataSourceService(timekeeper, name="test").app)
+
+    text = client.get("/metrics")
+    assert text.headers["content-type"].startswith("text/plain")
+    assert "sonaris_scpi_latency_seconds" in text.text
+
+    rows = client.get(
+        "/metrics/series", params={"metric": "sonaris_scpi_latency_seconds"}
+    ).json()
+    assert all(row["metric"] == "sonaris_scpi_latency_seconds" for row in rows)
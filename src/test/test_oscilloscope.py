@@ -0,0 +1,38 @@
+from unittest.mock import Mock
+
+from sonaris.frontend.widgets.gen_oscilloscope import AcquisitionWorker
+
+
+def test_bounded_queue_keeps_latest_frames():
+    worker = AcquisitionWorker(Mock(), queue_size=2)
+    for frame in range(5):
+        worker.put(frame)
+
+    assert worker.frames.qsize() == 2
+    assert worker.take_latest() == 4
+    assert worker.take_latest() is None
+    assert worker.dropped_frames == 4
+
+
+def test_single_shot_run_acquires_once():
+    acquire = Mock(return_value="frame")
+    worker = AcquisitionWorker(acquire)
+    worker.active, worker.single_shot = True, True
+
+    worker.run()
+
+    acquire.assert_called_once()
+    assert not worker.active
+    assert worker.take_latest() == "frame"
+
+
+def test_failed_capture_stops_worker():
+    worker = AcquisitionWorker(Mock(side_effect=RuntimeError("timeout")))
+    failures = []
+    worker.acquisitionFailed.connect(failures.append)
+    worker.active = True
+
+    worker.run()
+
+    assert failures == ["timeout"]
+    assert not worker.active
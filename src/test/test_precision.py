@@ -0,0 +1,85 @@
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from apscheduler.jobstores.base import ConflictingIdError
+
+from sonaris.scheduler.precision import PrecisionScheduler
+from sonaris.scheduler.worker import Worker
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = PrecisionScheduler()
+    scheduler.start()
+    yield scheduler
+    scheduler.shutdown()
+
+
+def test_jobs_fire_in_deadline_order(scheduler):
+    fired = []
+    done = threading.Event()
+    now = datetime.now()
+    for name, delay in [("c", 0.06), ("a", 0.02), ("b", 0.04)]:
+        scheduler.add_job(
+            fired.append, run_date=now + timedelta(seconds=delay), args=(name,), id=name
+        )
+    scheduler.add_job(done.set, run_date=now + timedelta(seconds=0.08), id="done")
+
+    assert done.wait(2)
+    assert fired == ["a", "b", "c"]
+    errors = dict(scheduler.get_firing_errors())
+    assert set(errors) == {"a", "b", "c", "done"}
+    assert all(0 <= error < 0.005 for error in errors.values())
+
+
+def test_removed_job_does_not_fire(scheduler):
+    fired = threading.Event()
+    scheduler.add_job(
+        fired.set, run_date=datetime.now() + timedelta(seconds=0.05), id="x"
+    )
+    scheduler.remove_job("x")
+    with pytest.raises(KeyError):
+        scheduler.remove_job("x")
+
+    assert not fired.wait(0.1)
+    assert scheduler.get_jobs() == []
+
+
+def test_worker_precise_engine_keeps_schedule_interface():
+    worker = Worker(function_map={}, precise=True)
+    results = []
+    done = threading.Event()
+    worker.register_task(lambda value: results.append(value), "append")
+
+    def callback(job_id, result, error_info=None):
+        done.set()
+
+    worker.start_worker()
+    worker.__schedule_task__(
+        "append", datetime.now() + timedelta(seconds=0.02), "job", callback, value=1
+    )
+    assert done.wait(2)
+    worker.stop_worker()
+
+    assert results == [1]
+    assert [job_id for job_id, _ in worker.get_firing_errors()] == ["job"]
+
+
+def test_add_job_rejects_duplicate_ids_and_unknown_trigger_fields():
+    scheduler = PrecisionScheduler()
+    run_date = datetime.now() + timedelta(minutes=1)
+    scheduler.add_job(print, run_date=run_date, id="x")
+
+    with pytest.raises(ConflictingIdError):
+        scheduler.add_job(print, run_date=run_date, id="x")
+    scheduler.add_job(
+        print, run_date=run_date + timedelta(minutes=1), id="x", replace_existing=True
+    )
+    assert scheduler.get_jobs() == ["x"]
+
+    with pytest.raises(ValueError):
+        scheduler.add_job(print, trigger="interval", seconds=5, id="y")
+    with pytest.raises(TypeError):
+        scheduler.add_job(print, run_date=run_date, seconds=5, id="z")
+    assert scheduler.get_jobs() == ["x"]
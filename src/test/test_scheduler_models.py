@@ -0,0 +1,121 @@
+import sys
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from sonaris.frontend.widgets.sch_scheduler import (
+    ArchiveTableModel,
+    JobEventRelay,
+    JobsTableModel,
+)
+from sonaris.scheduler.store import JSONJobStore, SQLiteJobStore
+from sonaris.scheduler.timekeeper import Timekeeper
+
+
+@pytest.fixture
+def app():
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+@pytest.fixture
+def timekeeper(tmp_path):
+    worker = Mock()
+    worker.function_map.function_map = {}
+    worker.__schedule_task__ = Mock()
+    store = JSONJobStore(tmp_path / "jobs.json", tmp_path / "archive.json")
+    return Timekeeper(tmp_path / "jobs.json", worker, store=store)
+
+
+def schedule(timekeeper, minutes=10):
+    schedule_time = datetime.now() + timedelta(minutes=minutes)
+    return timekeeper.add_job("sleep", schedule_time, kwargs={})
+
+
+def test_jobs_model_applies_events_row_by_row(timekeeper):
+    first = schedule(timekeeper)
+    model = JobsTableModel(timekeeper)
+    timekeeper.events.subscribe(model.apply_event, synchronous=True)
+    inserted, removed = [], []
+    model.rowsInserted.connect(lambda parent, start, end: inserted.append(start))
+    model.rowsRemoved.connect(lambda parent, start, end: removed.append(start))
+    model.modelReset.connect(lambda: pytest.fail("Model was reset"))
+
+    second = schedule(timekeeper, 20)
+    timekeeper.cancel_job(first)
+
+    assert inserted == [1]
+    assert removed == [0]
+    assert model.rowCount() == 1
+    assert model.job_at(0) == second
+    assert model.data(model.index(0, 1)) == "sleep"
+
+
+def test_archive_model_pages_and_inserts_on_top(timekeeper):
+    for index in range(7):
+        timekeeper.archive_job(f"old{index}", {"task": "sleep", "result": True})
+    model = ArchiveTableModel(timekeeper, page_size=3)
+    timekeeper.events.subscribe(model.apply_event, synchronous=True)
+
+    assert model.rowCount() == 3
+    assert model.job_at(0) == "old6"
+    model.fetchMore()
+    model.fetchMore()
+    assert model.rowCount() == 7
+    assert not model.canFetchMore()
+
+    job_id = schedule(timekeeper)
+    timekeeper.callback(job_id, False, "boom")
+    assert model.rowCount() == model.total == 8
+    assert model.data(model.index(0, 0)) == "ERR"
+    assert model.job_at(0) == job_id
+
+    timekeeper.clear_archive()
+    assert model.rowCount() == model.total == 0
+
+
+def test_archive_model_inserts_by_schedule_time_while_paging(tmp_path):
+    store = SQLiteJobStore(tmp_path / "jobs.db")
+    timekeeper = Timekeeper(tmp_path / "jobs.json", Mock(), store=store)
+    start = datetime(2024, 1, 1)
+
+    def archive(job_id, minutes):
+        schedule_time = (start + timedelta(minutes=minutes)).isoformat()
+        timekeeper.archive_job(
+            job_id, {"task": "sleep", "schedule_time": schedule_time}
+        )
+
+    for index in range(6):
+        archive(f"old{index}", index)
+    model = ArchiveTableModel(timekeeper, page_size=2)
+    timekeeper.events.subscribe(model.apply_event, synchronous=True)
+    assert model.job_ids == ["old5", "old4"]
+
+    archive("middle", 4.5)  # Within the loaded rows
+    archive("older", 1.5)  # Belongs to a page not loaded yet
+    assert model.job_ids == ["old5", "middle", "old4"]
+    while model.canFetchMore():
+        model.fetchMore()
+
+    expected = ["old5", "middle", "old4", "old3", "old2", "older", "old1", "old0"]
+    assert model.job_ids == expected
+    assert model.rowCount() == model.total == 8
+    store.close()
+
+
+def test_relay_delivers_events_on_the_gui_thread(app, timekeeper):
+    model = JobsTableModel(timekeeper)
+    relay = JobEventRelay()
+    relay.jobEvent.connect(model.apply_event)
+    timekeeper.events.subscribe(relay)
+
+    thread = threading.Thread(target=schedule, args=(timekeeper,))
+    thread.start()
+    thread.join()
+    assert timekeeper.events.flush(5)
+    assert model.rowCount() == 0
+
+    app.processEvents()
+    assert model.rowCount() == 1
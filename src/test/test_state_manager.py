@@ -0,0 +1,72 @@
+import json
+import time
+from unittest.mock import patch
+
+from sonaris.frontend.managers.state_manager import StateManager
+
+
+def test_writes_are_coalesced_and_flushed_later(tmp_path):
+    state_file = tmp_path / "state.json"
+    manager = StateManager(json_file=state_file, flush_interval=0.1)
+
+    with patch.object(manager, "save", wraps=manager.save) as save:
+        for index in range(50):
+            manager.update_device_last_alive("DG4202", index + 1)
+        assert manager.get_device_last_alive("DG4202") == 50
+        assert not state_file.exists()
+
+        time.sleep(0.3)
+        assert save.call_count == 1
+    assert json.loads(state_file.read_text()) == {"DG4202_last_alive": 50}
+    assert not state_file.with_name("state.json.tmp").exists()
+
+
+def test_close_flushes_pending_changes(tmp_path):
+    state_file = tmp_path / "state.json"
+    manager = StateManager(json_file=state_file, flush_interval=60)
+    manager.write_state({"key": "value"})
+
+    manager.close()
+
+    assert json.loads(state_file.read_text()) == {"key": "value"}
+    assert StateManager(json_file=state_file).read_state() == {"key": "value"}
+
+
+def test_read_state_returns_a_copy(tmp_path):
+    manager = StateManager(json_file=tmp_path / "state.json")
+    state = manager.read_state()
+    state["key"] = "value"
+
+    assert manager.read_state() == {}
+    manager.close()
+
+
+def test_shared_mode_sees_other_processes(tmp_path):
+    state_file = tmp_path / "state.json"
+    first = StateManager(json_file=state_file, shared=True)
+    second = StateManager(json_file=state_file, shared=True)
+
+    first.write_state({"a": 1})
+    second.write_state({"b": 2})
+
+    assert json.loads(state_file.read_text()) == {"a": 1, "b": 2}
+    assert first.read_state() == {"a": 1, "b": 2}
+
+
+def test_failed_write_is_retried_without_another_update(tmp_path):
+    state_file = tmp_path / "state.json"
+    manager = StateManager(json_file=state_file, flush_interval=0.05)
+    save, attempts = manager.save, []
+
+    def flaky_save(data):
+        attempts.append(data)
+        if len(attempts) == 1:
+            raise OSError("disk full")
+        save(data)
+
+    with patch.object(manager, "save", side_effect=flaky_save):
+        manager.write_state({"key": "value"})
+        time.sleep(0.3)
+
+    assert len(attempts) == 2
+    assert json.loads(state_file.read_text()) == {"key": "value"}
@@ -0,0 +1,91 @@
+import threading
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from sonaris.frontend.managers.edux1002a import EDUX1002AManager
+from sonaris.frontend.managers.state_manager import StateManager
+from sonaris.services.datasource import DataSourceService
+from sonaris.services.stream import decode_frame, encode_frame
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return EDUX1002AManager(
+        StateManager(json_file=tmp_path / "state.json"),
+        args_dict={"hardware_mock": True},
+        resource_manager=Mock(),
+        buffer_size=8,
+    )
+
+
+def frame(points=100, offset=0.0):
+    time_axis = np.linspace(0, 1e-3, points)
+    voltages = np.vstack([np.sin(time_axis * 1e4) + offset, np.cos(time_axis * 1e4)])
+    return time_axis, voltages
+
+
+def test_encode_frame_decimates_to_float32():
+    time_axis, voltages = frame(100)
+    rows = decode_frame(encode_frame(time_axis, voltages, decimation=4))
+
+    assert rows.shape == (3, 25)
+    assert rows.dtype == np.float32
+    np.testing.assert_allclose(rows[1], voltages[0, ::4], rtol=1e-6)
+
+
+def test_websocket_subscribers_share_stored_frames(manager):
+    service = DataSourceService(Mock(), name="test", oscilloscope=manager)
+    client = TestClient(service.app)
+    manager.publish_frame(*frame(offset=1.0))
+    capture = Mock(wraps=manager.acquire)
+    manager.acquire = capture
+
+    with client.websocket_connect("/stream/waveform") as full, client.websocket_connect(
+        "/stream/waveform?decimation=10"
+    ) as coarse:
+        # The last stored frame is sent on connect
+        assert decode_frame(full.receive_bytes()).shape == (3, 100)
+        assert decode_frame(coarse.receive_bytes()).shape == (3, 10)
+        assert len(service.waveforms.subscribers) == 2
+
+        manager.publish_frame(*frame(offset=2.0))
+        rows = decode_frame(full.receive_bytes())
+        assert rows[1, 0] == pytest.approx(2.0)
+        assert decode_frame(coarse.receive_bytes())[1, 0] == pytest.approx(2.0)
+
+    capture.assert_not_called()
+
+
+def test_slow_subscriber_drops_oldest_frames(manager):
+    service = DataSourceService(Mock(), name="test", oscilloscope=manager)
+    loop = Mock()
+    loop.call_soon_threadsafe.side_effect = lambda callback, *args: callback(*args)
+    subscriber = service.waveforms.subscribe(loop, queue_size=2)
+
+    for offset in range(5):
+        manager.publish_frame(*frame(offset=float(offset)))
+
+    assert subscriber.dropped == 3
+    assert subscriber.queue.qsize() == 2
+    assert decode_frame(subscriber.queue.get_nowait())[1, 0] == pytest.approx(3.0)
+
+
+def test_acquire_publishes_every_frame_on_the_acquiring_thread(manager):
+    threads, failing = [], Mock(side_effect=RuntimeError)
+    manager.add_frame_listener(failing)
+    manager.add_frame_listener(
+        lambda time_axis, voltages: threads.append(threading.current_thread())
+    )
+
+    worker = threading.Thread(target=lambda: [manager.acquire() for _ in range(3)])
+    worker.start()
+    worker.join()
+
+    assert threads == [worker] * 3
+    assert failing.call_count == 3
+    assert manager.last_frame is not None
+    # Buffering is left to the thread that owns the buffers
+    assert manager.time_axis is None
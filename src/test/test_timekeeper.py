@@ -0,0 +1,298 @@
+import json
+import time
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from sonaris.scheduler.store import JSONJobStore, SQLiteJobStore
+from sonaris.scheduler.timekeeper import Timekeeper
+from sonaris.scheduler.worker import Worker
+from sonaris.tasks.compiler import compile_experiment
+from sonaris.tasks.model import Experiment
+
+
+def job_info(task="sleep", minutes=10, **kwargs):
+    return {
+        "task": task,
+        "created": datetime.now().isoformat(),
+        "schedule_time": (datetime.now() + timedelta(minutes=minutes)).isoformat(),
+        "kwargs": kwargs,
+    }
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "json":
+        return JSONJobStore(tmp_path / "jobs.json", tmp_path / "archive.json")
+    return SQLiteJobStore(tmp_path / "jobs.db")
+
+
+@pytest.fixture
+def worker():
+    worker = Mock()
+    worker.function_map.function_map = {}
+    worker.__schedule_task__ = Mock()
+    return worker
+
+
+def test_store_roundtrip(store):
+    store.add_jobs({"a": job_info(duration=1), "b": job_info(minutes=20)})
+    assert set(store.load_jobs()) == {"a", "b"}
+    assert store.load_jobs()["a"]["kwargs"] == {"duration": 1}
+
+    store.archive_job("a", {**store.load_jobs()["a"], "result": True})
+    store.remove_job("a")
+
+    assert set(store.load_jobs()) == {"b"}
+    assert store.get_archive()["a"]["result"] is True
+    assert store.get_archived_job("a")["task"] == "sleep"
+    assert store.get_archived_job("b") == {}
+    assert store.count_archive() == 1
+    assert store.get_archive(1, 10) == {}
+
+    store.clear_archive()
+    assert store.get_archive() == {}
+
+
+def test_sqlite_store_uses_wal_and_indexed_lookups(tmp_path):
+    store = SQLiteJobStore(tmp_path / "jobs.db")
+    with store.engine.connect() as connection:
+        mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+    assert mode == "wal"
+
+    store.add_jobs({"a": job_info("sleep", 5), "b": job_info("beep", 15)})
+    assert list(store.find_jobs(task_name="beep")) == ["b"]
+    assert list(store.find_jobs(end=datetime.now() + timedelta(minutes=10))) == ["a"]
+
+
+def test_sqlite_store_migrates_json_once(tmp_path):
+    jobs_file, archive_file = tmp_path / "jobs.json", tmp_path / "archive.json"
+    jobs_file.write_text(json.dumps({"a": job_info()}))
+    archive_file.write_text(json.dumps({"z": {**job_info(), "result": False}}))
+
+    store = SQLiteJobStore(tmp_path / "jobs.db", jobs_file, archive_file)
+
+    assert list(store.load_jobs()) == ["a"]
+    assert list(store.get_archive()) == ["z"]
+    assert not jobs_file.exists() and not archive_file.exists()
+    assert (tmp_path / "jobs.json.migrated").exists()
+
+
+def test_timekeeper_persists_through_store(tmp_path, worker):
+    store = SQLiteJobStore(tmp_path / "jobs.db")
+    timekeeper = Timekeeper(tmp_path / "jobs.json", worker, store=store)
+
+    job_id = timekeeper.add_job(
+        "sleep", datetime.now() + timedelta(minutes=5), kwargs={"duration": 1}
+    )
+    worker.__schedule_task__.assert_called_once()
+    assert job_id in store.load_jobs()
+
+    timekeeper.callback(job_id, False, "Traceback")
+
+    assert store.load_jobs() == {}
+    assert timekeeper.get_archived_job(job_id)["error_info"] == "Traceback"
+    assert not (tmp_path / "jobs.json").exists()
+
+
+def test_get_jobs_returns_a_snapshot(tmp_path, worker):
+    store = SQLiteJobStore(tmp_path / "jobs.db")
+    timekeeper = Timekeeper(tmp_path / "jobs.json", worker, store=store)
+    job_id = timekeeper.add_job(
+        "sleep", datetime.now() + timedelta(minutes=5), kwargs={}
+    )
+
+    jobs = timekeeper.get_jobs()
+    timekeeper.callback(job_id, True)
+
+    assert list(jobs) == [job_id]
+    assert "result" not in jobs[job_id]
+    assert timekeeper.get_jobs() == {}
+
+
+def test_add_jobs_persists_and_schedules_batch(tmp_path, worker):
+    worker.function_map.function_map = {"sleep": ("time", "sleep")}
+    store = SQLiteJobStore(tmp_path / "jobs.db")
+    timekeeper = Timekeeper(tmp_path / "jobs.json", worker, store=store)
+    start = datetime.now() + timedelta(minutes=5)
+
+    job_ids = timekeeper.add_jobs(
+        [
+            {"task_name": "sleep", "schedule_time": start, "kwargs": {"secs": 1}},
+            {"task_name": "sleep", "schedule_time": start, "kwargs": {"secs": 1}},
+        ]
+    )
+
+    assert len(set(job_ids)) == 2
+    assert list(store.load_jobs()) == job_ids
+    assert worker.__schedule_task__.call_count == 2
+
+
+def test_add_jobs_rolls_back_on_failure(tmp_path, worker):
+    worker.function_map.function_map = {"sleep": ("time", "sleep")}
+    worker.__schedule_task__.side_effect = [None, RuntimeError("scheduler down")]
+    store = SQLiteJobStore(tmp_path / "jobs.db")
+    timekeeper = Timekeeper(tmp_path / "jobs.json", worker, store=store)
+    start = datetime.now() + timedelta(minutes=5)
+    batch = [
+        {
+            "task_name": "sleep",
+            "schedule_time": start + timedelta(seconds=i),
+            "kwargs": {},
+        }
+        for i in range(3)
+    ]
+
+    with pytest.raises(RuntimeError):
+        timekeeper.add_jobs(batch)
+    assert worker.remove_scheduled_task.call_count == 1
+    assert timekeeper.get_jobs() == {} and store.load_jobs() == {}
+
+    with pytest.raises(ValueError):
+        timekeeper.add_jobs(batch + [{"task_name": "missing", "schedule_time": start}])
+    assert store.load_jobs() == {}
+
+    # A batch handed to its own executor rolls back the same way
+    schedule = Mock(side_effect=RuntimeError("runner failed"))
+    with pytest.raises(RuntimeError):
+        timekeeper.add_jobs(batch, schedule=schedule)
+    assert len(schedule.call_args.args[0]) == 3
+    assert timekeeper.get_jobs() == {} and store.load_jobs() == {}
+    assert worker.__schedule_task__.call_count == 2
+
+
+executed = []
+
+
+def record_step(step):
+    executed.append(step)
+
+
+def experiment_timekeeper(tmp_path):
+    worker = Worker(function_map={})
+    worker.register_task(record_step, "step")
+    store = SQLiteJobStore(tmp_path / "jobs.db")
+    return Timekeeper(tmp_path / "jobs.json", worker, store=store)
+
+
+def experiment(*delays):
+    return compile_experiment(
+        Experiment(
+            steps=[
+                {"task": "step", "delay": delay, "parameters": {"step": index}}
+                for index, delay in enumerate(delays)
+            ]
+        ),
+        {"step": print},
+    )
+
+
+def test_run_experiment_persists_and_publishes_each_step(tmp_path):
+    executed.clear()
+    timekeeper = experiment_timekeeper(tmp_path)
+    events = []
+    timekeeper.events.subscribe(events.append, synchronous=True)
+
+    run_id = timekeeper.run_experiment(experiment(0.05, 0.06))
+    steps = timekeeper.store.load_jobs()
+    assert [job["experiment"] for job in steps.values()] == [run_id, run_id]
+    timekeeper.get_runner(run_id).join(5)
+
+    assert executed == [0, 1]
+    assert sorted(timekeeper.get_archive()) == sorted(steps)
+    assert timekeeper.get_jobs() == {} and timekeeper.store.load_jobs() == {}
+    for job_id in steps:
+        assert [event.type.value for event in events if event.job_id == job_id] == [
+            "submitted",
+            "scheduled",
+            "started",
+            "succeeded",
+            "archived",
+            "removed",
+        ]
+
+
+def test_cancel_experiment_removes_pending_steps(tmp_path):
+    executed.clear()
+    timekeeper = experiment_timekeeper(tmp_path)
+    run_id = timekeeper.run_experiment(experiment(0, 10, 10))
+    deadline = time.monotonic() + 5
+    while not executed and time.monotonic() < deadline:
+        time.sleep(0.01)
+    events = []
+    timekeeper.events.subscribe(events.append, synchronous=True)
+
+    timekeeper.cancel_experiment(run_id)
+    timekeeper.get_runner(run_id).join(5)
+
+    assert executed == [0]
+    assert timekeeper.get_jobs() == {} and timekeeper.store.load_jobs() == {}
+    assert [event.type.value for event in events].count("cancelled") == 2
+    assert len(timekeeper.get_archive()) == 1
+
+
+def test_experiment_resumes_after_restart(tmp_path):
+    executed.clear()
+    timekeeper = experiment_timekeeper(tmp_path)
+    run_id = timekeeper.run_experiment(experiment(0.2, 0.25))
+    timekeeper.get_runner(run_id).cancel()  # The application stops
+
+    restarted = experiment_timekeeper(tmp_path)
+    restarted.get_runner(run_id).join(5)
+
+    assert executed == [0, 1]
+    assert restarted.get_jobs() == {}
+    assert len(restarted.get_archive()) == 2
+
+
+runs = []
+
+
+def tick(value):
+    runs.append(value)
+    return 1 / (len(runs) % 3)  # Every third run fails
+
+
+@pytest.mark.parametrize("precise", [True, False])
+def test_recurring_job_keeps_single_record(tmp_path, precise):
+    runs.clear()
+    worker = Worker(function_map={}, precise=precise)
+    worker.register_task(tick, "tick")
+    store = SQLiteJobStore(tmp_path / "jobs.db")
+    timekeeper = Timekeeper(tmp_path / "jobs.json", worker, store=store)
+    worker.start_worker()
+
+    job_id = timekeeper.add_recurring_job(
+        "tick",
+        "interval",
+        {"seconds": 0.01, "end_date": datetime.now() + timedelta(seconds=0.25)},
+        kwargs={"value": 1},
+    )
+    assert list(store.load_jobs()) == [job_id]
+    deadline = datetime.now() + timedelta(seconds=3)
+    while job_id in timekeeper.get_jobs() and datetime.now() < deadline:
+        time.sleep(0.02)
+    worker.stop_worker()
+
+    assert store.load_jobs() == {}
+    archived = timekeeper.get_archived_job(job_id)
+    assert archived["runs"] == len(runs) > 10
+    assert archived["failed"] == len(runs) // 3
+    assert archived["result"] is False and "ZeroDivisionError" in archived["error_info"]
+    assert len(archived["results"]) == 10
+    assert list(timekeeper.get_archive()) == [job_id]
+
+
+def test_cancel_recurring_job_archives_history(tmp_path, worker):
+    worker.__schedule_recurring_task__ = Mock()
+    timekeeper = Timekeeper(tmp_path / "jobs.json", worker, archive=tmp_path / "a.json")
+
+    job_id = timekeeper.add_recurring_job("tick", "cron", {"minute": "*/5"}, kwargs={})
+    timekeeper.recurring_callback(job_id, True)
+    timekeeper.recurring_callback(job_id, True)
+    assert timekeeper.store.load_jobs()[job_id]["runs"] == 2
+
+    timekeeper.cancel_job(job_id)
+    assert timekeeper.get_jobs() == {}
+    assert timekeeper.get_archived_job(job_id)["succeeded"] == 2
@@ -0,0 +1,101 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sonaris.scheduler.worker import SHARED_EXECUTOR, Worker
+
+events = []
+lock = threading.Lock()
+
+
+def record(name: str, duration: float = 0.05):
+    with lock:
+        events.append(("start", name, threading.current_thread().name))
+    time.sleep(duration)
+    with lock:
+        events.append(("end", name, threading.current_thread().name))
+
+
+def make_worker():
+    worker = Worker(function_map={})
+    worker.register_tasks(
+        {
+            "DG4202": {"dg_a": record, "dg_b": record},
+            "EDUX1002A": {"scope": record},
+        }
+    )
+    worker.register_task(record, "free")
+    return worker
+
+
+def test_jobs_on_one_device_run_in_order():
+    events.clear()
+    worker = make_worker()
+    futures = [
+        worker.submit_task(task, None, None, (), {"name": f"{task}{i}"})
+        for i, task in enumerate(["dg_a", "dg_b", "dg_a"])
+    ]
+    for future in futures:
+        assert future.result(5) is True
+
+    assert [event[:2] for event in events] == [
+        ("start", "dg_a0"),
+        ("end", "dg_a0"),
+        ("start", "dg_b1"),
+        ("end", "dg_b1"),
+        ("start", "dg_a2"),
+        ("end", "dg_a2"),
+    ]
+    worker.stop_worker()
+
+
+def test_devices_run_in_parallel_and_report_stats():
+    events.clear()
+    worker = make_worker()
+    start = time.monotonic()
+    futures = [
+        worker.submit_task("dg_a", None, None, (), {"name": "dg", "duration": 0.2}),
+        worker.submit_task("scope", None, None, (), {"name": "scope", "duration": 0.2}),
+        worker.submit_task("dg_b", None, None, (), {"name": "dg2", "duration": 0.0}),
+        worker.submit_task("free", None, None, (), {"name": "free", "duration": 0.0}),
+    ]
+    for future in futures:
+        future.result(5)
+
+    assert time.monotonic() - start < 0.35
+    stats = worker.get_queue_stats()
+    assert set(stats) == {"DG4202", "EDUX1002A", SHARED_EXECUTOR}
+    assert stats["DG4202"]["executed"] == 2
+    assert stats["DG4202"]["queued"] == 0
+    # dg_b waited for dg_a to release the instrument
+    assert stats["DG4202"]["max_wait"] >= 0.15
+    assert stats["EDUX1002A"]["max_wait"] < 0.15
+    worker.stop_worker()
+
+
+def slow_first(runs: list):
+    runs.append(None)
+    time.sleep(0.2 if len(runs) == 1 else 0)
+
+
+def test_last_run_goes_to_the_run_that_finishes_last():
+    worker = make_worker()
+    worker.register_task(slow_first, "slow_first")
+    calls = []
+    # The final run finishes while the first one is still going
+    worker.__schedule_recurring_task__(
+        "slow_first",
+        "interval",
+        {"seconds": 0.02, "end_date": datetime.now() + timedelta(seconds=0.05)},
+        "job",
+        lambda job_id, result, error_info, last_run: calls.append(last_run),
+        runs=[],
+    )
+    worker.start_worker()
+    deadline = time.monotonic() + 3
+    while True not in calls and time.monotonic() < deadline:
+        time.sleep(0.01)
+    worker.stop_worker()
+
+    assert calls == [False, True]
+    assert worker.recurring == {}